@@ -1,41 +1,66 @@
+import os
 import pygame
+import shutil
 import sys
+from collections import namedtuple
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 import chess
-from stockfish import Stockfish
+from chess_history import TrackedBoard
+import engine_profile
+from scene import Display, Scene
+import tracing
 
+# 이미지/엔진 경로는 이 파일 기준 (다른 폴더에서 실행해도, 리플레이 워커에서도 찾도록)
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 
-class ChessGUI:
+
+# 화면에 필요한 상태만 담은 불변 스냅샷 (렌더 스레드는 이것만 본다, scene.py의 Display 참고)
+ChessView = namedtuple(
+    "ChessView", "board_fen selected premoves round_timer human_timer ai_timer debuff"
+)
+
+
+class ChessGUI(Scene):
     # === 클래스 상수들 ===
     WINDOW_SIZE = 640
     BOARD_SIZE = 8
     FPS = 60
+    SIZE = (WINDOW_SIZE, WINDOW_SIZE)
+    CAPTION = "Chess Round"
 
     LIGHT_SQ = (240, 217, 181)
     DARK_SQ = (181, 136, 99)
     HIGHLIGHT = (186, 202, 68)
+    PREMOVE_HIGHLIGHT = (90, 140, 220)
     BLACK = (30, 30, 30)
 
     HUMAN_COLOR = chess.WHITE
     AI_COLOR = chess.BLACK
 
-    STOCKFISH_PATH = r"stockfish/stockfish-windows-x86-64-avx2.exe"
+    STOCKFISH_PATH = os.path.join(BASE_DIR, "stockfish", "stockfish-windows-x86-64-avx2.exe")
+    # "python"이면 Stockfish 대신 항상 내장 엔진 (chess_engine.PyEngine)
+    ENGINE = os.environ.get("CHESSBOXING_ENGINE", "stockfish")
+    FALLBACK_MOVE_TIME = 1.0  # 내장 엔진의 수당 탐색 시간(초) — 수당 제한 시간보다 한참 짧게
+    PREMOVE_LIMIT = 4         # AI 턴 동안 예약할 수 있는 사람 수 개수
+
+    _ai_executor = None  # AI 탐색용 스레드 (창은 계속 그리고 클릭도 받도록). 처음 쓸 때 생성, 모든 라운드가 공유
 
     PIECE_IMAGES = {
-        "P": "images/piece/white_pawn.png",
-        "p": "images/piece/black_pawn.png",
-        "R": "images/piece/white_rook.png",
-        "r": "images/piece/black_rook.png",
-        "N": "images/piece/white_knight.png",
-        "n": "images/piece/black_knight.png",
-        "B": "images/piece/white_bishop.png",
-        "b": "images/piece/black_bishop.png",
-        "K": "images/piece/white_king.png",
-        "k": "images/piece/black_king.png",
-        "Q": "images/piece/white_queen.png",
-        "q": "images/piece/black_queen.png",
+        "P": os.path.join(BASE_DIR, "images", "piece", "white_pawn.png"),
+        "p": os.path.join(BASE_DIR, "images", "piece", "black_pawn.png"),
+        "R": os.path.join(BASE_DIR, "images", "piece", "white_rook.png"),
+        "r": os.path.join(BASE_DIR, "images", "piece", "black_rook.png"),
+        "N": os.path.join(BASE_DIR, "images", "piece", "white_knight.png"),
+        "n": os.path.join(BASE_DIR, "images", "piece", "black_knight.png"),
+        "B": os.path.join(BASE_DIR, "images", "piece", "white_bishop.png"),
+        "b": os.path.join(BASE_DIR, "images", "piece", "black_bishop.png"),
+        "K": os.path.join(BASE_DIR, "images", "piece", "white_king.png"),
+        "k": os.path.join(BASE_DIR, "images", "piece", "black_king.png"),
+        "Q": os.path.join(BASE_DIR, "images", "piece", "white_queen.png"),
+        "q": os.path.join(BASE_DIR, "images", "piece", "black_queen.png"),
     }
 
-    def __init__(self, round_time, move_time, debuff=None, board=None):
+    def __init__(self, round_time, move_time, debuff=None, board=None, engine=None, speculator=None):
         """
         round_time: 이번 체스 라운드 전체 제한 시간(초)
         move_time : 한 수당 기본 제한 시간(초)
@@ -48,35 +73,25 @@ class ChessGUI:
                 # 또는 "hide_all_pieces": True 로 모두 ? 처리
             }
         board     : 이어서 진행할 chess.Board (없으면 새 게임 시작)
-        """
-        pygame.init()
-        self.screen = pygame.display.set_mode((self.WINDOW_SIZE, self.WINDOW_SIZE))
-        pygame.display.set_caption("Chess Round")
-        self.clock = pygame.time.Clock()
-
-        self.sq_size = self.WINDOW_SIZE // self.BOARD_SIZE
+        engine    : 미리 띄워둔 Stockfish (없으면 여기서 새로 생성, False면 엔진 없이 — 리플레이 렌더링용)
+        speculator: speculation.Speculator (있으면 사람이 고민하는 동안 AI 응수를 미리 계산)
 
-        # 말 이미지 로드
+        화면/이미지/폰트는 Display에 올라갈 때(attach) 공유 캐시에서 가져온다.
+        """
+        self.sq_size = self.WINDOW_SIZE // self.BOARD_SIZE  # attach에서 창 크기에 맞게 다시 잡음
         self.piece_surfaces = {}
-        for sym, path in self.PIECE_IMAGES.items():
-            img = pygame.image.load(path).convert_alpha()
-            img = pygame.transform.smoothscale(img, (self.sq_size, self.sq_size))
-            self.piece_surfaces[sym] = img
-
-        # 폰트 (기물 '?'용, HUD용)
-        self.piece_font = pygame.font.SysFont("consolas", 28, bold=True)
-        self.hud_font = pygame.font.SysFont("malgungothic", 20)
+        self.piece_font = None
+        self.hud_font = None
+        self._blind_overlay = None  # 시야 가림 반투명 Surface (크기가 바뀔 때만 다시 만듦)
+        self._board_layer = None    # 칸/말/하이라이트/시야 가림까지 그려둔 보드 Surface
+        self._board_key = None      # _board_layer를 그릴 때의 상태 (바뀌면 다시 그림)
 
         # 체스 보드 (이어하기 지원)
-        self.board = board if board is not None else chess.Board()
+        self.board = board if board is not None else TrackedBoard()
 
-        # Stockfish 엔진
-        self.engine = Stockfish(
-            path=self.STOCKFISH_PATH,
-            depth=12,
-            parameters={"Threads": 2, "Hash": 256},
-        )
-        self.engine.set_depth(10)
+        # Stockfish 엔진 (Future면 첫 AI 수 직전에 받는다 → 엔진 기동을 기다리지 않고 바로 화면)
+        self._engine = engine if engine is not None else self.create_engine()
+        self.speculator = speculator
 
         # 디버프 설정
         self.debuff = debuff or {}
@@ -92,14 +107,96 @@ class ChessGUI:
         self.ai_move_time_limit = move_time
 
         self.selected_square = None  # (col, row) or None
+        self.premoves = []           # AI 턴 동안 예약한 사람 수 [chess.Move] (AI 수가 들어오는 즉시 검증/적용)
+        self.premove_stats = {"played": 0, "dropped": 0}
+        self._legal = None           # 지금 포지션의 합법수 집합 (수를 둘 때마다 무효화)
+        self._ai_job = None          # 진행 중인 AI 탐색 Future[uci]
+        self.on_ply = None           # 수를 둘 때마다 호출할 콜백 (체크포인트 등)
+        self.ply_clock = []          # 수마다 둔 직후 라운드 남은 시간 (리플레이용)
+
+        # 타이머 (update에서 감소)
+        self.round_timer = self.round_time_limit
+        self.human_move_timer = self.human_move_time_limit
+        self.ai_move_timer = self.ai_move_time_limit
+        self.result = None
+
+    @property
+    def engine(self):
+        if isinstance(self._engine, Future):
+            self._engine = self._engine.result()
+        return self._engine
+
+    @classmethod
+    @tracing.traced("engine_start", "engine")
+    def create_engine(cls, profile="interactive"):
+        """
+        engine_profile.py --autotune으로 만든 이 컴퓨터용 설정 (없으면 Threads 2 / Hash 256 / depth 10).
+        Stockfish 실행 파일을 못 띄우면 (리눅스에서 .exe 경로 등) 내장 파이썬 엔진으로 대신한다.
+        """
+        config = engine_profile.load(profile)
+        if cls.ENGINE != "python":
+            if shutil.which(cls.STOCKFISH_PATH) is None:
+                print(f"Stockfish 실행 파일이 없습니다 ({cls.STOCKFISH_PATH}) → 내장 엔진 사용")
+            else:
+                from chess_engine import StockfishEngine
+                try:
+                    return StockfishEngine(
+                        path=cls.STOCKFISH_PATH,
+                        depth=config["depth"],
+                        parameters=engine_profile.engine_parameters(config),
+                    )
+                except OSError as e:  # 다른 OS용 실행 파일 등
+                    print(f"Stockfish를 실행할 수 없습니다 ({cls.STOCKFISH_PATH}: {e}) → 내장 엔진 사용")
+        from chess_engine import PyEngine
+        return PyEngine(
+            depth=config["depth"],
+            move_time=cls.FALLBACK_MOVE_TIME,
+            parameters=engine_profile.engine_parameters(config),
+        )
+
+    @staticmethod
+    @tracing.traced("engine_warm", "engine")
+    def warm_engine(engine, board):
+        """다음 라운드 시작 포지션을 미리 탐색해서 엔진 해시를 채워둔다."""
+        if board is None or board.is_game_over():
+            return engine
+        engine.set_fen_position(board.fen())
+        engine.get_best_move()
+        return engine
+
+    @classmethod
+    def preload(cls, assets):
+        size = (cls.WINDOW_SIZE // cls.BOARD_SIZE,) * 2
+        for path in cls.PIECE_IMAGES.values():
+            assets.prefetch_image(path, size)
+        assets.font("consolas", 28, bold=True)
+        assets.font("malgungothic", 20)
+
+    def attach(self, display, surface):
+        super().attach(display, surface)
+        assets = display.assets
+        self.sq_size = max(1, min(surface.get_size()) // self.BOARD_SIZE)
+        self._blind_overlay = None
+        self._board_layer = None
+
+        # 말 이미지 (Display 캐시에서 크기마다 한 번만 로드/스케일)
+        size = (self.sq_size, self.sq_size)
+        self.piece_surfaces = {sym: assets.image(path, size) for sym, path in self.PIECE_IMAGES.items()}
+
+        # 폰트 (기물 '?'용, HUD용) — 지금 배율 크기로
+        self.piece_font = assets.font("consolas", max(1, self.px(28)), bold=True)
+        self.hud_font = assets.font("malgungothic", max(1, self.px(20)))
 
     # -----------------------------
     # 유틸 함수들
     # -----------------------------
     def square_from_mouse(self, pos):
+        """클릭 위치 -> (col, row). 영역이 8칸으로 딱 나눠지지 않아 남는 가장자리 띠는 None"""
         x, y = pos
         col = x // self.sq_size
         row = y // self.sq_size
+        if not (0 <= col < 8 and 0 <= row < 8):
+            return None
         return col, row
 
     def square_to_uci(self, col, row):
@@ -110,111 +207,240 @@ class ChessGUI:
     def is_human_turn(self):
         return self.board.turn == self.HUMAN_COLOR
 
-    def make_ai_move(self):
-        if self.board.is_game_over():
-            return
-        self.engine.set_fen_position(self.board.fen())
-        best_move_uci = self.engine.get_best_move()
+    def legal_moves(self):
+        """지금 포지션의 합법수 집합 (포지션마다 한 번만 생성)"""
+        if self._legal is None:
+            self._legal = set(self.board.legal_moves)
+        return self._legal
+
+    @tracing.traced("engine_move", "engine")
+    def think_ai_move(self, board):
+        """AI 스레드에서: 사람이 둔 수를 예측해 뒀으면 미리 계산한 응수, 아니면 엔진 탐색 → uci"""
+        best_move_uci = self.speculator.take(board) if self.speculator is not None else None
         if best_move_uci is None:
+            engine = self._engine
+            engine.set_fen_position(board.fen())
+            best_move_uci = engine.get_best_move()
+        return best_move_uci
+
+    def start_ai_move(self):
+        """
+        AI 탐색을 백그라운드로 시작. 그동안에도 프레임은 돌아가서 AI 수당 타이머가 줄고
+        사람은 프리무브를 예약할 수 있다.
+        """
+        if isinstance(self._engine, Future) and not self._engine.done():
+            # 엔진이 아직 기동 중이면 여기서 대기 (타이머엔 안 넣음)
+            if self.clock is not None:
+                self.clock.pause()
+            try:
+                self.engine
+            finally:
+                if self.clock is not None:
+                    self.clock.resume()
+        engine = self.engine
+        if ChessGUI._ai_executor is None:
+            ChessGUI._ai_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ai-move")
+        self._ai_job = ChessGUI._ai_executor.submit(self.think_ai_move, self.board.copy(stack=False))
+        return engine
+
+    def poll_ai_move(self):
+        """AI 탐색이 끝났으면 수를 두고, 예약된 프리무브를 같은 프레임에 바로 적용"""
+        job = self._ai_job
+        if job is None or not job.done():
+            return
+        self._ai_job = None
+        best_move_uci = job.result()
+        if best_move_uci is None or self.result is not None:
             return
         move = chess.Move.from_uci(best_move_uci)
-        if move in self.board.legal_moves:
-            self.board.push(move)
+        if move not in self.legal_moves():
+            return
+        self.board.push(move)
+        self.after_push()
+        self.ai_move_timer = self.ai_move_time_limit
+        if self.finish_if_game_over():
+            return
+        self.play_premove()
+
+    def cancel_ai_move(self):
+        """라운드가 끝났는데 AI가 아직 고민 중이면 탐색을 끊고 끝날 때까지 기다린다 (엔진은 다음 라운드에서 재사용)"""
+        job, self._ai_job = self._ai_job, None
+        if job is None:
+            return
+        engine = self._engine
+        if isinstance(engine, Future):
+            wait([job])
+            return
+        if not job.done():
+            engine.stop()  # 아직 탐색 전이어도 시작하자마자 끊긴다 (chess_engine.SearchStop)
+        wait([job])
+        engine.reset_stop()  # 추측 적중 등으로 탐색 없이 끝났으면 남은 stop을 버린다
+
+    def play_premove(self):
+        """예약된 첫 프리무브가 지금 합법이면 바로 둔다 (사람 고민 시간 0). 아니면 예약 전체 취소"""
+        if not self.premoves:
+            return
+        move = self.premoves.pop(0)
+        if move in self.legal_moves():
+            self.premove_stats["played"] += 1
+            self.push_human_move(move)
+        else:
+            self.premove_stats["dropped"] += 1 + len(self.premoves)
+            self.premoves.clear()
+
+    def push_human_move(self, move):
+        self.board.push(move)
+        self.after_push()
+        self.selected_square = None
+        # 사람 수를 두었으니 사람 move timer 리셋
+        self.human_move_timer = self.human_move_time_limit
+
+        # 게임 종료 체크
+        self.finish_if_game_over()
+
+    def after_push(self):
+        self._legal = None
+        self.ply_clock.append(round(self.round_timer, 2))
+        if self.on_ply is not None:
+            self.on_ply(self)
 
     # -----------------------------
     # 그리기 관련
     # -----------------------------
-    def draw_board(self):
+    def view(self):
+        return ChessView(
+            board_fen=self.board.board_fen(),
+            selected=self.selected_square,
+            premoves=tuple(self.premoves),
+            round_timer=self.round_timer,
+            human_timer=self.human_move_timer,
+            ai_timer=self.ai_move_timer,
+            debuff=self.debuff,  # 라운드 동안 바뀌지 않음
+        )
+
+    def draw_board(self, view):
+        """
+        보드는 Surface 하나에 미리 그려두고 포지션/선택/프리무브가 바뀔 때만 다시 그린다
+        (해상도가 커져도 프레임마다는 불투명 blit 한 번)
+        """
+        key = (view.board_fen, view.selected, view.premoves)
+        if self._board_layer is None or key != self._board_key:
+            self._board_key = key
+            self.render_board_layer(view)
+        self.screen.blit(self._board_layer, (0, 0))
+
+    def render_board_layer(self, view):
+        board = chess.BaseBoard(view.board_fen)
+        board_px = self.sq_size * self.BOARD_SIZE
+        layer = self._board_layer
+        if layer is None:
+            layer = self._board_layer = pygame.Surface((board_px, board_px)).convert()
+        border = max(1, self.px(4))
+        premove_squares = set()
+        for move in view.premoves:
+            for sq in (move.from_square, move.to_square):
+                premove_squares.add((chess.square_file(sq), 7 - chess.square_rank(sq)))
         for row in range(8):
             for col in range(8):
                 color = self.LIGHT_SQ if (row + col) % 2 == 0 else self.DARK_SQ
                 rect = pygame.Rect(
                     col * self.sq_size, row * self.sq_size, self.sq_size, self.sq_size
                 )
-                pygame.draw.rect(self.screen, color, rect)
+                pygame.draw.rect(layer, color, rect)
 
                 # 선택된 칸 하이라이트
-                if self.selected_square is not None:
-                    sel_c, sel_r = self.selected_square
+                if view.selected is not None:
+                    sel_c, sel_r = view.selected
                     if sel_c == col and sel_r == row:
-                        pygame.draw.rect(self.screen, self.HIGHLIGHT, rect, 4)
+                        pygame.draw.rect(layer, self.HIGHLIGHT, rect, border)
+                if (col, row) in premove_squares:
+                    pygame.draw.rect(layer, self.PREMOVE_HIGHLIGHT, rect, border)
 
                 # 해당 칸의 기물
                 square_index = chess.square(col, 7 - row)
-                piece = self.board.piece_at(square_index)
+                piece = board.piece_at(square_index)
                 if not piece:
                     continue
 
                 symbol = piece.symbol()  # 'P','p',...
                 # 디버프: 말 물음표 처리
-                hide_all = self.debuff.get("hide_all_pieces", False)
-                hide_enemy = self.debuff.get("hide_enemy_pieces", False)
+                hide_all = view.debuff.get("hide_all_pieces", False)
+                hide_enemy = view.debuff.get("hide_enemy_pieces", False)
 
                 if hide_all or (hide_enemy and piece.color != self.HUMAN_COLOR):
                     # '?' 문자로 표시
                     text_surf = self.piece_font.render("?", True, (0, 0, 0))
                     text_rect = text_surf.get_rect(center=rect.center)
-                    self.screen.blit(text_surf, text_rect)
+                    layer.blit(text_surf, text_rect)
                 else:
                     img = self.piece_surfaces.get(symbol)
                     if img:
-                        self.screen.blit(img, rect)
+                        layer.blit(img, rect)
 
         # 디버프: 시야 일부 가리기 (overlay)
-        self.apply_vision_debuff()
+        self.apply_vision_debuff(layer, view.debuff)
 
-    def apply_vision_debuff(self):
+    def apply_vision_debuff(self, surface, debuff):
         """
         blind_side 디버프 적용:
         - 'left'  : 왼쪽 절반 가림
         - 'right' : 오른쪽 절반 가림
         """
-        side = self.debuff.get("blind_side", None)
+        side = debuff.get("blind_side", None)
         if side not in ("left", "right"):
             return
 
-        overlay = pygame.Surface((self.WINDOW_SIZE // 2, self.WINDOW_SIZE), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 150))  # 반투명 검은색
+        board_px = self.sq_size * self.BOARD_SIZE
+        overlay = self._blind_overlay
+        if overlay is None:
+            overlay = self._blind_overlay = pygame.Surface((board_px // 2, board_px), pygame.SRCALPHA)
+            overlay.fill((0, 0, 0, 150))  # 반투명 검은색
 
         if side == "left":
-            self.screen.blit(overlay, (0, 0))
+            surface.blit(overlay, (0, 0))
         else:  # right
-            self.screen.blit(overlay, (self.WINDOW_SIZE // 2, 0))
+            surface.blit(overlay, (board_px // 2, 0))
 
-    def draw_hud(self, round_timer, human_timer, ai_timer):
+    def draw_hud(self, view):
         # 남은 시간 텍스트
-        round_txt = self.hud_font.render(f"라운드 남은 시간: {round_timer:5.1f}s", True, (255, 255, 255))
-        human_txt = self.hud_font.render(f"플레이어 수당: {human_timer:4.1f}s", True, (255, 255, 255))
-        ai_txt = self.hud_font.render(f"AI 수당: {ai_timer:4.1f}s", True, (255, 255, 255))
+        round_txt = self.hud_font.render(f"라운드 남은 시간: {view.round_timer:5.1f}s", True, (255, 255, 255))
+        human_txt = self.hud_font.render(f"플레이어 수당: {view.human_timer:4.1f}s", True, (255, 255, 255))
+        ai_txt = self.hud_font.render(f"AI 수당: {view.ai_timer:4.1f}s", True, (255, 255, 255))
+        if view.premoves:
+            premove_txt = self.hud_font.render(f"프리무브 {len(view.premoves)}", True, self.PREMOVE_HIGHLIGHT)
+            self.screen.blit(premove_txt, (self.px(10), self.px(80)))
 
-        self.screen.blit(round_txt, (10, 5))
-        self.screen.blit(human_txt, (10, 30))
-        self.screen.blit(ai_txt, (10, 55))
+        self.screen.blit(round_txt, (self.px(10), self.px(5)))
+        self.screen.blit(human_txt, (self.px(10), self.px(30)))
+        self.screen.blit(ai_txt, (self.px(10), self.px(55)))
 
         # 활성 디버프 표시
+        debuff = view.debuff
         debuff_msgs = []
-        if self.debuff.get("move_time_factor", 1.0) < 1.0:
+        if debuff.get("move_time_factor", 1.0) < 1.0:
             debuff_msgs.append("수당 시간 감소")
-        if self.debuff.get("blind_side"):
-            side = "좌측" if self.debuff["blind_side"] == "left" else "우측"
+        if debuff.get("blind_side"):
+            side = "좌측" if debuff["blind_side"] == "left" else "우측"
             debuff_msgs.append(f"{side} 시야 가림")
-        if self.debuff.get("hide_enemy_pieces"):
+        if debuff.get("hide_enemy_pieces"):
             debuff_msgs.append("상대 말 ? 처리")
-        if self.debuff.get("hide_all_pieces"):
+        if debuff.get("hide_all_pieces"):
             debuff_msgs.append("모든 말 ? 처리")
 
         if debuff_msgs:
             text = "디버프: " + ", ".join(debuff_msgs)
             debuff_txt = self.hud_font.render(text, True, (255, 200, 0))
-            self.screen.blit(debuff_txt, (10, self.WINDOW_SIZE - 30))
+            self.screen.blit(debuff_txt, (self.px(10), self.screen.get_height() - self.px(30)))
 
     # -----------------------------
     # 메인 루프
     # -----------------------------
-    def run(self):
+    def run(self, display=None, capture=None):
         """
         체스 라운드를 진행하고 끝나면 dict로 결과 반환.
         언제 끝나든 현재 self.board를 함께 돌려줌.
+        display를 주면 그 창에서, 없으면 새 창을 만들어서 진행.
+        capture(capture.FrameCapture)를 주면 이 라운드 프레임을 공유 메모리 링으로 내보냄.
 
         반환 예:
         {
@@ -222,144 +448,199 @@ class ChessGUI:
             "result": "timeout_white" | "timeout_black"
                       | "checkmate_or_draw" | "round_timeout",
             "winner": "white" | "black" | None,
-            "board": self.board
+            "board": self.board,
+            "clock": [수마다 둔 직후 라운드 남은 시간, ...]
         }
         """
-        running = True
-
-        # 타이머 초기값
-        round_timer = self.round_time_limit
-        human_move_timer = self.human_move_time_limit
-        ai_move_timer = self.ai_move_time_limit
-
-        while running:
-            dt = self.clock.tick(self.FPS) / 1000.0
-
-            # --- 턴에 따른 타이머 감소 ---
-            # 라운드 전체 시간은 항상 줄어듦
-            round_timer -= dt
-
-            if self.board.turn == self.HUMAN_COLOR:
-                human_move_timer -= dt
-                # ⛔ 사람 수당 초 초과 → 즉시 인간 패배
-                if human_move_timer <= 0:
-                    return {
-                        "game_over": True,
-                        "result": "timeout_white",
-                        "winner": "black",
-                        "board": self.board,
-                    }
-            else:
-                ai_move_timer -= dt
-                # ⛔ AI 수당 초 초과 → 즉시 AI 패배
-                if ai_move_timer <= 0:
-                    return {
-                        "game_over": True,
-                        "result": "timeout_black",
-                        "winner": "white",
-                        "board": self.board,
-                    }
-
-            # 라운드 전체 시간 초과 → 라운드만 종료 (체스 승패 X)
-            if round_timer <= 0:
-                return {
-                    "game_over": False,
-                    "result": "round_timeout",
-                    "winner": None,
-                    "board": self.board,
-                }
-
-            # 이벤트 처리
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    pygame.quit()
-                    sys.exit()
-
-                if (
-                    event.type == pygame.MOUSEBUTTONDOWN
-                    and event.button == 1
-                    and self.is_human_turn()
-                    and not self.board.is_game_over()
-                ):
-                    col, row = self.square_from_mouse(event.pos)
-
-                    if self.selected_square is None:
-                        # 첫 클릭: 말 선택
-                        sq = chess.square(col, 7 - row)
-                        piece = self.board.piece_at(sq)
-                        if piece and piece.color == self.HUMAN_COLOR:
-                            self.selected_square = (col, row)
-                    else:
-                        # 두 번째 클릭: 이동 시도
-                        src_c, src_r = self.selected_square
-                        dst_c, dst_r = col, row
-
-                        src_uci = self.square_to_uci(src_c, src_r)
-                        dst_uci = self.square_to_uci(dst_c, dst_r)
-
-                        src_sq = chess.square(src_c, 7 - src_r)
-                        piece = self.board.piece_at(src_sq)
-                        move = None
-
-                        # 프로모션 처리
-                        if piece and piece.piece_type == chess.PAWN:
-                            if (
-                                piece.color == chess.WHITE
-                                and dst_r == 0
-                            ) or (
-                                piece.color == chess.BLACK
-                                and dst_r == 7
-                            ):
-                                move = chess.Move.from_uci(src_uci + dst_uci + "q")
-
-                        if move is None:
-                            move = chess.Move.from_uci(src_uci + dst_uci)
-
-                        if move in self.board.legal_moves:
-                            self.board.push(move)
-                            self.selected_square = None
-                            # 사람 수를 두었으니 사람 move timer 리셋
-                            human_move_timer = self.human_move_time_limit
-
-                            # 게임 종료 체크
-                            if self.board.is_game_over():
-                                outcome = self.board.outcome()
-                                winner = None
-                                if outcome.winner is True:
-                                    winner = "white"
-                                elif outcome.winner is False:
-                                    winner = "black"
-                                return {
-                                    "game_over": True,
-                                    "result": "checkmate_or_draw",
-                                    "winner": winner,
-                                    "board": self.board,
-                                }
-                        else:
-                            # 불법수 → 선택 해제
-                            self.selected_square = None
-
-            # AI 턴 처리
-            if (not self.is_human_turn()) and (not self.board.is_game_over()):
-                self.make_ai_move()
-                ai_move_timer = self.ai_move_time_limit
-
-                if self.board.is_game_over():
-                    outcome = self.board.outcome()
-                    winner = None
-                    if outcome.winner is True:
-                        winner = "white"
-                    elif outcome.winner is False:
-                        winner = "black"
-                    return {
-                        "game_over": True,
-                        "result": "checkmate_or_draw",
-                        "winner": winner,
-                        "board": self.board,
-                    }
-
-            # 그리기
-            self.screen.fill(self.BLACK)
-            self.draw_board()
-            self.draw_hud(round_timer, human_move_timer, ai_move_timer)
-            pygame.display.flip()
+        if display is None:
+            display = Display(self.SIZE, self.CAPTION)
+        if capture is None:
+            return display.run(self)
+        prev, display.capture = display.capture, capture
+        try:
+            return display.run(self)
+        finally:
+            display.capture = prev
+
+    def finish(self, game_over, result, winner):
+        if self.speculator is not None:
+            self.speculator.cancel()
+        self.cancel_ai_move()
+        self.premoves.clear()
+        self.result = {
+            "game_over": game_over,
+            "result": result,
+            "winner": winner,
+            "board": self.board,
+            "clock": self.ply_clock,
+        }
+
+    def finish_if_game_over(self):
+        """체크메이트/무승부면 결과 기록 후 True"""
+        if not self.board.is_game_over():
+            return False
+        outcome = self.board.outcome()
+        winner = None
+        if outcome.winner is True:
+            winner = "white"
+        elif outcome.winner is False:
+            winner = "black"
+        self.finish(True, "checkmate_or_draw", winner)
+        return True
+
+    def step(self, dt):
+        """고정 스텝마다 (또는 엔진 고민 시간만큼) 타이머 감소 + 시간 초과 판정"""
+        if self.result is not None:
+            return
+        # --- 턴에 따른 타이머 감소 ---
+        # 라운드 전체 시간은 항상 줄어듦
+        self.round_timer -= dt
+
+        if self.board.turn == self.HUMAN_COLOR:
+            self.human_move_timer -= dt
+            # ⛔ 사람 수당 초 초과 → 즉시 인간 패배
+            if self.human_move_timer <= 0:
+                self.finish(True, "timeout_white", "black")
+                return
+        else:
+            self.ai_move_timer -= dt
+            # ⛔ AI 수당 초 초과 → 즉시 AI 패배
+            if self.ai_move_timer <= 0:
+                self.finish(True, "timeout_black", "white")
+                return
+
+        # 라운드 전체 시간 초과 → 라운드만 종료 (체스 승패 X)
+        if self.round_timer <= 0:
+            self.finish(False, "round_timeout", None)
+
+    def update(self, dt, events):
+        # 이벤트 처리
+        for event in events:
+            if event.type == pygame.QUIT:
+                pygame.quit()
+                sys.exit()
+
+            if event.type != pygame.MOUSEBUTTONDOWN or self.board.is_game_over():
+                continue
+            if self.is_human_turn():
+                if event.button == 1:
+                    self.handle_click(event.pos)
+                    if self.result is not None:
+                        return
+            elif event.button == 1:
+                # AI 턴: 클릭은 프리무브 예약
+                self.handle_premove_click(event.pos)
+            elif event.button == 3:
+                # 오른쪽 클릭: 예약 전부 취소
+                self.premoves.clear()
+                self.selected_square = None
+
+        # AI 턴 처리 (탐색은 백그라운드, 끝나면 수를 두고 프리무브까지 같은 프레임에)
+        if (not self.is_human_turn()) and (not self.board.is_game_over()):
+            if self._ai_job is None:
+                self.start_ai_move()
+            self.poll_ai_move()
+            if self.result is not None:
+                return
+
+        # 사람 턴 시작 → 응수 추측 탐색 (턴마다 한 번)
+        if (
+            self.speculator is not None
+            and self.result is None
+            and self.is_human_turn()
+            and not self.speculator.active
+        ):
+            self.speculator.start(self.board)
+
+    def handle_click(self, pos):
+        square = self.square_from_mouse(pos)
+        if square is None:
+            return
+        col, row = square
+
+        if self.selected_square is None:
+            # 첫 클릭: 말 선택
+            sq = chess.square(col, 7 - row)
+            piece = self.board.piece_at(sq)
+            if piece and piece.color == self.HUMAN_COLOR:
+                self.selected_square = (col, row)
+            return
+
+        # 두 번째 클릭: 이동 시도 (같은 칸이면 선택 해제)
+        src_c, src_r = self.selected_square
+        dst_c, dst_r = col, row
+        if (src_c, src_r) == (dst_c, dst_r):
+            self.selected_square = None
+            return
+
+        src_uci = self.square_to_uci(src_c, src_r)
+        dst_uci = self.square_to_uci(dst_c, dst_r)
+
+        src_sq = chess.square(src_c, 7 - src_r)
+        piece = self.board.piece_at(src_sq)
+        move = None
+
+        # 프로모션 처리
+        if piece and piece.piece_type == chess.PAWN:
+            if (
+                piece.color == chess.WHITE
+                and dst_r == 0
+            ) or (
+                piece.color == chess.BLACK
+                and dst_r == 7
+            ):
+                move = chess.Move.from_uci(src_uci + dst_uci + "q")
+
+        if move is None:
+            move = chess.Move.from_uci(src_uci + dst_uci)
+
+        if move in self.legal_moves():
+            self.push_human_move(move)
+        else:
+            # 불법수 → 선택 해제
+            self.selected_square = None
+
+    def premove_board(self):
+        """예약한 프리무브를 합법성 검사 없이 말만 옮겨 둔 보드 (다음 예약의 출발 칸 선택용)"""
+        board = self.board.copy(stack=False)
+        for move in self.premoves:
+            piece = board.remove_piece_at(move.from_square)
+            if piece is not None:
+                if move.promotion:
+                    piece = chess.Piece(move.promotion, piece.color)
+                board.set_piece_at(move.to_square, piece)
+        return board
+
+    def handle_premove_click(self, pos):
+        """AI 턴 클릭: 첫 클릭은 내 말 선택, 두 번째 클릭은 목적지 → 예약 (검증은 AI 수가 들어온 뒤)"""
+        square = self.square_from_mouse(pos)
+        if square is None:
+            return
+        col, row = square
+        sq = chess.square(col, 7 - row)
+        board = self.premove_board()
+
+        if self.selected_square is None:
+            piece = board.piece_at(sq)
+            if piece and piece.color == self.HUMAN_COLOR and len(self.premoves) < self.PREMOVE_LIMIT:
+                self.selected_square = (col, row)
+            return
+
+        src_c, src_r = self.selected_square
+        self.selected_square = None
+        src_sq = chess.square(src_c, 7 - src_r)
+        if src_sq == sq:
+            return
+        piece = board.piece_at(src_sq)
+        promotion = None
+        if piece and piece.piece_type == chess.PAWN and chess.square_rank(sq) in (0, 7):
+            promotion = chess.QUEEN
+        self.premoves.append(chess.Move(src_sq, sq, promotion))
+
+    def render(self, view):
+        self.screen.fill(self.BLACK)
+        self.draw_board(view)
+        self.draw_hud(view)
+
+    def draw(self):
+        self.render(self.view())
@@ -1,12 +1,14 @@
 from enum import Enum
+from collections import namedtuple
+from functools import partial
 import random
 import heapq
 
+import tracing
+
 
 class BoxingGame:
     PLAYER_BASIC_HEALTH = 3
-    NOW_GAME = None        # 전역에서 현재 게임 인스턴스 참조
-    _cc_order = 0          # 상태 스케줄용 전역 우선순위 카운터
 
     FIELD_MIN_X = -5
     FIELD_MAX_X = 5
@@ -36,11 +38,12 @@ class BoxingGame:
             self.combi_buff = False
             self.counter_on = None  # Counter 카드 인스턴스 or None
             self._queue = []        # (turn, order, fn)
+            self._order = 0         # 같은 턴 이벤트의 예약 순서 (플레이어마다 따로 → 전역 카운터가 안 자람)
 
         def schedule(self, turn, fn):
             """turn 턴 시작 시점에 fn을 실행한다."""
-            BoxingGame._cc_order += 1
-            heapq.heappush(self._queue, (turn, BoxingGame._cc_order, fn))
+            self._order += 1
+            heapq.heappush(self._queue, (turn, self._order, fn))
 
         def update(self, current_turn):
             """해당 턴 시작 시점에 실행할 상태 이벤트 처리"""
@@ -48,6 +51,39 @@ class BoxingGame:
                 _, _, fn = heapq.heappop(self._queue)
                 fn()
 
+        def snapshot(self):
+            """상태를 plain data로 (카운터 대기는 턴 안에서만 존재하므로 저장하지 않음)"""
+            return {
+                "guarded": self.guarded,
+                "stunned": self.stunned,
+                "fixed": self.fixed,
+                "combi_buff": self.combi_buff,
+                # 예약 이벤트는 전부 partial(setattr, cc, attr, value)
+                "queue": [[turn, order, fn.args[1], fn.args[2]] for turn, order, fn in self._queue],
+            }
+
+        def restore(self, state):
+            for attr in ("guarded", "stunned", "fixed", "combi_buff"):
+                setattr(self, attr, state[attr])
+            self.counter_on = None
+            self._queue = [
+                (turn, order, partial(setattr, self, attr, value))
+                for turn, order, attr, value in state["queue"]
+            ]
+            heapq.heapify(self._queue)
+            self._order = max([0] + [q[1] for q in self._queue])
+
+        def apply(self, turn, attr, delay, turns):
+            """
+            상태 attr(예: "stunned")을 turn+delay 턴에 켜고 turns 턴 뒤에 끈다.
+            delay가 0이면 지금 바로 켠다.
+            """
+            if delay:
+                self.schedule(turn + delay, partial(setattr, self, attr, True))
+            else:
+                setattr(self, attr, True)
+            self.schedule(turn + delay + turns, partial(setattr, self, attr, False))
+
     # -------------------------
     #       액션 컨텍스트
     # -------------------------
@@ -59,19 +95,106 @@ class BoxingGame:
             self.direction = direction  # -1 or 1
             self.damage = damage_map    # dict: {player: int}
 
+    # -------------------------
+    #      카드 정의 테이블
+    # -------------------------
+    # range         : 사거리 (None이면 공간 판정 없음)
+    # move          : 이동 거리
+    # status        : 적용할 ControlM 속성 이름 ("counter_on"은 카운터 대기)
+    # status_on     : "self" 또는 "target" (target이면 적중 시에만 적용)
+    # status_delay  : 몇 턴 뒤부터 적용할지 (0 = 즉시)
+    # status_turns  : 지속 턴 수
+    CardSpec = namedtuple(
+        "CardSpec",
+        "name type range damage move ignore_guard ignore_counter "
+        "status status_on status_delay status_turns special",
+        defaults=(None, 0, 0, False, False, None, "self", 0, 0, False),
+    )
+
+    CARD_TABLE = (
+        # 기본 카드
+        CardSpec("Jab", Type.Attack, range=1, damage=1),                  # 데미지 1, 사거리 1
+        CardSpec("Step", Type.Move, move=1),                              # 거리 1 이동
+        CardSpec("Guard", Type.Util, status="guarded", status_turns=1),   # 이번 턴동안 공격 스킬 무시
+        # 스페셜 카드
+        CardSpec("Straight", Type.Attack, range=1, damage=2, special=True),
+        CardSpec("Counter", Type.Util, status="counter_on", special=True),
+        CardSpec("Hook", Type.Attack, range=1, damage=1,                  # 가드/카운터 무시
+                 ignore_guard=True, ignore_counter=True, special=True),
+        CardSpec("Pound", Type.Util, range=1,                             # 적중 시 상대 다음 턴 이동 불가
+                 ignore_guard=True, ignore_counter=True,
+                 status="fixed", status_on="target", status_delay=1, status_turns=1, special=True),
+        CardSpec("Footwork", Type.Move, move=2, special=True),            # 한번에 2칸 이동
+        CardSpec("Combi", Type.Move, move=1,                              # 이동 + 다음 턴 추가타 버프
+                 status="combi_buff", status_delay=1, status_turns=1, special=True),
+        CardSpec("Uppercut", Type.Attack, range=0, damage=1, special=True),
+        CardSpec("Kick", Type.Attack, range=2, damage=1, special=True),
+    )
+
+    class CompiledCards:
+        """
+        CARD_TABLE을 정수 카드 id 기반 튜플 룩업으로 컴파일한 결과.
+        - 카드 인스턴스는 cid만 들고 있고, 판정은 전부 여기 테이블에서 찾는다 (game.cards).
+        - rel = (target.x - player.x) * direction  (바라보는 방향 기준 상대 거리)
+        - 필드 크기마다 따로 컴파일 (BoxingGame.cards_for)
+        """
+        def __init__(self, table, field_min, field_max):
+            span = field_max - field_min
+            self.specs = tuple(table)
+            self.ids = {s.name: cid for cid, s in enumerate(table)}
+            self.field_min = field_min
+            self.span = span
+
+            self.order = tuple(s.type.value for s in table)  # Move → Util → Attack
+            self.is_move = tuple(s.type is BoxingGame.Type.Move for s in table)
+            self.damage = tuple(s.damage for s in table)
+            self.move = tuple(s.move for s in table)
+            self.guard_check = tuple(not s.ignore_guard for s in table)
+            # 상대가 카운터 대기 중이면 바로 카운터 당하는 카드
+            self.counter_check = tuple(
+                s.type is BoxingGame.Type.Attack and not s.ignore_counter for s in table
+            )
+            self.status = tuple(s.status for s in table)
+            self.status_on_target = tuple(s.status_on == "target" for s in table)
+            self.status_delay = tuple(s.status_delay for s in table)
+            self.status_turns = tuple(s.status_turns for s in table)
+            # GUI 타겟 표시용: 이동 카드는 이동 거리, 나머지는 사거리
+            self.reach = tuple(s.move if s.move else s.range for s in table)
+
+            # hits[cid][rel + span] -> 적중 여부
+            self.hits = tuple(
+                tuple(s.range is not None and rel == s.range for rel in range(-span, span + 1))
+                for s in table
+            )
+            # move_to[cid][direction > 0][x - field_min] -> 이동 후 x (필드 경계 고정)
+            self.move_to = tuple(
+                tuple(
+                    tuple(min(field_max, max(field_min, x + d * s.move))
+                          for x in range(field_min, field_max + 1))
+                    for d in (-1, 1)
+                )
+                for s in table
+            )
+
     # -------------------------
     #         카드 베이스
     # -------------------------
     class Card:
-        def __init__(self, card_type, name=None):
-            self.type = card_type
-            self.name = name or self.__class__.__name__
+        """카드 인스턴스. 실제 효과는 CARDS 테이블의 cid 항목으로 결정된다."""
+        cid = None  # compile_cards()에서 카드 클래스마다 채워짐
+
+        def __init__(self):
+            spec = BoxingGame.CARDS.specs[self.cid]
+            self.type = spec.type
+            self.name = spec.name
+            self.owner = None       # 상태를 건 플레이어 (Counter 등)
+            self.triggered = False  # Counter: 한 번만 발동
 
         def act(self, ctx: "BoxingGame.ActionContext"):
             """
             공통 처리:
             - 스턴이면 아무것도 안 함
-            - 공격 카드라면 먼저 '상대 카운터' 체크
+            - 카운터 대상 공격 카드라면 먼저 '상대 카운터' 체크
             - Combi 버프 추가타 처리 (공격판정 X, 가드/카운터 무시)
             - 그 이후 실제 효과(resolve)
             """
@@ -84,10 +207,7 @@ class BoxingGame:
                 return
 
             # 2. 공격 카드 + 상대가 Counter 켜둔 상태면 → 즉시 카운터 발동
-            if (
-                    self.type == BoxingGame.Type.Attack
-                    and isinstance(t.cc.counter_on, BoxingGame.Counter)
-            ):
+            if ctx.game.cards.counter_check[self.cid] and t.cc.counter_on is not None:
                 # 내 공격은 전부 씹히고, Counter 쪽에서 반격/스턴 처리
                 t.cc.counter_on.on_countered_attack(attacker=p, ctx=ctx)
                 return
@@ -101,329 +221,302 @@ class BoxingGame:
             self.resolve(ctx)
 
         def resolve(self, ctx: "BoxingGame.ActionContext"):
-            """각 카드에서 오버라이드해서 사용"""
-            pass
-
-        # 공격 카드에서 쓸 공통 로직
-        def apply_attack(self, ctx, range_, damage, ignore_guard=False, ignore_counter=False):
+            """테이블에 정의된 효과 적용: 적중/데미지 → 이동 → 상태이상"""
+            cards = ctx.game.cards
+            cid = self.cid
             p = ctx.player
             t = ctx.target
             d = ctx.direction
 
-            # 사거리 체크
-            if p.x + d * range_ != t.x:
-                return
+            # 사거리 + 가드 체크 (데미지는 턴 끝에서 한 번에)
+            hit = cards.hits[cid][(t.x - p.x) * d + cards.span]
+            if hit and cards.guard_check[cid] and t.cc.guarded:
+                hit = False
+            if hit:
+                ctx.damage[t] += cards.damage[cid]
 
-            # 카운터 체크
-            if (not ignore_counter) and isinstance(t.cc.counter_on, BoxingGame.Counter):
-                t.cc.counter_on.on_countered_attack(attacker=p, ctx=ctx)
-                return
+            # 이동 파트 (fixed면 이동 불가)
+            if cards.move[cid] and not p.cc.fixed:
+                p.x = cards.move_to[cid][d > 0][p.x - cards.field_min]
 
-            # 가드 체크
-            if (not ignore_guard) and t.cc.guarded:
+            status = cards.status[cid]
+            if status is None:
                 return
-
-            # 데미지 기록 (실제 HP 감소는 턴 끝에서 한 번에)
-            ctx.damage[t] += damage
-
-    # -------------------------
-    #     기본 카드들
-    # -------------------------
-    class Jab(Card):        # 데미지 1, 사거리 1
-        def __init__(self):
-            super().__init__(BoxingGame.Type.Attack)
-
-        def resolve(self, ctx):
-            self.apply_attack(ctx, range_=1, damage=1)
-
-    class Step(Card):       # 거리 1 이동
-        def __init__(self):
-            super().__init__(BoxingGame.Type.Move)
-
-        def resolve(self, ctx):
-            p = ctx.player
-            d = ctx.direction
-            if not p.cc.fixed:
-                p.x += d * 1
-                BoxingGame.clamp_pos(p)
-
-    class Guard(Card):      # 이번 턴동안 공격 스킬 무시
-        def __init__(self):
-            super().__init__(BoxingGame.Type.Util)
-            self._owner = None
-
-        def resolve(self, ctx):
-            game = ctx.game
-            p = ctx.player
-            self._owner = p
-            p.cc.guarded = True
-
-            # 다음 턴 시작 시 가드 해제
-            def clear_guard():
-                self._owner.cc.guarded = False
-
-            p.cc.schedule(game.turn + 1, clear_guard)
-
-    # -------------------------
-    #     스페셜 카드들
-    # -------------------------
-    class Straight(Card):  # 데미지 2, 사거리 1
-        def __init__(self):
-            super().__init__(BoxingGame.Type.Attack)
-
-        def resolve(self, ctx):
-            self.apply_attack(ctx, range_=1, damage=2)
-
-    class Counter(Card):   # 카운터
-        def __init__(self):
-            super().__init__(BoxingGame.Type.Util)
-            self.owner = None
-            self.triggered = False  # 한 번만 발동
-
-        def resolve(self, ctx):
-            p = ctx.player
-            self.owner = p
-            p.cc.counter_on = self  # 이번 턴 동안 카운터 대기
-
+            if status == "counter_on":
+                # 이번 턴 동안 카운터 대기
+                self.owner = p
+                p.cc.counter_on = self
+            elif cards.status_on_target[cid]:
+                if hit:
+                    t.cc.apply(ctx.game.turn, status, cards.status_delay[cid], cards.status_turns[cid])
+            else:
+                self.owner = p
+                p.cc.apply(ctx.game.turn, status, cards.status_delay[cid], cards.status_turns[cid])
+
+        # -------- Counter 전용 --------
         def on_countered_attack(self, attacker, ctx):
             """카운터가 공격을 받아쳤을 때"""
             if self.triggered:
                 return
             self.triggered = True
 
-            game = ctx.game
-
             # 반격 데미지 1
             ctx.damage[attacker] += 1
 
             # 공격자: 다음 턴 행동 불가 (stun), 그 다음 턴에 해제
-            def set_stun():
-                attacker.cc.stunned = True
-
-            def clear_stun():
-                attacker.cc.stunned = False
-
-            attacker.cc.schedule(game.turn + 1, set_stun)
-            attacker.cc.schedule(game.turn + 2, clear_stun)
+            attacker.cc.apply(ctx.game.turn, "stunned", 1, 1)
 
             # 카운터 종료
             if self.owner.cc.counter_on is self:
                 self.owner.cc.counter_on = None
 
-        def fail(self):
-            """그 턴 동안 공격을 받아치지 못하고 끝난 경우"""
+        def fail(self, game):
+            """그 턴 동안 공격을 받아치지 못하고 끝난 경우 (game = 턴을 해소 중인 게임)"""
             if self.triggered:
                 return
             owner = self.owner
-            game = BoxingGame.NOW_GAME
-            if owner is None or game is None:
+            if owner is None:
                 return
 
             # 자신 다음 턴 stun, 그 다음 턴에 해제
-            def set_stun():
-                owner.cc.stunned = True
-
-            def clear_stun():
-                owner.cc.stunned = False
-
-            owner.cc.schedule(game.turn + 1, set_stun)
-            owner.cc.schedule(game.turn + 2, clear_stun)
+            owner.cc.apply(game.turn, "stunned", 1, 1)
 
             # 카운터 종료
             if owner.cc.counter_on is self:
                 owner.cc.counter_on = None
 
-    class Hook(Card):     # 가드/카운터 무시, 데미지 1, 사거리 1
-        def __init__(self):
-            super().__init__(BoxingGame.Type.Attack)
-
-        def resolve(self, ctx):
-            # guard/counter 무시
-            self.apply_attack(ctx, range_=1, damage=1, ignore_guard=True, ignore_counter=True)
-
-    class Pound(Card):    # 데미지 없음, 사거리 1, 적중 시 상대 다음 턴 이동 스킬 사용 불가
-        def __init__(self):
-            super().__init__(BoxingGame.Type.Util)
-
-        def resolve(self, ctx):
-            game = ctx.game
-            p = ctx.player
-            t = ctx.target
-            d = ctx.direction
-
-            if p.x + d * 1 != t.x:
-                return
-
-            # 다음 턴 고정 상태 fixed=True, 다다음 턴에 해제
-            def set_fixed():
-                t.cc.fixed = True
-
-            def clear_fixed():
-                t.cc.fixed = False
-
-            t.cc.schedule(game.turn + 1, set_fixed)
-            t.cc.schedule(game.turn + 2, clear_fixed)
-
-    class Footwork(Card): # 한번에 2칸 이동
-        def __init__(self):
-            super().__init__(BoxingGame.Type.Move)
+    # CARD_TABLE에서 채워지는 카드 목록 (compile_cards 참고)
+    BASIC_CARD_LIST = []
+    SPECIAL_CARD_LIST = []
+    CARDS = None
+    _compiled = {}  # (field_min, field_max) -> CompiledCards
+
+    @classmethod
+    def compile_cards(cls):
+        """
+        CARD_TABLE을 컴파일해서 CARDS 룩업과 카드 클래스(BoxingGame.Jab 등)를 만든다.
+        필드 크기(FIELD_MIN_X/MAX_X)를 바꾼 뒤에는 다시 호출해야 한다.
+        """
+        cls._compiled = {}
+        cls.CARDS = cls.cards_for(cls.FIELD_MIN_X, cls.FIELD_MAX_X)
+        for cid, spec in enumerate(cls.CARD_TABLE):
+            card_cls = cls.__dict__.get(spec.name)
+            if card_cls is None:
+                card_cls = type(spec.name, (cls.Card,), {"__qualname__": f"BoxingGame.{spec.name}"})
+                setattr(cls, spec.name, card_cls)
+            card_cls.cid = cid
+        cls.BASIC_CARD_LIST = [getattr(cls, s.name) for s in cls.CARD_TABLE if not s.special]
+        cls.SPECIAL_CARD_LIST = [getattr(cls, s.name) for s in cls.CARD_TABLE if s.special]
+
+    @classmethod
+    def cards_for(cls, field_min, field_max):
+        """필드 [field_min, field_max]용 룩업 (필드 크기마다 한 번만 컴파일)"""
+        cards = cls._compiled.get((field_min, field_max))
+        if cards is None:
+            cards = cls._compiled[field_min, field_max] = cls.CompiledCards(cls.CARD_TABLE, field_min, field_max)
+        return cards
 
-        def resolve(self, ctx):
-            p = ctx.player
-            d = ctx.direction
-            if not p.cc.fixed:
-                p.x += d * 2
-                BoxingGame.clamp_pos(p)
-
-    class Combi(Card):   # 앞으로 한칸 이동, 다음 턴에 사거리1 추가 공격 버프(공격 판정 X)
-        def __init__(self):
-            super().__init__(BoxingGame.Type.Move)
-            self.owner = None
-
-        def resolve(self, ctx):
-            game = ctx.game
-            p = ctx.player
-            d = ctx.direction
-            self.owner = p
-
-            # 다음 턴에 combi_buff ON, 다다음 턴에 OFF
-            def enable_buff():
-                p.cc.combi_buff = True
-
-            def disable_buff():
-                p.cc.combi_buff = False
-
-            p.cc.schedule(game.turn + 1, enable_buff)
-            p.cc.schedule(game.turn + 2, disable_buff)
-
-            # 이동 파트 (fixed면 이동 불가)
-            if not p.cc.fixed:
-                p.x += d * 1
-                BoxingGame.clamp_pos(p)
-
-    class Uppercut(Card): # 사거리 0, 데미지 1
-        def __init__(self):
-            super().__init__(BoxingGame.Type.Attack)
-
-        def resolve(self, ctx):
-            self.apply_attack(ctx, range_=0, damage=1)
-
-    class Kick(Card):    # 사거리 2, 데미지 1
-        def __init__(self):
-            super().__init__(BoxingGame.Type.Attack)
-
-        def resolve(self, ctx):
-            self.apply_attack(ctx, range_=2, damage=1)
-
-    # 스페셜 카드 풀
-    SPECIAL_CARD_LIST = [Straight, Counter, Hook, Pound, Footwork, Combi, Uppercut, Kick]
+    @staticmethod
+    def target_x(player, card, direction):
+        """카드가 이번 턴에 노리는 칸 x (공간 효과 없는 카드는 None)"""
+        reach = BoxingGame.CARDS.reach[card.cid]
+        if reach is None:
+            return None
+        return player.x + direction * reach
 
     # -------------------------
     #       AI & 액션
     # -------------------------
     class AI:
-        pass  # 지금은 랜덤 선택만 Pygame 쪽에서 처리
+        """
+        AI 정책 베이스. choose()로 이번 턴에 낼 (카드, 방향)을 고른다.
+        기본 정책: 손패에서 랜덤 카드, 방향은 상대 쪽 (box_runner.py에 다른 봇들)
+        """
+        def __init__(self, rng=None):
+            self.rng = rng or random
+
+        def choose(self, game, player, target):
+            rng = self.rng
+            cards = player.basic_cards + player.special_cards
+            if not cards:
+                # 손패가 비어 있으면 임시 Jab
+                return BoxingGame.Jab(), rng.choice([-1, 1])
+
+            card = rng.choice(cards)
+            if target.x < player.x:
+                direction = -1
+            elif target.x > player.x:
+                direction = 1
+            else:
+                direction = rng.choice([-1, 1])
+            return card, direction
 
     class Action:
-        def __init__(self, player, card, direction):
+        def __init__(self, player, card, direction, target=None):
             self.player = player
             self.card = card
             self.direction = direction   # -1 or 1
-            # 대상은 "나 아닌 다른 플레이어"
-            self.target = BoxingGame.NOW_GAME.p1 if player == BoxingGame.NOW_GAME.p2 else BoxingGame.NOW_GAME.p2
+            # 대상: 지정 안 하면 턴을 해소하는 게임이 정한다 (1:1은 상대 선수, BoxingGame.opponent)
+            # 난투는 targeting 규칙이 고른 상대를 넘긴다
+            self.target = target
 
     # -------------------------
     #         플레이어
     # -------------------------
     class Player:
         PLAYER_LOC = (-1, 1)
-        PLAYER_NUM = 0
 
-        def __init__(self, control=None):
+        def __init__(self, control=None, x=None, num=0):
             self.basic_cards = []
             self.special_cards = []
             self.ai = control
             self.hp = BoxingGame.PLAYER_BASIC_HEALTH
-            self.num = BoxingGame.Player.PLAYER_NUM
-            self.x = BoxingGame.Player.PLAYER_LOC[self.num]
-            BoxingGame.Player.PLAYER_NUM += 1
+            self.num = num  # 게임 안에서의 번호 (게임이 0부터 매긴다)
+            # 시작 위치: 1:1은 PLAYER_LOC, 난투는 게임이 지정
+            self.start_x = BoxingGame.Player.PLAYER_LOC[num] if x is None else x
+            self.x = self.start_x
             self.cc = BoxingGame.ControlM()
 
-        def setup(self):
-            self.x = BoxingGame.Player.PLAYER_LOC[self.num]
-            self.basic_cards = [
-                BoxingGame.Jab(),
-                BoxingGame.Step(),
-                BoxingGame.Guard()
-            ]
+        def setup(self, rng=random):
+            self.x = self.start_x
+            self.basic_cards = [cls() for cls in BoxingGame.BASIC_CARD_LIST]
             # 랜덤 2장 스페셜
-            self.special_cards = [cls() for cls in random.sample(BoxingGame.SPECIAL_CARD_LIST, BoxingGame.SPECIAL_CARD_NUM)]
+            self.special_cards = [cls() for cls in rng.sample(BoxingGame.SPECIAL_CARD_LIST, BoxingGame.SPECIAL_CARD_NUM)]
+
+        def snapshot(self):
+            return {
+                "hp": self.hp,
+                "x": self.x,
+                "basic_cards": [c.name for c in self.basic_cards],
+                "special_cards": [c.name for c in self.special_cards],
+                "cc": self.cc.snapshot(),
+            }
+
+        def restore(self, state):
+            self.hp = state["hp"]
+            self.x = state["x"]
+            self.basic_cards = [getattr(BoxingGame, name)() for name in state["basic_cards"]]
+            self.special_cards = [getattr(BoxingGame, name)() for name in state["special_cards"]]
+            self.cc.restore(state["cc"])
+
+        def use_card(self, card):
+            """낸 카드를 손패에서 소모 (손패에 없는 임시 카드면 무시)"""
+            if card in self.basic_cards:
+                self.basic_cards.remove(card)
+            elif card in self.special_cards:
+                self.special_cards.remove(card)
 
         def refill(self):
             """기본 카드가 다 쓰이면 다시 3장 세트로 리필"""
             if not self.basic_cards:
-                self.basic_cards = [
-                    BoxingGame.Jab(),
-                    BoxingGame.Step(),
-                    BoxingGame.Guard()
-                ]
+                self.basic_cards = [cls() for cls in BoxingGame.BASIC_CARD_LIST]
 
     # -------------------------
     #          게임 본체
     # -------------------------
-    def __init__(self):
-        self.p1 = BoxingGame.Player()
-        self.p2 = BoxingGame.Player(BoxingGame.AI())
+    def __init__(self, rng=None):
+        self.rng = rng or random  # 카드 분배용 (시드 고정하려면 random.Random 전달)
+        self.p1 = BoxingGame.Player(num=0)
+        self.p2 = BoxingGame.Player(BoxingGame.AI(), num=1)
         self.turn = 0
         self.game_over = False
         self.winner = None  # 'P1', 'P2', None(무승부)
-        BoxingGame.NOW_GAME = self
+        self.actions = []   # 해소된 턴마다 (P1 카드, P1 방향, P2 카드, P2 방향) — 리플레이용
+        self.cards = BoxingGame.CARDS
+
+    @property
+    def fighters(self):
+        """이번 턴에 행동하는 선수들"""
+        return (self.p1, self.p2)
+
+    def opponent(self, player):
+        """대상을 지정하지 않은 Action의 대상 (1:1이라 나 아닌 쪽)"""
+        return self.p1 if player is self.p2 else self.p2
 
     def setup(self):
-        self.p1.setup()
-        self.p2.setup()
+        self.p1.setup(self.rng)
+        self.p2.setup(self.rng)
+
+    def snapshot(self):
+        """턴 사이 게임 상태 전체를 JSON으로 저장 가능한 dict로"""
+        return {
+            "turn": self.turn,
+            "game_over": self.game_over,
+            "winner": self.winner,
+            "p1": self.p1.snapshot(),
+            "p2": self.p2.snapshot(),
+        }
+
+    @classmethod
+    def from_snapshot(cls, state, rng=None):
+        game = cls(rng)
+        game.turn = state["turn"]
+        game.game_over = state["game_over"]
+        game.winner = state["winner"]
+        game.p1.restore(state["p1"])
+        game.p2.restore(state["p2"])
+        return game
 
     def resolve_turn(self, act1: "BoxingGame.Action", act2: "BoxingGame.Action"):
         if self.game_over:
             return
-
+        self.actions.append((act1.card.name, act1.direction, act2.card.name, act2.direction))
+        self.resolve_actions([act1, act2])
+
+    @tracing.traced("resolve_turn", "boxing")
+    def resolve_actions(self, actions):
+        """
+        한 턴의 액션 전부를 동시에 해소 (선수 수 무관).
+        이동 → 유틸 → 공격 순서로 수행하고 데미지는 턴 끝에 한꺼번에 적용.
+        """
         # 턴 증가
         self.turn += 1
+        fighters = self.fighters
 
         # 턴 시작: 상태 업데이트 + 기본카드 리필
-        for pl in [self.p1, self.p2]:
+        for pl in fighters:
             pl.cc.update(self.turn)
             pl.refill()
 
         # 공격 데미지 동시 적용을 위해 누적
-        damage = {self.p1: 0, self.p2: 0}
+        damage = dict.fromkeys(fighters, 0)
 
         # 액션 우선순위 정렬 (Move → Util → Attack)
-        actions = [act1, act2]
-        actions.sort(key=lambda a: a.card.type.value)
+        order = self.cards.order
+        actions = sorted(actions, key=lambda a: order[a.card.cid])
 
         # 각 액션 수행 (데미지는 damage dict에만 누적)
         for action in actions:
+            player = action.player
+            x = player.x
             ctx = BoxingGame.ActionContext(
                 game=self,
-                player=action.player,
-                target=action.target,
+                player=player,
+                target=action.target if action.target is not None else self.opponent(player),
                 direction=action.direction,
                 damage_map=damage
             )
             action.card.act(ctx)
+            if player.x != x:
+                self.on_move(player, x)
 
         # 카운터 실패 처리 (이 턴 동안 한 번도 트리거 안 된 경우)
-        for pl in [self.p1, self.p2]:
+        for pl in fighters:
             c = pl.cc.counter_on
-            if isinstance(c, BoxingGame.Counter) and not c.triggered:
-                c.fail()
+            if c is not None and not c.triggered:
+                c.fail(self)
 
         # 누적된 데미지를 동시에 적용
-        self.p1.hp -= damage[self.p1]
-        self.p2.hp -= damage[self.p2]
+        for pl, dmg in damage.items():
+            pl.hp -= dmg
+
+        self.judge()
+
+    def on_move(self, player, old_x):
+        """선수가 old_x에서 player.x로 이동했을 때 (난투는 위치 인덱스 갱신)"""
 
-        # 승패 판정
+    def judge(self):
+        """승패 판정"""
         if self.p1.hp <= 0 and self.p2.hp <= 0:
             self.game_over = True
             self.winner = None  # 무승부
@@ -433,3 +526,6 @@ class BoxingGame:
         elif self.p2.hp <= 0:
             self.game_over = True
             self.winner = "P1"
+
+
+BoxingGame.compile_cards()
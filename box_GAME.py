@@ -1,30 +1,56 @@
 # boxing_gui.py
+from collections import namedtuple
+
 import pygame
-import random
 from pygame.locals import *
 from box2 import BoxingGame
+from scene import Display, Scene
+
+# 화면에 필요한 상태만 담은 불변 스냅샷 (렌더 스레드는 이것만 본다, scene.py의 Display 참고)
+# hand = (기본 카드 이름들, 스페셜 카드 이름들, P1 fixed 여부)
+FighterView = namedtuple("FighterView", "x hp status")
+BoxingView = namedtuple(
+    "BoxingView",
+    "hand p1 p2 p1_dir p2_dir p1_target p2_target selected_card selected_dir message game_over",
+)
 
 
-class BoxingGUI:
+class BoxingGUI(Scene):
     WIDTH = 900
     HEIGHT = 600
+    SIZE = (WIDTH, HEIGHT)
+    FPS = 60
+    CAPTION = "BoxingGame - Pygame Prototype"
     TILE_SIZE = 60
     MIN_X = -5
     MAX_X = 5
 
-    def __init__(self):
-        # pygame 관련 필드
+    # 버튼 레이아웃
+    CARD_X_START = 50
+    BTN_W, BTN_H = 120, 30
+    BTN_GAP = 10
+    DIR_BTN_W, DIR_BTN_H = 50, 30
+    HIT_CELL = 10  # 클릭 히트 테스트용 격자 크기(px)
+
+    def __init__(self, game=None):
+        """game: 이어서 진행할 BoxingGame (체크포인트 복구 등). 없으면 새로 딜링"""
+        # pygame 관련 필드 (attach에서 채움)
         self.screen = None
-        self.clock = None
         self.font = None
+        self.result = None
+        self.on_turn = None  # 턴이 해소될 때마다 호출할 콜백 (체크포인트 등)
 
         # 게임 로직
-        self.game = BoxingGame()
-        self.game.setup()
+        if game is None:
+            game = BoxingGame()
+            game.setup()
+        self.game = game
 
-        # 좌표계
-        self.center_x = self.WIDTH // 2
-        self.y_line = self.HEIGHT // 2
+        # 좌표계 (attach에서 실제 영역 크기로 다시 잡음)
+        self.width, self.height = self.WIDTH, self.HEIGHT
+        self.tile = self.TILE_SIZE
+        self.center_x = self.width // 2
+        self.y_line = self.height // 2
 
         # UI 상태
         self.selected_card = None  # (from_list, index, card_obj)
@@ -36,30 +62,161 @@ class BoxingGUI:
         self.last_p1_target_x = None
         self.last_p2_target_x = None
 
+        # 레이아웃 캐시 (손패가 바뀔 때만 다시 계산)
+        self._layout_key = None
+        self.card_btns = []        # (from_list, idx, rect, card)
+        self.dir_btns = []         # (direction, rect)
+        self.hit_map = {}          # (cell_x, cell_y) -> ("dir", d) | ("card", from_list, idx, card)
+        self._static_layer = None  # 타일/숫자/버튼이 그려진 정적 레이어 Surface (그리는 쪽 전용)
+        self._static_key = None    # _static_layer를 그릴 때의 손패 (view.hand)
+
+    @classmethod
+    def preload(cls, assets):
+        assets.font("malgungothic", 20)
+
+    def attach(self, display, surface):
+        super().attach(display, surface)
+        self.font = display.assets.font("malgungothic", max(1, self.px(20)))
+        # 레이아웃은 영역 크기에서 유도 → 크기가 바뀌면 버튼/정적 레이어를 다시 만든다
+        self.width, self.height = surface.get_size()
+        self.tile = self.px(self.TILE_SIZE)
+        self.center_x = self.width // 2
+        self.y_line = self.height // 2
+        self._layout_key = None
+        self._static_key = None
+        self._static_layer = None
+
     # ---------------------------
     # 좌표/유틸 함수
     # ---------------------------
     def x_to_pixel(self, x: int) -> int:
         """1D 필드 좌표 -> 화면 픽셀 x(타일 중앙 기준)"""
-        return self.center_x + x * self.TILE_SIZE
+        return self.center_x + x * self.tile
 
     def compute_target_x(self, player, card, direction):
         """
         이 카드가 이번 턴에 '어느 칸'을 노리는지 계산해서 x좌표(int)를 돌려준다.
-        - 이동 카드: distance 사용
-        - 공격/유틸 카드: range 사용
+        - 이동 카드: 이동 거리, 공격/유틸 카드: 사거리 (BoxingGame.CARD_TABLE 기준)
         - 아무 공간효과 없으면 None
         """
-        dist = getattr(card, "distance", 0)
-        if dist:
-            return player.x + direction * dist
-
-        rng = getattr(card, "range", 0)
-        if rng:
-            return player.x + direction * rng
+        return BoxingGame.target_x(player, card, direction)
 
+    # ---------------------------
+    # 레이아웃 캐시
+    # ---------------------------
+    def hand_key(self):
+        """레이아웃에 영향을 주는 상태 (P1 손패 + fixed 여부)"""
+        p1 = self.game.p1
+        return tuple(p1.basic_cards), tuple(p1.special_cards), p1.cc.fixed
+
+    def ensure_layout(self):
+        """손패가 바뀌었을 때만 버튼 rect/히트맵을 다시 만든다 (입력 처리 쪽)"""
+        key = self.hand_key()
+        if key == self._layout_key:
+            return
+        self._layout_key = key
+        self.build_layout()
+
+    def card_rects(self, n_basic, n_special):
+        """손패 장수 → [(from_list, idx, rect)] (입력 처리와 그리기가 같은 배치를 쓰도록)"""
+        px = self.px
+        btn_w, btn_h = px(self.BTN_W), px(self.BTN_H)
+        rects = []
+        for from_list, y, n in (("basic", self.height - px(200), n_basic),
+                                ("special", self.height - px(160), n_special)):
+            for i in range(n):
+                x = px(self.CARD_X_START + i * (self.BTN_W + self.BTN_GAP))
+                rects.append((from_list, i, pygame.Rect(x, y, btn_w, btn_h)))
+        return rects
+
+    def dir_rects(self):
+        px = self.px
+        dir_y = self.height - px(80)
+        dir_w, dir_h = px(self.DIR_BTN_W), px(self.DIR_BTN_H)
+        return [
+            (-1, pygame.Rect(px(50), dir_y, dir_w, dir_h)),
+            (1, pygame.Rect(px(150), dir_y, dir_w, dir_h)),
+        ]
+
+    def build_layout(self):
+        p1 = self.game.p1
+        hands = {"basic": p1.basic_cards, "special": p1.special_cards}
+        self.card_btns = [
+            (from_list, i, rect, hands[from_list][i])
+            for from_list, i, rect in self.card_rects(len(p1.basic_cards), len(p1.special_cards))
+        ]
+        self.dir_btns = self.dir_rects()
+
+        # 버튼이 덮는 격자 칸마다 버튼을 등록 → 클릭은 dict 조회 한 번으로 처리
+        self.hit_map = {}
+        targets = [(rect, ("dir", d)) for d, rect in self.dir_btns]
+        targets += [(rect, ("card", f, i, c)) for f, i, rect, c in self.card_btns]
+        cell = self.HIT_CELL
+        for rect, target in targets:
+            for cx in range(rect.left // cell, (rect.right - 1) // cell + 1):
+                for cy in range(rect.top // cell, (rect.bottom - 1) // cell + 1):
+                    self.hit_map.setdefault((cx, cy), []).append((rect, target))
+
+    def hit_test(self, pos):
+        """클릭 위치의 버튼 대상 (없으면 None)"""
+        mx, my = pos
+        for rect, target in self.hit_map.get((mx // self.HIT_CELL, my // self.HIT_CELL), ()):
+            if rect.collidepoint(mx, my):
+                return target
         return None
 
+    def render_static_layer(self, hand):
+        """바닥 타일, 칸 번호, 카드/방향 버튼을 Surface 하나에 미리 그려둔다 (hand = view.hand)"""
+        font = self.font
+        px = self.px
+        tile = self.tile
+        layer = pygame.Surface((self.width, self.height)).convert()
+        layer.fill((30, 30, 30))
+
+        # 타일 바닥
+        for tx in range(self.MIN_X, self.MAX_X + 1):
+            cx = self.x_to_pixel(tx)
+            rect = pygame.Rect(
+                cx - tile // 2,
+                self.y_line - tile // 2,
+                tile,
+                tile,
+            )
+            pygame.draw.rect(layer, (60, 60, 60), rect)
+            pygame.draw.rect(layer, (120, 120, 120), rect, max(1, px(2)))
+
+            num_txt = font.render(str(tx), True, (180, 180, 180))
+            layer.blit(
+                num_txt,
+                (rect.x + tile // 2 - px(8), rect.y + tile // 2 - px(10)),
+            )
+
+        # 카드 버튼 (fixed 상태면 이동 카드 회색 처리)
+        basic, special, fixed = hand
+        names = {"basic": basic, "special": special}
+        cards = BoxingGame.CARDS
+        for from_list, i, rect in self.card_rects(len(basic), len(special)):
+            name = names[from_list][i]
+            is_move = cards.is_move[cards.ids[name]]
+            if from_list == "basic":
+                color, dim_color, dim_text = (60, 60, 60), (40, 40, 40), (120, 120, 120)
+            else:
+                color, dim_color, dim_text = (80, 60, 80), (50, 40, 50), (150, 150, 150)
+            text_color = (255, 255, 255)
+            if fixed and is_move:
+                color, text_color = dim_color, dim_text
+            pygame.draw.rect(layer, color, rect)
+            txt = font.render(name, True, text_color)
+            layer.blit(txt, (rect.x + px(5), rect.y + px(5)))
+
+        # 방향 버튼
+        for d, rect in self.dir_rects():
+            pygame.draw.rect(layer, (80, 80, 80), rect)
+            txt = font.render("<" if d == -1 else ">", True, (255, 255, 255))
+            layer.blit(txt, (rect.x + px(15), rect.y + px(5)))
+
+        self._static_layer = layer
+
     # ---------------------------
     # 그리기 관련
     # ---------------------------
@@ -71,8 +228,8 @@ class BoxingGUI:
             return
 
         tile_center_x = self.x_to_pixel(target_x)
-        tile_w = self.TILE_SIZE
-        tile_h = 50
+        tile_w = self.tile
+        tile_h = self.px(50)
 
         rect = pygame.Rect(
             tile_center_x - tile_w // 2,
@@ -80,12 +237,12 @@ class BoxingGUI:
             tile_w,
             tile_h,
         )
-        pygame.draw.rect(self.screen, color, rect, 3)
+        pygame.draw.rect(self.screen, color, rect, max(1, self.px(3)))
 
     def draw_direction_arrow(self, x, y, direction, color):
         if direction is None:
             return
-        size = 12
+        size = self.px(12)
 
         if direction == -1:  # 왼쪽
             points = [
@@ -101,142 +258,115 @@ class BoxingGUI:
             ]
         pygame.draw.polygon(self.screen, color, points)
 
-    def draw_status(self, player, x, y):
-        s = []
-        if player.cc.stunned:
-            s.append("STUN")
-        if player.cc.guarded:
-            s.append("G")
-        if player.cc.fixed:
-            s.append("FIX")
-        if player.cc.combi_buff:
-            s.append("CMB")
-        if player.cc.counter_on:
-            s.append("CTR")
-        if s:
-            txt = self.font.render(",".join(s), True, (255, 255, 0))
-            self.screen.blit(txt, (x - 30, y))
+    @staticmethod
+    def status_labels(player):
+        cc = player.cc
+        labels = []
+        if cc.stunned:
+            labels.append("STUN")
+        if cc.guarded:
+            labels.append("G")
+        if cc.fixed:
+            labels.append("FIX")
+        if cc.combi_buff:
+            labels.append("CMB")
+        if cc.counter_on:
+            labels.append("CTR")
+        return tuple(labels)
+
+    def draw_status(self, fighter, x, y):
+        if fighter.status:
+            txt = self.font.render(",".join(fighter.status), True, (255, 255, 0))
+            self.screen.blit(txt, (x - self.px(30), y))
+
+    def view(self):
+        game = self.game
+        p1, p2 = game.p1, game.p2
+        return BoxingView(
+            hand=(tuple(c.name for c in p1.basic_cards), tuple(c.name for c in p1.special_cards), p1.cc.fixed),
+            p1=FighterView(p1.x, p1.hp, self.status_labels(p1)),
+            p2=FighterView(p2.x, p2.hp, self.status_labels(p2)),
+            p1_dir=self.last_p1_dir,
+            p2_dir=self.last_p2_dir,
+            p1_target=self.last_p1_target_x,
+            p2_target=self.last_p2_target_x,
+            selected_card=self.selected_card[2].name if self.selected_card else None,
+            selected_dir=self.selected_dir,
+            message=self.last_message,
+            game_over=game.game_over,
+        )
 
     def draw_scene(self):
-        game = self.game
+        self.render(self.view())
+
+    def render(self, view):
         screen = self.screen
         font = self.font
+        px = self.px
+        radius = px(20)
 
-        screen.fill((30, 30, 30))
-
-        # 타일 바닥
-        for tx in range(self.MIN_X, self.MAX_X + 1):
-            cx = self.x_to_pixel(tx)
-            rect = pygame.Rect(
-                cx - self.TILE_SIZE // 2,
-                self.y_line - self.TILE_SIZE // 2,
-                self.TILE_SIZE,
-                self.TILE_SIZE,
-            )
-            pygame.draw.rect(screen, (60, 60, 60), rect)
-            pygame.draw.rect(screen, (120, 120, 120), rect, 2)
-
-            num_txt = font.render(str(tx), True, (180, 180, 180))
-            screen.blit(
-                num_txt,
-                (rect.x + self.TILE_SIZE // 2 - 8, rect.y + self.TILE_SIZE // 2 - 10),
-            )
+        # 정적 레이어 (손패가 바뀐 경우에만 다시 그림)
+        if self._static_layer is None or view.hand != self._static_key:
+            self._static_key = view.hand
+            self.render_static_layer(view.hand)
+        screen.blit(self._static_layer, (0, 0))
 
         # 플레이어 위치
-        p1_x = self.x_to_pixel(game.p1.x)
+        p1_x = self.x_to_pixel(view.p1.x)
         p1_y = self.y_line
-        pygame.draw.circle(screen, (0, 200, 255), (p1_x, p1_y), 20)
+        pygame.draw.circle(screen, (0, 200, 255), (p1_x, p1_y), radius)
 
-        p2_x = self.x_to_pixel(game.p2.x)
+        p2_x = self.x_to_pixel(view.p2.x)
         p2_y = self.y_line
-        pygame.draw.circle(screen, (255, 100, 100), (p2_x, p2_y), 20)
+        pygame.draw.circle(screen, (255, 100, 100), (p2_x, p2_y), radius)
 
         # 방향 화살표
-        self.draw_direction_arrow(p1_x, p1_y, self.last_p1_dir, (0, 255, 255))
-        self.draw_direction_arrow(p2_x, p2_y, self.last_p2_dir, (255, 150, 150))
+        self.draw_direction_arrow(p1_x, p1_y, view.p1_dir, (0, 255, 255))
+        self.draw_direction_arrow(p2_x, p2_y, view.p2_dir, (255, 150, 150))
 
         # 타겟 타일
-        self.draw_target_tile(self.last_p1_target_x, (0, 255, 0))
-        self.draw_target_tile(self.last_p2_target_x, (255, 80, 80))
+        self.draw_target_tile(view.p1_target, (0, 255, 0))
+        self.draw_target_tile(view.p2_target, (255, 80, 80))
 
         # HP 표시
-        hp_text1 = font.render(f"P1 HP: {game.p1.hp}", True, (255, 255, 255))
-        hp_text2 = font.render(f"P2 HP: {game.p2.hp}", True, (255, 255, 255))
-        screen.blit(hp_text1, (50, 20))
-        screen.blit(hp_text2, (self.WIDTH - 200, 20))
+        hp_text1 = font.render(f"P1 HP: {view.p1.hp}", True, (255, 255, 255))
+        hp_text2 = font.render(f"P2 HP: {view.p2.hp}", True, (255, 255, 255))
+        screen.blit(hp_text1, (px(50), px(20)))
+        screen.blit(hp_text2, (self.width - px(200), px(20)))
 
         # 상태표시
-        self.draw_status(game.p1, p1_x, self.y_line + 40)
-        self.draw_status(game.p2, p2_x, self.y_line - 40)
-
-        # 카드 버튼
-        x_start = 50
-        y_basic = self.HEIGHT - 200
-        y_special = self.HEIGHT - 160
-        btn_w, btn_h = 120, 30
-
-        # 기본 카드
-        for i, card in enumerate(game.p1.basic_cards):
-            rect = pygame.Rect(x_start + i * (btn_w + 10), y_basic, btn_w, btn_h)
-            is_move = getattr(card, "type", None) == BoxingGame.Type.Move
-            if game.p1.cc.fixed and is_move:
-                color = (40, 40, 40)
-                text_color = (120, 120, 120)
-            else:
-                color = (60, 60, 60)
-                text_color = (255, 255, 255)
-            pygame.draw.rect(screen, color, rect)
-            txt = font.render(card.__class__.__name__, True, text_color)
-            screen.blit(txt, (rect.x + 5, rect.y + 5))
-
-        # 스페셜 카드
-        for i, card in enumerate(game.p1.special_cards):
-            rect = pygame.Rect(x_start + i * (btn_w + 10), y_special, btn_w, btn_h)
-            is_move = getattr(card, "type", None) == BoxingGame.Type.Move
-            if game.p1.cc.fixed and is_move:
-                color = (50, 40, 50)
-                text_color = (150, 150, 150)
-            else:
-                color = (80, 60, 80)
-                text_color = (255, 255, 255)
-            pygame.draw.rect(screen, color, rect)
-            txt = font.render(card.__class__.__name__, True, text_color)
-            screen.blit(txt, (rect.x + 5, rect.y + 5))
-
-        # 방향 버튼
-        left_rect = pygame.Rect(50, self.HEIGHT - 80, 50, 30)
-        right_rect = pygame.Rect(150, self.HEIGHT - 80, 50, 30)
-        pygame.draw.rect(screen, (80, 80, 80), left_rect)
-        pygame.draw.rect(screen, (80, 80, 80), right_rect)
-        ltxt = font.render("<", True, (255, 255, 255))
-        rtxt = font.render(">", True, (255, 255, 255))
-        screen.blit(ltxt, (left_rect.x + 15, left_rect.y + 5))
-        screen.blit(rtxt, (right_rect.x + 15, right_rect.y + 5))
+        self.draw_status(view.p1, p1_x, self.y_line + px(40))
+        self.draw_status(view.p2, p2_x, self.y_line - px(40))
 
         # 선택 상태
-        sel_card_name = self.selected_card[2].__class__.__name__ if self.selected_card else "-"
-        sel_dir_str = {None: "-", -1: "왼쪽", 1: "오른쪽"}[self.selected_dir]
+        sel_card_name = view.selected_card or "-"
+        sel_dir_str = {None: "-", -1: "왼쪽", 1: "오른쪽"}[view.selected_dir]
         info_text = font.render(
             f"선택 카드: {sel_card_name} / 방향: {sel_dir_str}",
             True,
             (255, 255, 255),
         )
-        screen.blit(info_text, (50, self.HEIGHT - 120))
+        screen.blit(info_text, (px(50), self.height - px(120)))
 
-        msg_text = font.render(self.last_message, True, (200, 200, 0))
-        screen.blit(msg_text, (50, self.HEIGHT - 30))
+        msg_text = font.render(view.message, True, (200, 200, 0))
+        screen.blit(msg_text, (px(50), self.height - px(30)))
 
         # 게임 종료 메시지
-        if self.game.game_over:
+        if view.game_over:
             winner = (
-                "P2 승!" if self.game.p1.hp <= 0 and self.game.p2.hp > 0
-                else "P1 승!" if self.game.p2.hp <= 0 and self.game.p1.hp > 0
+                "P2 승!" if view.p1.hp <= 0 and view.p2.hp > 0
+                else "P1 승!" if view.p2.hp <= 0 and view.p1.hp > 0
                 else "무승부"
             )
             over_text = font.render(f"게임 종료: {winner}", True, (255, 50, 50))
-            self.screen.blit(
+            screen.blit(
                 over_text,
-                (self.WIDTH // 2 - 100, self.HEIGHT // 2 - 100),
+                (self.width // 2 - px(100), self.height // 2 - px(100)),
+            )
+            next_text = font.render("클릭하면 다음 라운드", True, (200, 200, 200))
+            screen.blit(
+                next_text,
+                (self.width // 2 - px(100), self.height // 2 - px(70)),
             )
 
     # ---------------------------
@@ -246,46 +376,26 @@ class BoxingGUI:
         if self.game.game_over:
             return
 
-        mx, my = pos
         game = self.game
-
-        # 방향 버튼
-        if 50 <= mx <= 100 and self.HEIGHT - 80 <= my <= self.HEIGHT - 50:
-            self.selected_dir = -1
-            self.last_message = "방향: 왼쪽"
+        self.ensure_layout()
+        target = self.hit_test(pos)
+        if target is None:
             return
 
-        if 150 <= mx <= 200 and self.HEIGHT - 80 <= my <= self.HEIGHT - 50:
-            self.selected_dir = 1
-            self.last_message = "방향: 오른쪽"
+        # 방향 버튼
+        if target[0] == "dir":
+            self.selected_dir = target[1]
+            self.last_message = "방향: 왼쪽" if target[1] == -1 else "방향: 오른쪽"
             return
 
         # 카드 버튼
-        card_btns = []
-        x_start = 50
-        y_basic = self.HEIGHT - 200
-        y_special = self.HEIGHT - 160
-        btn_w, btn_h = 120, 30
-
-        # 기본 카드
-        for i, card in enumerate(game.p1.basic_cards):
-            rect = pygame.Rect(x_start + i * (btn_w + 10), y_basic, btn_w, btn_h)
-            card_btns.append(("basic", i, rect, card))
-
-        # 스페셜 카드
-        for i, card in enumerate(game.p1.special_cards):
-            rect = pygame.Rect(x_start + i * (btn_w + 10), y_special, btn_w, btn_h)
-            card_btns.append(("special", i, rect, card))
-
-        for from_list, idx, rect, card in card_btns:
-            if rect.collidepoint(mx, my):
-                # fixed 상태면 이동카드 사용 불가
-                if game.p1.cc.fixed and getattr(card, "type", None) == BoxingGame.Type.Move:
-                    self.last_message = "이동 불가 상태입니다! (fixed)"
-                    return
-                self.selected_card = (from_list, idx, card)
-                self.last_message = f"카드 선택: {card.__class__.__name__}"
-                return
+        _, from_list, idx, card = target
+        # fixed 상태면 이동카드 사용 불가
+        if game.p1.cc.fixed and getattr(card, "type", None) == BoxingGame.Type.Move:
+            self.last_message = "이동 불가 상태입니다! (fixed)"
+            return
+        self.selected_card = (from_list, idx, card)
+        self.last_message = f"카드 선택: {card.__class__.__name__}"
 
     # ---------------------------
     # 턴 처리
@@ -311,72 +421,58 @@ class BoxingGUI:
                 game.p1.special_cards.pop(idx)
 
         # P2 (AI)
-        ai_cards = game.p2.basic_cards + game.p2.special_cards
-        if ai_cards:
-            ai_card = random.choice(ai_cards)
-            if game.p1.x < game.p2.x:
-                ai_dir = -1
-            elif game.p1.x > game.p2.x:
-                ai_dir = 1
-            else:
-                ai_dir = random.choice([-1, 1])
-            act2 = BoxingGame.Action(game.p2, ai_card, ai_dir)
-
-            # AI 카드 소모
-            if ai_card in game.p2.basic_cards:
-                game.p2.basic_cards.remove(ai_card)
-            elif ai_card in game.p2.special_cards:
-                game.p2.special_cards.remove(ai_card)
-        else:
-            ai_card = BoxingGame.Jab()
-            ai_dir = random.choice([-1, 1])
-            act2 = BoxingGame.Action(game.p2, ai_card, ai_dir)
+        ai_card, ai_dir = game.p2.ai.choose(game, game.p2, game.p1)
+        act2 = BoxingGame.Action(game.p2, ai_card, ai_dir)
+        # AI 카드 소모
+        game.p2.use_card(ai_card)
+
+        self.apply_turn(act1, act2)
+
+        # 선택 초기화
+        self.selected_card = None
+        self.selected_dir = None
+
+    def apply_turn(self, act1, act2):
+        """카드 소모가 끝난 두 액션으로 턴 해소 + 화면용 기록 (리플레이 렌더러도 사용)"""
+        game = self.game
 
         # 방향/타겟 기록 (시각화용)
         self.last_p1_dir = act1.direction
         self.last_p2_dir = act2.direction
-        self.last_p1_target_x = self.compute_target_x(game.p1, card, act1.direction)
-        self.last_p2_target_x = self.compute_target_x(game.p2, ai_card, act2.direction)
+        self.last_p1_target_x = self.compute_target_x(game.p1, act1.card, act1.direction)
+        self.last_p2_target_x = self.compute_target_x(game.p2, act2.card, act2.direction)
 
         # 턴 해소
         game.resolve_turn(act1, act2)
+        if self.on_turn is not None:
+            self.on_turn(self)
         self.last_message = (
-            f"턴 {game.turn} 진행! P1:{card.__class__.__name__} / "
-            f"P2:{ai_card.__class__.__name__}"
+            f"턴 {game.turn} 진행! P1:{act1.card.__class__.__name__} / "
+            f"P2:{act2.card.__class__.__name__}"
         )
 
-        # 선택 초기화
-        self.selected_card = None
-        self.selected_dir = None
-
     # ---------------------------
     # 메인 루프
     # ---------------------------
-    def run(self):
-        pygame.init()
-        self.screen = pygame.display.set_mode((self.WIDTH, self.HEIGHT))
-        pygame.display.setCaption = "BoxingGame - Pygame Prototype"
-        self.clock = pygame.time.Clock()
-        self.font = pygame.font.SysFont("malgungothic", 20)
-
-        running = True
-        while running:
-            self.clock.tick(60)
-
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    running = False
-                elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-                    self.handle_mouse_click(event.pos)
-
-            # 턴 처리
-            self.process_turn_if_ready()
-
-            # 화면 그리기
-            self.draw_scene()
-            pygame.display.flip()
-
-        pygame.quit()
+    def update(self, dt, events):
+        for event in events:
+            if event.type == pygame.QUIT:
+                # 창 닫기 → 이번 복싱 라운드 종료
+                self.result = self.make_result()
+            elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+                if self.game.game_over:
+                    # 게임이 끝난 뒤 클릭 → 다음 라운드로
+                    self.result = self.make_result()
+                    return
+                self.handle_mouse_click(event.pos)
+
+        # 턴 처리
+        self.process_turn_if_ready()
+
+    def draw(self):
+        self.draw_scene()
+
+    def make_result(self):
         # 상위에서 참고할 수 있도록 결과 리턴
         return {
             "game_over": self.game.game_over,
@@ -385,6 +481,25 @@ class BoxingGUI:
             "p2_hp": self.game.p2.hp,
         }
 
+    def run(self, display=None, capture=None):
+        """
+        복싱 라운드 진행 후 결과 dict 반환.
+        display를 주면 그 창을 그대로 쓰고, 없으면 창을 새로 만들고 끝나면 닫는다.
+        capture(capture.FrameCapture)를 주면 이 라운드 프레임을 공유 메모리 링으로 내보냄.
+        """
+        own = display is None
+        if own:
+            display = Display(self.SIZE, self.CAPTION)
+        prev = display.capture
+        if capture is not None:
+            display.capture = capture
+        try:
+            return display.run(self)
+        finally:
+            display.capture = prev
+            if own:
+                display.close()
+
 
 if __name__ == "__main__":
     gui = BoxingGUI()
@@ -0,0 +1,251 @@
+# box_balance.py
+"""
+복싱 카드 밸런스 분석.
+
+HeadlessBoxingRunner로 시드 고정된 게임을 모든 코어에서 대량으로 돌리고
+카드별 / 시작 손패별 / 첫 턴(오프닝)별 승률과 게임 길이 분포를 집계한다.
+
+- 작업은 chunk 단위로 나뉘고, chunk마다 (seed, chunk 번호)로 만든 독립 RNG를 쓴다.
+  → 워커 수나 완료 순서와 상관없이 같은 seed면 같은 결과.
+- 집계는 chunk가 끝날 때마다 합쳐지고, 키 개수가 카드 조합 수로 제한되므로 메모리 일정.
+- --state 파일에 완료 chunk와 누적 집계를 주기적으로 저장 → 같은 명령으로 이어 돌리기 가능.
+
+예) python box_balance.py --games 1000000 --out balance.json --state balance.state.json
+"""
+import argparse
+import csv
+import json
+import multiprocessing
+import os
+import time
+
+from box2 import BoxingGame
+from box_runner import BOTS, HeadlessBoxingRunner
+
+
+TABLES = ("card", "hand", "opening")
+
+
+def new_stats():
+    """집계 구조: table -> key -> [게임 수, 승리 수], length -> 턴 수 -> 게임 수"""
+    stats = {name: {} for name in TABLES}
+    stats["length"] = {}
+    stats["games"] = 0
+    stats["p1_wins"] = 0
+    stats["p2_wins"] = 0
+    stats["draws"] = 0
+    stats["unfinished"] = 0
+    return stats
+
+
+def _count(table, key, won):
+    row = table.get(key)
+    if row is None:
+        row = table[key] = [0, 0]
+    row[0] += 1
+    if won:
+        row[1] += 1
+
+
+def record_game(stats, res):
+    winner = res["winner"] if res["game_over"] else None
+    stats["games"] += 1
+    if not res["game_over"]:
+        stats["unfinished"] += 1
+    elif winner == "P1":
+        stats["p1_wins"] += 1
+    elif winner == "P2":
+        stats["p2_wins"] += 1
+    else:
+        stats["draws"] += 1
+
+    for side, hand in (("P1", res["p1_hand"]), ("P2", res["p2_hand"])):
+        won = winner == side
+        for name in hand:
+            _count(stats["card"], name, won)
+        _count(stats["hand"], "|".join(sorted(hand)), won)
+
+    if res["opening"] is not None:
+        # 오프닝 승률은 P1 기준
+        _count(stats["opening"], "/".join(res["opening"]), winner == "P1")
+
+    turns = str(res["turns"])
+    stats["length"][turns] = stats["length"].get(turns, 0) + 1
+
+
+def merge_stats(into, other):
+    for key in ("games", "p1_wins", "p2_wins", "draws", "unfinished"):
+        into[key] += other[key]
+    for name in TABLES:
+        table = into[name]
+        for key, (games, wins) in other[name].items():
+            row = table.get(key)
+            if row is None:
+                table[key] = [games, wins]
+            else:
+                row[0] += games
+                row[1] += wins
+    for turns, n in other["length"].items():
+        into["length"][turns] = into["length"].get(turns, 0) + n
+
+
+# ---------------------------
+# 워커
+# ---------------------------
+_CONFIG = None
+
+
+def apply_config(config):
+    """밸런스 파라미터를 BoxingGame 클래스에 적용 (워커 프로세스마다 호출)"""
+    global _CONFIG
+    _CONFIG = config
+    BoxingGame.PLAYER_BASIC_HEALTH = config["health"]
+    BoxingGame.SPECIAL_CARD_NUM = config["special_num"]
+    BoxingGame.SPECIAL_CARD_LIST = [getattr(BoxingGame, name) for name in config["cards"]]
+
+
+def run_chunk(chunk):
+    """chunk 하나를 (seed, chunk) 전용 RNG로 돌리고 집계를 반환"""
+    config = _CONFIG
+    runner = HeadlessBoxingRunner(
+        max_turns=config["max_turns"], seed=f"{config['seed']}:{chunk}"
+    )
+    runner.bot1 = BOTS[config["p1"]](runner.rng)
+    runner.bot2 = BOTS[config["p2"]](runner.rng)
+
+    stats = new_stats()
+    start = chunk * config["chunk_size"]
+    for _ in range(min(config["chunk_size"], config["games"] - start)):
+        record_game(stats, runner.play_one())
+    return chunk, stats
+
+
+# ---------------------------
+# 저장 / 이어하기
+# ---------------------------
+def write_json_atomic(path, data):
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False)
+    os.replace(tmp, path)
+
+
+def load_state(path, config):
+    if not path or not os.path.exists(path):
+        return set(), new_stats()
+    with open(path, encoding="utf-8") as f:
+        state = json.load(f)
+    if state["config"] != config:
+        raise ValueError(f"{path}: 설정이 다른 실행의 상태 파일입니다")
+    return set(state["done"]), state["stats"]
+
+
+def summarize(stats, config):
+    def rows(table):
+        return sorted(
+            (
+                {"key": key, "games": g, "wins": w, "win_rate": w / g if g else 0.0}
+                for key, (g, w) in table.items()
+            ),
+            key=lambda r: (-r["win_rate"], r["key"]),
+        )
+
+    lengths = {int(t): n for t, n in stats["length"].items()}
+    total_turns = sum(t * n for t, n in lengths.items())
+    return {
+        "config": config,
+        "games": stats["games"],
+        "p1_wins": stats["p1_wins"],
+        "p2_wins": stats["p2_wins"],
+        "draws": stats["draws"],
+        "unfinished": stats["unfinished"],
+        "avg_turns": total_turns / stats["games"] if stats["games"] else 0.0,
+        "cards": rows(stats["card"]),
+        "hands": rows(stats["hand"]),
+        "openings": rows(stats["opening"]),
+        "length_histogram": dict(sorted(lengths.items())),
+    }
+
+
+def write_results(path, summary):
+    if path.endswith(".csv"):
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            w = csv.writer(f)
+            w.writerow(["table", "key", "games", "wins", "win_rate"])
+            for table in ("cards", "hands", "openings"):
+                for r in summary[table]:
+                    w.writerow([table, r["key"], r["games"], r["wins"], f"{r['win_rate']:.6f}"])
+            for turns, n in summary["length_histogram"].items():
+                w.writerow(["length", turns, n, "", ""])
+    else:
+        write_json_atomic(path, summary)
+
+
+def run_analysis(config, workers=None, state_path=None, checkpoint_every=10.0, progress=True):
+    """설정(config)대로 전체 분석을 돌리고 요약 dict를 반환"""
+    n_chunks = (config["games"] + config["chunk_size"] - 1) // config["chunk_size"]
+    done, stats = load_state(state_path, config)
+    pending = [c for c in range(n_chunks) if c not in done]
+
+    start = time.perf_counter()
+    last_save = start
+    played = 0
+
+    def save():
+        if state_path:
+            write_json_atomic(state_path, {"config": config, "done": sorted(done), "stats": stats})
+
+    with multiprocessing.Pool(workers, initializer=apply_config, initargs=(config,)) as pool:
+        for chunk, chunk_stats in pool.imap_unordered(run_chunk, pending):
+            merge_stats(stats, chunk_stats)
+            done.add(chunk)
+            played += chunk_stats["games"]
+
+            now = time.perf_counter()
+            if now - last_save >= checkpoint_every:
+                save()
+                last_save = now
+                if progress:
+                    rate = played / (now - start)
+                    print(f"{len(done)}/{n_chunks} chunk, {stats['games']}판 ({rate:.0f} games/s)")
+    save()
+    return summarize(stats, config)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="복싱 카드 밸런스 분석 (멀티코어)")
+    parser.add_argument("--games", type=int, default=1_000_000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=None, help="기본: 모든 코어")
+    parser.add_argument("--chunk-size", type=int, default=2000)
+    parser.add_argument("--p1", choices=sorted(BOTS), default="chase")
+    parser.add_argument("--p2", choices=sorted(BOTS), default="chase")
+    parser.add_argument("--max-turns", type=int, default=200)
+    parser.add_argument("--health", type=int, default=BoxingGame.PLAYER_BASIC_HEALTH)
+    parser.add_argument("--special-num", type=int, default=BoxingGame.SPECIAL_CARD_NUM)
+    parser.add_argument(
+        "--cards",
+        default=",".join(cls.__name__ for cls in BoxingGame.SPECIAL_CARD_LIST),
+        help="스페셜 카드 풀 (쉼표 구분)",
+    )
+    parser.add_argument("--out", default="balance.json", help=".json 또는 .csv")
+    parser.add_argument("--state", default=None, help="이어 돌리기용 상태 파일")
+    args = parser.parse_args()
+
+    config = {
+        "games": args.games,
+        "seed": args.seed,
+        "chunk_size": args.chunk_size,
+        "p1": args.p1,
+        "p2": args.p2,
+        "max_turns": args.max_turns,
+        "health": args.health,
+        "special_num": args.special_num,
+        "cards": [name.strip() for name in args.cards.split(",") if name.strip()],
+    }
+    summary = run_analysis(config, workers=args.workers, state_path=args.state)
+    write_results(args.out, summary)
+    print(
+        f"{summary['games']}판 완료 → {args.out} "
+        f"(P1 {summary['p1_wins']} / P2 {summary['p2_wins']} / 무승부 {summary['draws']})"
+    )
@@ -0,0 +1,415 @@
+# box_bench.py
+"""
+box2.BoxingGame 엔진 벤치마크 (헤드리스, 시드 고정, JSON 결과).
+
+- pairs   : 카드 조합(P1 카드 x P2 카드)마다 resolve_turn 한 번의 비용
+- status  : 상태이상(가드/스턴/이동 불가/콤비/카운터/전부)이 걸린 채 모든 카드 조합 resolve_turn
+- player  : Player.setup / refill (빈 손패 리필, 이미 찬 손패) 비용
+- games   : RandomBot끼리 끝까지 두는 전체 게임 처리량
+- memory  : 게임 인스턴스 하나당 메모리 (setup 직후 / 한 판 끝난 뒤, tracemalloc)
+
+시간은 같은 작업 배치 하나를 여러 번 재서 한 번당 중앙값 (--quick이면 배치/반복을 줄임). 재는 동안 gc는 끈다.
+같은 시드면 같은 게임 상태를 재므로, 결과 JSON을 커밋끼리 비교할 수 있다 (--compare).
+digest는 벤치마크가 만든 최종 상태의 해시 → 최적화가 규칙을 바꿨으면 여기서 드러난다.
+
+예) python box_bench.py --out bench.json
+    python box_bench.py --compare bench.json --threshold 0.15   (느려졌거나 digest가 달라지면 exit 1)
+"""
+import argparse
+import gc
+import hashlib
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+
+from box2 import BoxingGame
+from box_runner import HeadlessBoxingRunner, RandomBot
+
+VERSION = 1
+
+# 상태이상 시나리오: 턴 시작 전에 두 선수에게 거는 상태
+STATUSES = {
+    "none": (),
+    "guarded": ("guarded",),
+    "stunned": ("stunned",),
+    "fixed": ("fixed",),
+    "combi_buff": ("combi_buff",),
+    "counter": ("counter_on",),
+    "all": ("guarded", "fixed", "combi_buff", "counter_on"),
+}
+
+
+# ---------------------------
+# 측정 도구
+# ---------------------------
+def timed(fn, repeat):
+    """fn()을 repeat번 (gc 끄고) 재서 [ns]. fn은 (준비, 측정할 함수)를 돌려준다"""
+    samples = []
+    for _ in range(repeat):
+        run = fn()
+        gc.collect()
+        gc.disable()
+        try:
+            start = time.perf_counter_ns()
+            run()
+            samples.append(time.perf_counter_ns() - start)
+        finally:
+            gc.enable()
+    return samples
+
+
+def summarize(samples, per):
+    """[배치 ns] → 한 번당 ns 중앙값/최소 + 초당 횟수"""
+    median = statistics.median(samples) / per
+    return {
+        "ns": round(median, 1),
+        "min_ns": round(min(samples) / per, 1),
+        "per_sec": round(1e9 / median, 1) if median else None,
+    }
+
+
+def state_digest(games):
+    """게임들의 최종 상태 해시 (같은 시드면 같은 값이어야 한다)"""
+    h = hashlib.sha1()
+    for game in games:
+        h.update(json.dumps(game.snapshot(), sort_keys=True).encode())
+    return h.hexdigest()[:16]
+
+
+# ---------------------------
+# resolve_turn
+# ---------------------------
+def make_turn(rng, name1, name2, statuses=()):
+    """
+    카드 name1(P1) / name2(P2)로 한 턴을 해소할 준비가 된 (game, act1, act2).
+    위치는 rng로 (서로 0~2칸 거리), 방향은 서로 마주 보게. statuses는 두 선수 모두에게.
+    """
+    game = BoxingGame(rng)
+    game.setup()
+    p1, p2 = game.p1, game.p2
+    p1.x = rng.randint(BoxingGame.FIELD_MIN_X, BoxingGame.FIELD_MAX_X - 2)
+    p2.x = p1.x + rng.randint(0, 2)
+    for player in (p1, p2):
+        for attr in statuses:
+            if attr == "counter_on":
+                counter = BoxingGame.Counter()
+                counter.owner = player
+                player.cc.counter_on = counter
+            else:
+                # 바로 켜고 다음 턴에 끄는 예약까지 (실제 게임처럼 큐에도 이벤트가 있게)
+                player.cc.apply(game.turn, attr, 0, 2)
+    act1 = BoxingGame.Action(p1, getattr(BoxingGame, name1)(), 1, p2)
+    act2 = BoxingGame.Action(p2, getattr(BoxingGame, name2)(), -1 if p2.x > p1.x else 1, p1)
+    return game, act1, act2
+
+
+def resolve_batch(turns):
+    def run():
+        for game, act1, act2 in turns:
+            game.resolve_turn(act1, act2)
+    return run
+
+
+def bench_pairs(seed, batch, repeat):
+    """카드 조합마다 resolve_turn 비용 (상태이상 없음)"""
+    names = [s.name for s in BoxingGame.CARD_TABLE]
+    rows = {}
+    for name1 in names:
+        for name2 in names:
+            rng = random.Random(f"{seed}:pairs:{name1}:{name2}")
+            last = []
+
+            def prepare():
+                last[:] = [make_turn(rng, name1, name2) for _ in range(batch)]
+                return resolve_batch(last)
+
+            row = summarize(timed(prepare, repeat), batch)
+            row["digest"] = state_digest(game for game, _, _ in last[:8])
+            rows[f"{name1}/{name2}"] = row
+    return rows
+
+
+def bench_status(seed, batch, repeat):
+    """상태이상마다 모든 카드 조합을 섞은 배치의 resolve_turn 비용"""
+    names = [s.name for s in BoxingGame.CARD_TABLE]
+    pairs = [(a, b) for a in names for b in names]
+    rows = {}
+    for status, attrs in STATUSES.items():
+        rng = random.Random(f"{seed}:status:{status}")
+        last = []
+
+        def prepare():
+            last[:] = [make_turn(rng, *pairs[i % len(pairs)], attrs) for i in range(batch)]
+            return resolve_batch(last)
+
+        row = summarize(timed(prepare, repeat), batch)
+        row["digest"] = state_digest(game for game, _, _ in last[:len(pairs)])
+        rows[status] = row
+    return rows
+
+
+# ---------------------------
+# Player.setup / refill
+# ---------------------------
+def bench_player(seed, batch, repeat):
+    rng = random.Random(f"{seed}:player")
+    players = [BoxingGame.Player(num=i) for i in range(2)]
+    rows = {}
+
+    def setup():
+        def run():
+            for i in range(batch):
+                players[i & 1].setup(rng)
+        return run
+
+    def refill_empty():
+        hands = [BoxingGame.Player(x=0) for _ in range(batch)]
+
+        def run():
+            for player in hands:
+                player.refill()
+        return run
+
+    def refill_full():
+        hands = [BoxingGame.Player(x=0) for _ in range(batch)]
+        for player in hands:
+            player.refill()
+
+        def run():
+            for player in hands:
+                player.refill()
+        return run
+
+    rows["setup"] = summarize(timed(setup, repeat), batch)
+    rows["refill_empty"] = summarize(timed(refill_empty, repeat), batch)
+    rows["refill_full"] = summarize(timed(refill_full, repeat), batch)
+    return rows
+
+
+# ---------------------------
+# 전체 게임
+# ---------------------------
+def bench_games(seed, games, repeat, max_turns=200):
+    """RandomBot 대 RandomBot 전체 게임. 반복마다 같은 시드 → 같은 게임들"""
+    results = []
+
+    def prepare():
+        runner = HeadlessBoxingRunner(max_turns=max_turns, seed=f"{seed}:games")
+        runner.bot1 = RandomBot(runner.rng)
+        runner.bot2 = RandomBot(runner.rng)
+
+        def run():
+            results.append(runner.run(games))
+        return run
+
+    samples = timed(prepare, repeat)
+    stats = results[-1]
+    turns = stats["avg_turns"] * games
+    row = summarize(samples, games)
+    row["turns_per_sec"] = round(turns * 1e9 / statistics.median(samples), 1)
+    row["avg_turns"] = round(stats["avg_turns"], 3)
+    row["outcome"] = [stats["p1_wins"], stats["p2_wins"], stats["draws"], stats["unfinished"]]
+    return row
+
+
+# ---------------------------
+# 메모리
+# ---------------------------
+def bench_memory(seed, count):
+    """게임 인스턴스 하나당 바이트 (setup 직후 / RandomBot끼리 한 판 끝난 뒤)"""
+    rng = random.Random(f"{seed}:memory")
+    row = {}
+    for label, play in (("setup", False), ("played", True)):
+        gc.collect()
+        tracemalloc.start()
+        try:
+            base = tracemalloc.get_traced_memory()[0]
+            games = []
+            for _ in range(count):
+                game = BoxingGame(rng)
+                game.setup()
+                if play:
+                    bot = RandomBot(rng)
+                    while not game.game_over and game.turn < 200:
+                        card1, dir1 = bot.choose(game, game.p1, game.p2)
+                        game.p1.use_card(card1)
+                        card2, dir2 = bot.choose(game, game.p2, game.p1)
+                        game.p2.use_card(card2)
+                        game.resolve_turn(
+                            BoxingGame.Action(game.p1, card1, dir1, game.p2),
+                            BoxingGame.Action(game.p2, card2, dir2, game.p1),
+                        )
+                games.append(game)
+            gc.collect()
+            used = tracemalloc.get_traced_memory()[0] - base
+        finally:
+            tracemalloc.stop()
+        row[f"{label}_bytes"] = round(used / count, 1)
+        del games
+    return row
+
+
+# ---------------------------
+# 결과 / 비교
+# ---------------------------
+def git_commit():
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, timeout=5,
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+        )
+        return out.stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def metrics(results):
+    """
+    비교용 평탄화: 지표 이름 -> (값, 클수록 좋은지).
+    시간은 반복 중 최솟값 (다른 프로세스/스케줄링 잡음이 가장 적게 섞인 값)
+    """
+    out = {}
+    pairs = results.get("pairs", {})
+    if pairs:
+        out["pairs.geomean.ns"] = (round(statistics.geometric_mean(r["min_ns"] for r in pairs.values()), 1), False)
+    for key, row in pairs.items():
+        out[f"pairs.{key}.ns"] = (row["min_ns"], False)
+    for key, row in results.get("status", {}).items():
+        out[f"status.{key}.ns"] = (row["min_ns"], False)
+    for key, row in results.get("player", {}).items():
+        out[f"player.{key}.ns"] = (row["min_ns"], False)
+    if "games" in results:
+        out["games.ns"] = (results["games"]["min_ns"], False)
+        out["games.turns_per_sec"] = (results["games"]["turns_per_sec"], True)
+    for key, value in results.get("memory", {}).items():
+        out[f"memory.{key}"] = (value, False)
+    return out
+
+
+def digests(results):
+    out = {f"pairs.{k}": row["digest"] for k, row in results.get("pairs", {}).items()}
+    out.update({f"status.{k}": row["digest"] for k, row in results.get("status", {}).items()})
+    if "games" in results:
+        out["games.outcome"] = results["games"]["outcome"]
+    return out
+
+
+def compare(base, current, threshold):
+    """
+    base/current 결과 JSON 비교 → (행 목록, 느려진 지표, 결과가 달라진 항목).
+    행: (지표, 이전 값, 지금 값, 변화율 — 양수면 개선)
+    카드 조합 하나하나는 배치가 작아서 잡음이 크다 → 회귀 판정은 조합 전체의 기하평균으로만
+    """
+    # digest는 같은 시드 + 같은 배치 크기(--quick 여부)일 때만 같은 상태를 가리킨다
+    same_states = all(base["meta"][k] == current["meta"][k] for k in ("seed", "quick"))
+    if not same_states:
+        print("주의: 시드나 --quick 여부가 달라서 digest 비교는 생략")
+    old, new = metrics(base["results"]), metrics(current["results"])
+    rows, regressions = [], []
+    for name, (value, higher_better) in new.items():
+        if name not in old or not old[name][0] or value is None:
+            continue
+        before = old[name][0]
+        change = (value - before) / before if higher_better else (before - value) / before
+        rows.append((name, before, value, change))
+        per_pair = name.startswith("pairs.") and name != "pairs.geomean.ns"
+        if change < -threshold and not per_pair:
+            regressions.append(name)
+    changed = []
+    if same_states:
+        old_d, new_d = digests(base["results"]), digests(current["results"])
+        changed = [k for k in new_d if k in old_d and old_d[k] != new_d[k]]
+    return rows, regressions, changed
+
+
+def run_bench(seed=0, quick=False, only=None, log=print):
+    """벤치마크 전부(또는 only에 있는 것만) 돌리고 결과 dict"""
+    batch, repeat, games, count = (100, 3, 200, 200) if quick else (400, 7, 1000, 1000)
+    suites = {
+        "pairs": lambda: bench_pairs(seed, batch // 2, repeat),
+        "status": lambda: bench_status(seed, batch * 4, repeat),
+        "player": lambda: bench_player(seed, batch * 4, repeat),
+        "games": lambda: bench_games(seed, games, repeat),
+        "memory": lambda: bench_memory(seed, count),
+    }
+    results = {}
+    for name, fn in suites.items():
+        if only and name not in only:
+            continue
+        start = time.perf_counter()
+        results[name] = fn()
+        log(f"{name:8s} {time.perf_counter() - start:6.2f}s")
+    return {
+        "version": VERSION,
+        "meta": {
+            "seed": seed,
+            "quick": quick,
+            "batch": batch,
+            "repeat": repeat,
+            "python": sys.version.split()[0],
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "commit": git_commit(),
+            "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        },
+        "results": results,
+    }
+
+
+def print_summary(data):
+    results = data["results"]
+    if "pairs" in results:
+        rows = sorted(results["pairs"].items(), key=lambda kv: kv[1]["ns"])
+        ns = [row["ns"] for _, row in rows]
+        print(f"카드 조합 {len(rows)}개: resolve_turn 중앙값 {statistics.median(ns) / 1000:.2f}us "
+              f"(최소 {rows[0][0]} {ns[0] / 1000:.2f}us, 최대 {rows[-1][0]} {ns[-1] / 1000:.2f}us)")
+    for name, row in results.get("status", {}).items():
+        print(f"  상태 {name:11s} {row['ns'] / 1000:7.2f}us/턴  {row['per_sec']:10.0f} 턴/s")
+    for name, row in results.get("player", {}).items():
+        print(f"  Player.{name:13s} {row['ns'] / 1000:7.2f}us")
+    if "games" in results:
+        row = results["games"]
+        print(f"  전체 게임 {row['per_sec']:.0f} games/s, {row['turns_per_sec']:.0f} 턴/s "
+              f"(평균 {row['avg_turns']}턴, 결과 {row['outcome']})")
+    if "memory" in results:
+        row = results["memory"]
+        print(f"  게임당 메모리 setup {row['setup_bytes'] / 1024:.1f}KiB / 한 판 뒤 {row['played_bytes'] / 1024:.1f}KiB")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="BoxingGame 엔진 벤치마크 (JSON 결과, 커밋 간 비교)")
+    parser.add_argument("--out", default=None, help="결과 JSON 경로")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--quick", action="store_true", help="배치/반복을 줄여서 빠르게")
+    parser.add_argument("--only", default=None, help="일부만 (예: pairs,games) — " + ",".join(
+        ("pairs", "status", "player", "games", "memory")))
+    parser.add_argument("--compare", default=None, metavar="JSON", help="이전 결과와 비교")
+    parser.add_argument("--threshold", type=float, default=0.15, help="이 비율 넘게 나빠지면 회귀로 판정")
+    args = parser.parse_args()
+
+    only = set(args.only.split(",")) if args.only else None
+    data = run_bench(args.seed, args.quick, only)
+    print_summary(data)
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=1, ensure_ascii=False)
+        print(f"→ {args.out}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            base = json.load(f)
+        rows, regressions, changed = compare(base, data, args.threshold)
+        print(f"\n{base['meta'].get('commit')} → {data['meta'].get('commit')}")
+        for name, before, after, change in sorted(rows, key=lambda r: r[3])[:15]:
+            print(f"  {name:32s} {before:12.1f} → {after:12.1f}  {change * 100:+6.1f}%")
+        if changed:
+            print(f"결과가 달라진 항목 {len(changed)}개: {', '.join(changed[:10])}")
+        if regressions:
+            print(f"회귀 {len(regressions)}개 (>{args.threshold * 100:.0f}%): {', '.join(regressions[:10])}")
+        raise SystemExit(1 if regressions or changed else 0)
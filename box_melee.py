@@ -0,0 +1,305 @@
+# box_melee.py
+"""
+N명 난투 복싱 (자유 대전 / 팀전), 넓은 필드.
+
+규칙은 1:1 BoxingGame 그대로 (카드 테이블, 이동 → 유틸 → 공격, 데미지 동시 적용).
+다른 점
+- 선수 N명, 필드 [field_min, field_max]는 게임마다 지정 (카드 룩업도 그 크기로 컴파일)
+- 매 턴 선수마다 targeting 규칙으로 상대 하나를 고르고, 그 상대를 기준으로 카드 판정
+  (사거리/카운터/Pound 대상 = 1:1에서 "상대"였던 자리)
+- hp가 0 이하가 된 선수는 턴 끝에 탈락, 한 팀(자유 대전이면 한 명)만 남으면 종료
+
+상대 찾기는 위치 인덱스(PositionIndex: 칸 → 선수들 + 선수가 있는 칸의 정렬 리스트)로
+주변 칸만 훑는다 → 선수마다 전체 스캔(N^2) 대신 턴 해소가 대략 선수 수에 비례.
+
+예) python box_melee.py --fighters 48 --games 20
+    python box_melee.py --scale 8,16,32,64,128   (선수 수별 턴 해소 시간)
+"""
+import argparse
+import bisect
+import random
+import time
+
+from box2 import BoxingGame
+from box_runner import BOTS
+
+
+# ---------------------------
+# 위치 인덱스
+# ---------------------------
+class PositionIndex:
+    """칸 x -> 그 칸의 선수들. 선수가 있는 칸은 정렬 리스트로 따로 들고 있어서 범위/최근접 검색이 빠르다"""
+
+    def __init__(self):
+        self.cells = {}  # x -> [player]
+        self.xs = []     # 선수가 한 명이라도 있는 칸 (정렬)
+
+    def add(self, player):
+        cell = self.cells.get(player.x)
+        if cell is None:
+            cell = self.cells[player.x] = []
+            bisect.insort(self.xs, player.x)
+        cell.append(player)
+
+    def remove(self, player, x=None):
+        x = player.x if x is None else x
+        cell = self.cells[x]
+        cell.remove(player)
+        if not cell:
+            del self.cells[x]
+            del self.xs[bisect.bisect_left(self.xs, x)]
+
+    def move(self, player, old_x):
+        self.remove(player, old_x)
+        self.add(player)
+
+    def at(self, x):
+        return self.cells.get(x, ())
+
+    def within(self, x, radius):
+        """[x - radius, x + radius] 칸의 선수들"""
+        xs = self.xs
+        lo = bisect.bisect_left(xs, x - radius)
+        hi = bisect.bisect_right(xs, x + radius)
+        for cx in xs[lo:hi]:
+            yield from self.cells[cx]
+
+    def nearest(self, x, accept):
+        """accept(player)인 선수 중 x에서 가장 가까운 선수 (같은 거리면 hp 낮은 쪽, 번호 작은 쪽)"""
+        xs = self.xs
+        right = bisect.bisect_left(xs, x)
+        left = right - 1
+        best, best_key = None, None
+        # 가까운 칸부터 양쪽으로 넓혀 가다가 지금 후보보다 먼 칸이 나오면 끝
+        while left >= 0 or right < len(xs):
+            if right < len(xs) and (left < 0 or xs[right] - x <= x - xs[left]):
+                cx = xs[right]
+                right += 1
+            else:
+                cx = xs[left]
+                left -= 1
+            d = abs(cx - x)
+            if best is not None and d > best_key[0]:
+                break
+            for p in self.cells[cx]:
+                if accept(p):
+                    key = (d, p.hp, p.num)
+                    if best is None or key < best_key:
+                        best, best_key = p, key
+        return best
+
+
+# ---------------------------
+# 대상 선택 규칙
+# ---------------------------
+def target_nearest(game, player):
+    """가장 가까운 상대"""
+    team = player.team
+    return game.index.nearest(player.x, lambda p: p.team != team)
+
+
+def target_weakest(game, player):
+    """카드가 닿는 거리 안의 상대 중 hp가 가장 낮은 선수, 없으면 가장 가까운 상대"""
+    team = player.team
+    near = [p for p in game.index.within(player.x, game.reach) if p.team != team]
+    if near:
+        return min(near, key=lambda p: (p.hp, abs(p.x - player.x), p.num))
+    return target_nearest(game, player)
+
+
+TARGETING = {
+    "nearest": target_nearest,
+    "weakest": target_weakest,
+}
+
+
+# ---------------------------
+# 게임
+# ---------------------------
+class MeleeGame(BoxingGame):
+    """
+    N명 난투. fighters명을 필드에 고르게 배치 (팀전이면 팀이 번갈아 서도록).
+    - teams: None이면 자유 대전, k면 선수 i는 팀 i % k
+    - bot: 선수마다 AI를 만드는 함수 (rng -> BoxingGame.AI)
+    """
+
+    def __init__(self, fighters=8, field=(-50, 50), teams=None, targeting="nearest", bot=None, rng=None):
+        if fighters < 2:
+            raise ValueError("난투는 선수가 2명 이상이어야 합니다")
+        field_min, field_max = field
+        if field_max <= field_min:
+            raise ValueError(f"잘못된 필드: {field}")
+        self.rng = rng or random
+        self.turn = 0
+        self.game_over = False
+        self.winner = None
+        self.actions = []  # 턴마다 [(선수 번호, 카드, 방향, 대상 번호)]
+        self.field = (field_min, field_max)
+        self.cards = BoxingGame.cards_for(field_min, field_max)
+        self.reach = max(s.range for s in self.cards.specs if s.range is not None)
+        self.teams = teams
+        self.targeting = targeting
+        self.choose_target = TARGETING[targeting]
+
+        bot = bot or BoxingGame.AI
+        width = field_max - field_min
+        self.players = []
+        for i in range(fighters):
+            player = BoxingGame.Player(bot(self.rng), x=field_min + (2 * i + 1) * width // (2 * fighters), num=i)
+            player.team = i % teams if teams else i
+            self.players.append(player)
+        self.alive = list(self.players)
+        self.index = PositionIndex()
+
+    @property
+    def fighters(self):
+        return self.alive
+
+    def reindex(self):
+        self.index = PositionIndex()
+        for player in self.alive:
+            self.index.add(player)
+
+    def setup(self):
+        for player in self.players:
+            player.setup(self.rng)
+        self.reindex()
+
+    def label(self, player):
+        return f"T{player.team + 1}" if self.teams else f"P{player.num + 1}"
+
+    # ---- 상태 저장 ----
+    def snapshot(self):
+        return {
+            "turn": self.turn,
+            "game_over": self.game_over,
+            "winner": self.winner,
+            "field": list(self.field),
+            "teams": self.teams,
+            "targeting": self.targeting,
+            "players": [{**p.snapshot(), "team": p.team} for p in self.players],
+        }
+
+    @classmethod
+    def from_snapshot(cls, state, rng=None, bot=None):
+        game = cls(len(state["players"]), tuple(state["field"]), state["teams"], state["targeting"], bot, rng)
+        game.turn = state["turn"]
+        game.game_over = state["game_over"]
+        game.winner = state["winner"]
+        for player, ps in zip(game.players, state["players"]):
+            player.restore(ps)
+            player.team = ps["team"]
+        game.alive = [p for p in game.players if p.hp > 0]
+        game.reindex()
+        return game
+
+    # ---- 턴 ----
+    def play_turn(self):
+        """살아 있는 선수 모두 대상을 정하고 AI로 카드를 골라 한 턴 동시 해소"""
+        if self.game_over:
+            return
+        actions = []
+        for player in self.alive:
+            target = self.choose_target(self, player)
+            card, direction = player.ai.choose(self, player, target)
+            player.use_card(card)
+            actions.append(BoxingGame.Action(player, card, direction, target))
+        self.actions.append([(a.player.num, a.card.name, a.direction, a.target.num) for a in actions])
+        self.resolve_actions(actions)
+
+    def on_move(self, player, old_x):
+        self.index.move(player, old_x)
+
+    def judge(self):
+        alive = [p for p in self.alive if p.hp > 0]
+        if len(alive) != len(self.alive):
+            for player in self.alive:
+                if player.hp <= 0:
+                    self.index.remove(player)
+            self.alive = alive
+        if len({p.team for p in alive}) <= 1:
+            self.game_over = True
+            self.winner = self.label(alive[0]) if alive else None  # 전원 동시 탈락 → 무승부
+
+
+# ---------------------------
+# 헤드리스 실행
+# ---------------------------
+def run_melee(fighters, field, teams=None, targeting="nearest", bot="chase", max_turns=2000, rng=None):
+    """난투 한 판을 끝까지 (또는 max_turns까지) 돌리고 결과 dict 반환"""
+    rng = rng or random.Random()
+    game = MeleeGame(fighters, field, teams, targeting, lambda r: BOTS[bot](r), rng)
+    game.setup()
+    actions = 0
+    start = time.perf_counter()
+    while not game.game_over and game.turn < max_turns:
+        actions += len(game.alive)
+        game.play_turn()
+    elapsed = time.perf_counter() - start
+    return {
+        "game_over": game.game_over,
+        "winner": game.winner,
+        "turns": game.turn,
+        "survivors": len(game.alive),
+        "actions": actions,
+        "elapsed": elapsed,
+        "us_per_action": elapsed / actions * 1e6 if actions else 0.0,
+    }
+
+
+def scale_table(sizes, density, turns, targeting, bot, seed):
+    """선수 수별 턴 해소 시간 (필드 폭 = 선수 수 x density, turns턴 고정)"""
+    rows = []
+    for n in sizes:
+        half = max(1, n * density // 2)
+        res = run_melee(n, (-half, half), None, targeting, bot, turns, random.Random(seed))
+        rows.append((n, res["turns"], res["elapsed"] / max(1, res["turns"]) * 1000, res["us_per_action"]))
+    return rows
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="N명 난투 복싱 (헤드리스)")
+    parser.add_argument("--fighters", type=int, default=32)
+    parser.add_argument("--field", type=int, default=None, help="필드 폭 (기본: 선수 수 x --density)")
+    parser.add_argument("--density", type=int, default=4, help="선수 한 명당 칸 수")
+    parser.add_argument("--teams", type=int, default=0, help="팀 수 (0: 자유 대전)")
+    parser.add_argument("--targeting", choices=sorted(TARGETING), default="nearest")
+    parser.add_argument("--bot", choices=sorted(BOTS), default="greedy")
+    parser.add_argument("--games", type=int, default=10)
+    parser.add_argument("--max-turns", type=int, default=2000)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--scale", default=None, help="선수 수 목록 (예: 8,16,32,64) → 턴 해소 시간 표")
+    args = parser.parse_args()
+
+    if args.scale:
+        sizes = [int(n) for n in args.scale.split(",")]
+        print(f"{'선수':>6}{'턴':>8}{'ms/턴':>10}{'us/행동':>10}")
+        for n, turns, ms, us in scale_table(sizes, args.density, args.max_turns, args.targeting, args.bot, args.seed):
+            print(f"{n:6d}{turns:8d}{ms:10.3f}{us:10.2f}")
+        raise SystemExit
+
+    width = args.field or args.fighters * args.density
+    field = (-(width // 2), width - width // 2)
+    rng = random.Random(args.seed)
+    wins = {}
+    unfinished = 0
+    total_turns = 0
+    total_actions = 0
+    elapsed = 0.0
+    for _ in range(args.games):
+        res = run_melee(args.fighters, field, args.teams or None, args.targeting, args.bot, args.max_turns, rng)
+        if res["game_over"]:
+            wins[res["winner"]] = wins.get(res["winner"], 0) + 1
+        else:
+            unfinished += 1
+        total_turns += res["turns"]
+        total_actions += res["actions"]
+        elapsed += res["elapsed"]
+
+    top = sorted(wins.items(), key=lambda kv: -kv[1])[:5]
+    print(
+        f"{args.games}판 / 선수 {args.fighters}명 / 필드 {field} / {elapsed:.2f}s "
+        f"(평균 {total_turns / args.games:.1f}턴, 행동당 {elapsed / max(1, total_actions) * 1e6:.1f}us) "
+        f"미종료 {unfinished}"
+    )
+    print("승리: " + ", ".join(f"{w or '무승부'} {n}" for w, n in top))
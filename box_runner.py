@@ -0,0 +1,167 @@
+# box_runner.py
+import argparse
+import random
+import time
+
+from box2 import BoxingGame
+
+
+# ---------------------------
+# 봇 정책들 (BoxingGame.AI 인터페이스)
+# ---------------------------
+class ChaseBot(BoxingGame.AI):
+    """BoxingGUI의 P2와 같은 정책: 랜덤 카드, 상대 쪽 방향"""
+
+
+class RandomBot(BoxingGame.AI):
+    """카드도 방향도 완전 랜덤"""
+
+    def choose(self, game, player, target):
+        rng = self.rng
+        cards = player.basic_cards + player.special_cards
+        card = rng.choice(cards) if cards else BoxingGame.Jab()
+        return card, rng.choice([-1, 1])
+
+
+class GreedyBot(BoxingGame.AI):
+    """
+    CARDS 테이블 기반 욕심쟁이:
+    - 지금 맞출 수 있는 공격 중 데미지가 가장 큰 카드
+    - 없으면 상대 쪽으로 이동 카드, 그것도 없으면 기본 정책
+    """
+
+    def choose(self, game, player, target):
+        cards = game.cards  # 필드 크기에 맞는 룩업 (난투는 필드가 넓다)
+        direction = 1 if target.x > player.x else -1
+        rel = (target.x - player.x) * direction + cards.span
+
+        best = None
+        for card in player.basic_cards + player.special_cards:
+            cid = card.cid
+            if cards.hits[cid][rel] and cards.damage[cid]:
+                if best is None or cards.damage[cid] > cards.damage[best.cid]:
+                    best = card
+        if best is not None:
+            return best, direction
+
+        if not player.cc.fixed and target.x != player.x:
+            for card in player.basic_cards + player.special_cards:
+                if cards.is_move[card.cid]:
+                    return card, direction
+
+        return super().choose(game, player, target)
+
+
+BOTS = {
+    "chase": ChaseBot,
+    "random": RandomBot,
+    "greedy": GreedyBot,
+}
+
+
+# ---------------------------
+# 헤드리스 러너
+# ---------------------------
+class HeadlessBoxingRunner:
+    """
+    렌더링 없이 BoxingGame을 봇 두 개로 끝까지 돌린다.
+    - bot1: P1 정책, bot2: P2 정책 (BoxingGame.AI 인스턴스)
+    - max_turns: 서로 안 맞는 게임이 무한히 돌지 않도록 턴 상한
+    """
+
+    def __init__(self, bot1=None, bot2=None, max_turns=200, seed=None):
+        self.rng = random.Random(seed)
+        self.bot1 = bot1 or ChaseBot(self.rng)
+        self.bot2 = bot2 or ChaseBot(self.rng)
+        self.max_turns = max_turns
+        self.record = False  # True면 결과에 "replay" (시작 상태 + 턴별 카드) 포함
+
+    def play_one(self):
+        """한 게임 진행 후 BoxingGUI.run()과 같은 형태의 결과 dict 반환"""
+        game = BoxingGame(self.rng)
+        game.setup()
+        game.p1.ai = self.bot1
+        game.p2.ai = self.bot2
+        # 밸런스 분석용: 시작 스페셜 카드, 첫 턴 카드
+        p1_hand = [c.name for c in game.p1.special_cards]
+        p2_hand = [c.name for c in game.p2.special_cards]
+        opening = None
+        start = game.snapshot() if self.record else None
+
+        while not game.game_over and game.turn < self.max_turns:
+            card1, dir1 = self.bot1.choose(game, game.p1, game.p2)
+            game.p1.use_card(card1)
+            card2, dir2 = self.bot2.choose(game, game.p2, game.p1)
+            game.p2.use_card(card2)
+            if opening is None:
+                opening = (card1.name, card2.name)
+            game.resolve_turn(
+                BoxingGame.Action(game.p1, card1, dir1),
+                BoxingGame.Action(game.p2, card2, dir2),
+            )
+
+        result = {
+            "game_over": game.game_over,
+            "winner": game.winner,
+            "p1_hp": game.p1.hp,
+            "p2_hp": game.p2.hp,
+            "turns": game.turn,
+            "p1_hand": p1_hand,
+            "p2_hand": p2_hand,
+            "opening": opening,
+        }
+        if self.record:
+            result["replay"] = {"start": start, "turns": game.actions}
+        return result
+
+    def run(self, games):
+        """games판을 연달아 돌리고 승패 집계 + 초당 게임 수를 반환"""
+        wins = {"P1": 0, "P2": 0, None: 0}
+        unfinished = 0
+        total_turns = 0
+
+        start = time.perf_counter()
+        for _ in range(games):
+            res = self.play_one()
+            if res["game_over"]:
+                wins[res["winner"]] += 1
+            else:
+                unfinished += 1
+            total_turns += res["turns"]
+        elapsed = time.perf_counter() - start
+
+        return {
+            "games": games,
+            "p1_wins": wins["P1"],
+            "p2_wins": wins["P2"],
+            "draws": wins[None],
+            "unfinished": unfinished,
+            "avg_turns": total_turns / games if games else 0.0,
+            "elapsed": elapsed,
+            "games_per_sec": games / elapsed if elapsed > 0 else float("inf"),
+        }
+
+
+def make_bot(name, rng):
+    return BOTS[name](rng)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="헤드리스 복싱 봇 대전 / 부하 테스트")
+    parser.add_argument("--games", type=int, default=10000)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--p1", choices=sorted(BOTS), default="chase")
+    parser.add_argument("--p2", choices=sorted(BOTS), default="chase")
+    parser.add_argument("--max-turns", type=int, default=200)
+    args = parser.parse_args()
+
+    runner = HeadlessBoxingRunner(max_turns=args.max_turns, seed=args.seed)
+    runner.bot1 = make_bot(args.p1, runner.rng)
+    runner.bot2 = make_bot(args.p2, runner.rng)
+    stats = runner.run(args.games)
+    print(
+        f"{stats['games']}판 / {stats['elapsed']:.2f}s "
+        f"({stats['games_per_sec']:.0f} games/s) "
+        f"P1 {stats['p1_wins']} / P2 {stats['p2_wins']} / 무승부 {stats['draws']} "
+        f"/ 미종료 {stats['unfinished']} / 평균 {stats['avg_turns']:.1f}턴"
+    )
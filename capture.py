@@ -0,0 +1,304 @@
+# capture.py
+"""
+화면 프레임 → 공유 메모리 링 버퍼 → 별도 녹화 프로세스.
+
+게임 쪽 (FrameCapture)
+  Display가 flip할 때마다 화면 surface의 픽셀 버퍼(get_buffer)를 링의 빈 슬롯에 memcpy 한 번으로 복사.
+  (image.save / tostring처럼 bytes 객체를 만들지 않음)
+  링이 꽉 차 있으면 (녹화 쪽이 밀림) 그 프레임은 버리고 dropped만 센다 → 게임 루프는 절대 안 기다림.
+녹화 쪽 (python capture.py NAME --out frames/ | --ffmpeg match.mp4)
+  링에서 프레임을 꺼내 PNG 시퀀스로 저장하거나 ffmpeg stdin에 raw 프레임으로 넘긴다.
+  1초마다 처리량 / 밀린 프레임 / 버린 프레임을 출력.
+
+링 구조 (단일 생산자 / 단일 소비자, 락 없음)
+  헤더(int64) + 슬롯 n개. write_seq는 게임만, read_seq는 녹화 쪽만 쓴다.
+  슬롯 write_seq % n에 다 복사한 뒤 write_seq 증가, 다 쓴 뒤 read_seq 증가
+  → write_seq - read_seq < n 인 동안은 읽는 중인 슬롯을 덮어쓰지 않는다.
+"""
+import argparse
+import os
+import struct
+import subprocess
+import sys
+import time
+from multiprocessing import shared_memory
+
+MAGIC = 0x43424652  # "CBFR"
+
+# 헤더 필드 (int64 인덱스)
+_MAGIC, _WIDTH, _HEIGHT, _PITCH, _BYTESIZE, _SLOTS = 0, 1, 2, 3, 4, 5
+_WRITE, _READ, _DROPPED, _CLOSED = 6, 7, 8, 9
+_RMASK, _GMASK, _BMASK = 10, 11, 12
+_STAMPS = 16  # 여기부터 슬롯마다 기록 시각(ns)
+
+
+def _header_bytes(slots):
+    return (_STAMPS + slots) * 8 + 63 & ~63  # 슬롯 시작을 64바이트 정렬
+
+
+class FrameRing:
+    """공유 메모리 링 (생성은 FrameCapture, 붙기는 attach)"""
+
+    def __init__(self, shm, created):
+        self.shm = shm
+        self.created = created
+        slots = struct.unpack_from("q", shm.buf, _SLOTS * 8)[0]
+        self.header = h = shm.buf[: _header_bytes(slots)].cast("q")
+        self.width, self.height, self.pitch = h[_WIDTH], h[_HEIGHT], h[_PITCH]
+        self.slots = h[_SLOTS]
+        self.frame_bytes = self.pitch * self.height
+        base = _header_bytes(self.slots)
+        self.frames = [
+            shm.buf[base + i * self.frame_bytes: base + (i + 1) * self.frame_bytes]
+            for i in range(self.slots)
+        ]
+
+    @classmethod
+    def create(cls, name, surface, slots):
+        pitch = surface.get_pitch()
+        height = surface.get_height()
+        size = _header_bytes(slots) + slots * pitch * height
+        shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+        h = shm.buf[: _header_bytes(slots)].cast("q")
+        h[_WIDTH], h[_HEIGHT], h[_PITCH] = surface.get_width(), height, pitch
+        h[_BYTESIZE], h[_SLOTS] = surface.get_bytesize(), slots
+        h[_RMASK], h[_GMASK], h[_BMASK] = surface.get_masks()[:3]
+        h[_MAGIC] = MAGIC  # 마지막에 → 녹화 쪽은 이게 보이면 헤더가 다 찬 것
+        h.release()
+        return cls(shm, created=True)
+
+    @classmethod
+    def attach(cls, name):
+        shm = shared_memory.SharedMemory(name=name)
+        if os.name == "posix":
+            # 3.13 전에는 붙기만 한 프로세스도 종료 시 공유 메모리를 지워버린다 → 추적 해제 (정리는 게임 쪽 몫)
+            from multiprocessing import resource_tracker
+            resource_tracker.unregister(shm._name, "shared_memory")
+        if struct.unpack_from("q", shm.buf, 0)[0] != MAGIC:
+            shm.close()
+            raise FileNotFoundError(name)
+        return cls(shm, created=False)
+
+    @property
+    def masks(self):
+        h = self.header
+        return h[_RMASK], h[_GMASK], h[_BMASK], 0
+
+    def close(self):
+        for view in self.frames:
+            view.release()
+        self.frames = []
+        self.header.release()
+        self.shm.close()
+        if self.created:
+            self.shm.unlink()
+
+
+# ---------------------------
+# 게임 쪽
+# ---------------------------
+class FrameCapture:
+    """
+    Display.flip()마다 write(screen). 공유 메모리는 첫 프레임 크기로 그때 만든다.
+    녹화 쪽이 못 따라오면 프레임을 버린다 (dropped) — 게임 루프는 안 기다림.
+    """
+
+    def __init__(self, name="chessboxing-capture", slots=8):
+        self.name = name
+        self.slots = slots
+        self.ring = None
+        self.frames = 0      # 링에 넣은 프레임
+        self.dropped = 0     # 링이 꽉 차서 버린 프레임
+        self.mismatched = 0  # 크기/포맷이 달라서 버린 프레임
+        self.copy_time = 0.0
+
+    def write(self, surface):
+        ring = self.ring
+        if ring is None:
+            ring = self.ring = FrameRing.create(self.name, surface, self.slots)
+        h = ring.header
+        seq = h[_WRITE]
+        if seq - h[_READ] >= ring.slots:
+            self.dropped += 1
+            h[_DROPPED] = self.dropped
+            return False
+        if surface.get_pitch() * surface.get_height() != ring.frame_bytes:
+            if not self.mismatched:
+                print(
+                    f"캡처: 프레임 크기가 {surface.get_size()}로 바뀜 (링은 {ring.width}x{ring.height}) "
+                    f"→ 이후 크기가 다른 프레임은 버림",
+                    file=sys.stderr,
+                )
+            self.mismatched += 1
+            return False
+
+        start = time.perf_counter()
+        slot = seq % ring.slots
+        pixels = surface.get_buffer()  # 복사 없는 픽셀 버퍼 (있는 동안 surface 잠김)
+        with memoryview(pixels) as view:
+            ring.frames[slot][:] = view
+        del pixels
+        h[_STAMPS + slot] = time.monotonic_ns()
+        h[_WRITE] = seq + 1  # 슬롯을 다 채운 뒤에 공개
+        self.copy_time += time.perf_counter() - start
+        self.frames += 1
+        return True
+
+    def stats(self):
+        lag = 0
+        if self.ring is not None:
+            lag = self.ring.header[_WRITE] - self.ring.header[_READ]
+        total = self.frames + self.dropped
+        return {
+            "frames": self.frames,
+            "dropped": self.dropped,
+            "drop_rate": self.dropped / total if total else 0.0,
+            "backlog": lag,
+            "copy_us": self.copy_time / self.frames * 1e6 if self.frames else 0.0,
+        }
+
+    def summary(self):
+        s = self.stats()
+        return (
+            f"캡처 {s['frames']}프레임, 버림 {s['dropped']} ({s['drop_rate']:.1%}), "
+            f"복사 평균 {s['copy_us']:.0f}us"
+        )
+
+    def close(self):
+        """녹화 쪽에 끝났다고 알리고 공유 메모리 해제 (남은 프레임은 녹화 쪽이 다 읽을 때까지 잠깐 기다림)"""
+        if self.ring is None:
+            return
+        h = self.ring.header
+        h[_CLOSED] = 1
+        deadline = time.monotonic() + 2.0
+        while h[_READ] < h[_WRITE] and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.ring.close()
+        self.ring = None
+
+
+def spawn_recorder(name, out=None, ffmpeg=None, fps=60):
+    """녹화 프로세스를 띄운다 (게임과 같은 파이썬, 같은 폴더의 capture.py)"""
+    cmd = [sys.executable, os.path.abspath(__file__), name, "--fps", str(fps)]
+    if ffmpeg:
+        cmd += ["--ffmpeg", ffmpeg]
+    elif out:
+        cmd += ["--out", out]
+    return subprocess.Popen(cmd)
+
+
+# ---------------------------
+# 녹화 쪽
+# ---------------------------
+class PngSink:
+    def __init__(self, ring, out):
+        os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+        import pygame
+        self.pygame = pygame
+        self.out = out
+        os.makedirs(out, exist_ok=True)
+        # 화면과 같은 포맷의 surface 하나를 재사용 (슬롯 → 픽셀 버퍼로 바로 복사)
+        self.frame = pygame.Surface((ring.width, ring.height), 0, 32, ring.masks)
+        if self.frame.get_pitch() != ring.pitch:
+            raise ValueError(f"지원하지 않는 프레임 형식 (pitch {ring.pitch})")
+        self.index = 0
+
+    def write(self, pixels):
+        buf = self.frame.get_buffer()
+        with memoryview(buf) as view:
+            view[:] = pixels
+        del buf
+        self.pygame.image.save(self.frame, os.path.join(self.out, f"frame_{self.index:06d}.png"))
+        self.index += 1
+
+    def close(self):
+        pass
+
+
+class FfmpegSink:
+    PIX_FMTS = {(0xFF0000, 0xFF00, 0xFF): "bgr0", (0xFF, 0xFF00, 0xFF0000): "rgb0"}
+
+    def __init__(self, ring, path, fps):
+        pix_fmt = self.PIX_FMTS.get(ring.masks[:3])
+        if pix_fmt is None or ring.pitch != ring.width * 4:
+            raise ValueError("ffmpeg로 바로 넘길 수 없는 프레임 형식")
+        self.proc = subprocess.Popen(
+            ["ffmpeg", "-loglevel", "error", "-y", "-f", "rawvideo", "-pix_fmt", pix_fmt,
+             "-s", f"{ring.width}x{ring.height}", "-r", str(fps), "-i", "-",
+             "-pix_fmt", "yuv420p", path],
+            stdin=subprocess.PIPE,
+        )
+
+    def write(self, pixels):
+        self.proc.stdin.write(pixels)
+
+    def close(self):
+        self.proc.stdin.close()
+        self.proc.wait()
+
+
+def record(name, sink_factory, wait=10.0, report=1.0, poll=0.002):
+    """링이 닫히고 남은 프레임을 다 쓸 때까지 녹화. (프레임 수, 게임이 버린 프레임 수) 반환"""
+    deadline = time.monotonic() + wait
+    while True:
+        try:
+            ring = FrameRing.attach(name)
+            break
+        except FileNotFoundError:
+            if time.monotonic() > deadline:
+                raise
+            time.sleep(0.05)
+
+    sink = sink_factory(ring)
+    h = ring.header
+    written = 0
+    max_backlog = 0
+    encode = 0.0
+    last = time.monotonic()
+    try:
+        while True:
+            seq = h[_READ]
+            backlog = h[_WRITE] - seq
+            if backlog:
+                max_backlog = max(max_backlog, backlog)
+                start = time.perf_counter()
+                sink.write(ring.frames[seq % ring.slots])
+                encode += time.perf_counter() - start
+                h[_READ] = seq + 1
+                written += 1
+            elif h[_CLOSED]:
+                break
+            else:
+                time.sleep(poll)
+
+            now = time.monotonic()
+            if report and now - last >= report:
+                print(
+                    f"[recorder] {written}프레임, 밀림 최대 {max_backlog}/{ring.slots}, "
+                    f"게임이 버림 {h[_DROPPED]}, 인코딩 평균 {encode / max(1, written) * 1000:.1f}ms",
+                    flush=True,
+                )
+                max_backlog = 0
+                last = now
+        dropped = h[_DROPPED]
+    finally:
+        sink.close()
+        ring.close()
+    return written, dropped
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="공유 메모리 링에서 게임 화면을 받아 녹화")
+    parser.add_argument("name", nargs="?", default="chessboxing-capture", help="공유 메모리 이름")
+    parser.add_argument("--out", default="capture_frames", help="PNG 시퀀스 폴더")
+    parser.add_argument("--ffmpeg", default=None, help="ffmpeg로 인코딩할 동영상 파일 (PNG 대신)")
+    parser.add_argument("--fps", type=int, default=60)
+    parser.add_argument("--wait", type=float, default=30.0, help="게임이 링을 만들 때까지 기다릴 시간(초)")
+    args = parser.parse_args()
+
+    if args.ffmpeg:
+        factory = lambda ring: FfmpegSink(ring, args.ffmpeg, args.fps)
+    else:
+        factory = lambda ring: PngSink(ring, args.out)
+    written, dropped = record(args.name, factory, wait=args.wait)
+    print(f"[recorder] 끝: {written}프레임 저장, 게임 쪽에서 버린 프레임 {dropped}")
@@ -0,0 +1,106 @@
+# checkpoint.py
+"""
+매치 체크포인트 저장/불러오기.
+
+- 체스 보드는 시작 FEN + 수순(UCI)만 저장 → 불러올 때 다시 push (수백 수도 ms 단위)
+  (TrackedBoard면 보드 밖 전체 수순 history에서 → move_stack이 잘려 있어도 매치 전체)
+- 복싱은 BoxingGame.snapshot()의 plain data
+- 저장은 전용 스레드에서 임시 파일 + rename으로 원자적으로. 밀린 요청은 최신 것만 남김
+  → 게임 루프는 dict 하나 넘기고 바로 돌아간다
+"""
+import atexit
+import json
+import os
+import threading
+
+VERSION = 1
+
+
+def encode_board(board):
+    if board is None:
+        return None
+    history = getattr(board, "history", None)
+    if history is not None:
+        return {"root": history.root_fen, "moves": history.uci()}
+    return {
+        "root": board.root().fen(),
+        "moves": " ".join(move.uci() for move in board.move_stack),
+    }
+
+
+def decode_board(data):
+    if data is None:
+        return None
+    import chess  # 이어하기 때만 필요 (시작 시간에서 빼려고 여기서 import)
+    from chess_history import TrackedBoard
+    board = TrackedBoard(data["root"])
+    for uci in data["moves"].split():
+        board.push(chess.Move.from_uci(uci))
+    return board
+
+
+def write_atomic(path, state):
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(state, f, ensure_ascii=False, separators=(",", ":"))
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
+def load(path):
+    with open(path, encoding="utf-8") as f:
+        state = json.load(f)
+    if state.get("version") != VERSION:
+        raise ValueError(f"{path}: 지원하지 않는 체크포인트 버전 {state.get('version')}")
+    return state
+
+
+class CheckpointWriter:
+    """백그라운드 저장 스레드. submit()은 절대 디스크를 기다리지 않는다."""
+
+    def __init__(self, path):
+        self.path = path
+        self.written = 0
+        self._pending = None
+        self._closed = False
+        self._busy = False
+        self._cond = threading.Condition()
+        self._thread = threading.Thread(target=self._loop, name="checkpoint", daemon=True)
+        self._thread.start()
+        atexit.register(self.flush)  # 창 닫기(sys.exit) 등으로 끝나도 마지막 저장은 마무리
+
+    def submit(self, state):
+        with self._cond:
+            self._pending = state  # 아직 못 쓴 이전 요청은 버림 (최신만 의미 있음)
+            self._cond.notify()
+
+    def _loop(self):
+        while True:
+            with self._cond:
+                while self._pending is None and not self._closed:
+                    self._cond.wait()
+                if self._pending is None:
+                    return
+                state, self._pending = self._pending, None
+                self._busy = True
+            try:
+                write_atomic(self.path, state)
+                self.written += 1
+            finally:
+                with self._cond:
+                    self._busy = False
+                    self._cond.notify_all()
+
+    def flush(self):
+        """밀린 저장이 끝날 때까지 대기 (라운드 종료/프로그램 종료 시)"""
+        with self._cond:
+            while self._pending is not None or self._busy:
+                self._cond.wait()
+
+    def close(self):
+        self.flush()
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        self._thread.join()
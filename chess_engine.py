@@ -0,0 +1,612 @@
+# chess_engine.py
+"""
+Stockfish 실행 파일이 없는 컴퓨터(리눅스 서버, CI)용 순수 파이썬 엔진 (python-chess 기반).
+
+ChessGUI.create_engine이 Stockfish를 못 띄우면 대신 이걸 만든다 (CHESSBOXING_ENGINE=python이면 항상).
+Stockfish 파이썬 패키지와 같은 메서드 이름 (set_fen_position / get_best_move / get_top_moves /
+set_depth / get_depth / send_quit_command ...) → 게임, 추측 탐색, 토너먼트 쪽 코드는 그대로.
+
+탐색
+- 반복 심화(iterative deepening): depth 1부터 한 단계씩, move_time(초) 예산이 끝나면 마지막으로
+  끝까지 탐색한 깊이의 수 (다음 깊이가 예산 안에 못 끝날 게 뻔하면 미리 멈춤)
+- 알파베타 + 정지 탐색(잡는 수만) + 체크 연장
+- 치환표(transposition table): 포지션 키 -> (깊이, 경계 종류, 점수, 최선수). Hash(MB)로 크기 제한
+- 수 순서: 치환표 수 → 잡는 수 MVV-LVA → 프로모션 → 킬러 수(깊이마다 2개) → 히스토리 점수
+- 평가: 기물 점수 + 기물-칸 표. 수를 둘 때마다 바뀐 칸만 더하고 빼는 증분 평가 (되돌릴 땐 스택에서 복원)
+
+탐색 끊기 (stop / reset_stop, SearchStop): 다른 스레드(UI, 추측 탐색 취소)에서 부른다.
+PyEngine과 StockfishEngine(Stockfish 패키지 + stop)이 같은 규칙으로 구현 → 부르는 쪽은 엔진 종류를 안 가린다.
+
+python chess_engine.py --bench → 벤치마크 포지션마다 도달 깊이 / 노드 수 / 초당 노드(NPS)
+"""
+import argparse
+import threading
+import time
+
+import chess
+from stockfish import Stockfish
+
+INF = 10 ** 7
+MATE = 100000
+MATE_BOUND = MATE - 1000  # 이보다 크면 메이트 점수
+
+EXACT, LOWER, UPPER = 0, 1, 2
+
+PIECE_VALUES = (0, 100, 320, 330, 500, 900, 0)  # piece_type으로 인덱스
+
+# 기물-칸 표 (white 기준, 8랭크부터 한 줄씩 — 흔히 쓰는 "Simplified Evaluation Function" 값)
+_PST = {
+    chess.PAWN: (
+        0, 0, 0, 0, 0, 0, 0, 0,
+        50, 50, 50, 50, 50, 50, 50, 50,
+        10, 10, 20, 30, 30, 20, 10, 10,
+        5, 5, 10, 25, 25, 10, 5, 5,
+        0, 0, 0, 20, 20, 0, 0, 0,
+        5, -5, -10, 0, 0, -10, -5, 5,
+        5, 10, 10, -20, -20, 10, 10, 5,
+        0, 0, 0, 0, 0, 0, 0, 0,
+    ),
+    chess.KNIGHT: (
+        -50, -40, -30, -30, -30, -30, -40, -50,
+        -40, -20, 0, 0, 0, 0, -20, -40,
+        -30, 0, 10, 15, 15, 10, 0, -30,
+        -30, 5, 15, 20, 20, 15, 5, -30,
+        -30, 0, 15, 20, 20, 15, 0, -30,
+        -30, 5, 10, 15, 15, 10, 5, -30,
+        -40, -20, 0, 5, 5, 0, -20, -40,
+        -50, -40, -30, -30, -30, -30, -40, -50,
+    ),
+    chess.BISHOP: (
+        -20, -10, -10, -10, -10, -10, -10, -20,
+        -10, 0, 0, 0, 0, 0, 0, -10,
+        -10, 0, 5, 10, 10, 5, 0, -10,
+        -10, 5, 5, 10, 10, 5, 5, -10,
+        -10, 0, 10, 10, 10, 10, 0, -10,
+        -10, 10, 10, 10, 10, 10, 10, -10,
+        -10, 5, 0, 0, 0, 0, 5, -10,
+        -20, -10, -10, -10, -10, -10, -10, -20,
+    ),
+    chess.ROOK: (
+        0, 0, 0, 0, 0, 0, 0, 0,
+        5, 10, 10, 10, 10, 10, 10, 5,
+        -5, 0, 0, 0, 0, 0, 0, -5,
+        -5, 0, 0, 0, 0, 0, 0, -5,
+        -5, 0, 0, 0, 0, 0, 0, -5,
+        -5, 0, 0, 0, 0, 0, 0, -5,
+        -5, 0, 0, 0, 0, 0, 0, -5,
+        0, 0, 0, 5, 5, 0, 0, 0,
+    ),
+    chess.QUEEN: (
+        -20, -10, -10, -5, -5, -10, -10, -20,
+        -10, 0, 0, 0, 0, 0, 0, -10,
+        -10, 0, 5, 5, 5, 5, 0, -10,
+        -5, 0, 5, 5, 5, 5, 0, -5,
+        0, 0, 5, 5, 5, 5, 0, -5,
+        -10, 5, 5, 5, 5, 5, 0, -10,
+        -10, 0, 5, 0, 0, 0, 0, -10,
+        -20, -10, -10, -5, -5, -10, -10, -20,
+    ),
+    chess.KING: (
+        -30, -40, -40, -50, -50, -40, -40, -30,
+        -30, -40, -40, -50, -50, -40, -40, -30,
+        -30, -40, -40, -50, -50, -40, -40, -30,
+        -30, -40, -40, -50, -50, -40, -40, -30,
+        -20, -30, -30, -40, -40, -30, -30, -20,
+        -10, -20, -20, -20, -20, -20, -20, -10,
+        20, 20, 0, 0, 0, 0, 20, 20,
+        20, 30, 10, 0, 0, 10, 30, 20,
+    ),
+}
+
+# SQUARE_VALUE[color][piece_type][square] -> white 기준 점수 (black 기물은 음수)
+# 표는 8랭크부터라서 white는 square ^ 56, black은 뒤집은 칸이라 square 그대로
+SQUARE_VALUE = [[None] * 7 for _ in range(2)]
+for _pt, _table in _PST.items():
+    SQUARE_VALUE[chess.WHITE][_pt] = tuple(PIECE_VALUES[_pt] + _table[sq ^ 56] for sq in chess.SQUARES)
+    SQUARE_VALUE[chess.BLACK][_pt] = tuple(-(PIECE_VALUES[_pt] + _table[sq]) for sq in chess.SQUARES)
+
+
+def evaluate(board):
+    """white 기준 점수 전체 계산 (증분 평가의 시작값 / 검증용)"""
+    score = 0
+    for square, piece in board.piece_map().items():
+        score += SQUARE_VALUE[piece.color][piece.piece_type][square]
+    return score
+
+
+class _Timeout(Exception):
+    pass
+
+
+# ---------------------------
+# 탐색 끊기 (엔진 공통)
+# ---------------------------
+class SearchStop:
+    """
+    다른 스레드에서 부르는 stop()의 순서 처리.
+    - 탐색 중이면 바로 끊는다
+    - 아직 탐색 시작 전이면 기억해 뒀다가 다음 탐색이 시작되자마자 끊는다
+      (탐색을 맡긴 직후에 온 stop이 "go"보다 먼저 가서 사라지지 않도록)
+    - 탐색 없이 끝난 작업(추측 적중 등)에 보낸 stop은 그 작업을 기다린 뒤 reset_stop()으로 버린다
+    엔진은 _interrupt(진행 중인 탐색 끊기)를 구현하고, 탐색 시작은 _start_search, 끝은 _finish_search로 알린다.
+    """
+
+    def _init_stop(self):
+        self._stop_lock = threading.Lock()
+        self._searching = False
+        self._stop_pending = False
+
+    def stop(self):
+        """진행 중인 (없으면 다음) 탐색을 끊는다 → 지금까지의 최선수를 돌려줌"""
+        with self._stop_lock:
+            if self._searching:
+                self._interrupt()
+            else:
+                self._stop_pending = True
+
+    def reset_stop(self):
+        """아직 안 쓰인 stop을 버린다"""
+        with self._stop_lock:
+            self._stop_pending = False
+
+    def _start_search(self, go):
+        """go()로 탐색 시작. stop과 같은 락 안에서 → stop은 항상 시작 뒤에 닿는다"""
+        with self._stop_lock:
+            go()
+            self._searching = True
+            if self._stop_pending:
+                self._stop_pending = False
+                self._interrupt()
+
+    def _finish_search(self):
+        with self._stop_lock:
+            self._searching = False
+
+    def _interrupt(self):
+        raise NotImplementedError
+
+
+class StockfishEngine(SearchStop, Stockfish):
+    """
+    Stockfish 패키지 + 다른 스레드에서 부를 수 있는 stop().
+    패키지의 _put은 보내기 전에 isready를 주고받느라 stdout을 읽는다 → 탐색 스레드가 bestmove를
+    읽는 중에 쓰면 출력이 섞인다. 그래서 "stop"은 stdin에 바로 쓰고, "go"와는 SearchStop 락으로 순서를 맞춘다.
+    """
+
+    def __init__(self, *args, **kwargs):
+        self._init_stop()
+        super().__init__(*args, **kwargs)
+
+    def get_best_move(self, wtime=None, btime=None):
+        if wtime is not None or btime is not None:
+            self._start_search(lambda: self._go_remaining_time(wtime, btime))
+        else:
+            self._start_search(self._go)
+        try:
+            return self._get_best_move_from_sf_popen_process(self.get_best_move)
+        finally:
+            self._finish_search()
+
+    def _interrupt(self):
+        stdin = self._stockfish.stdin
+        if stdin and self._stockfish.poll() is None:
+            stdin.write("stop\n")
+            stdin.flush()
+
+
+class PyEngine(SearchStop):
+    """
+    Stockfish 대신 쓰는 엔진.
+    - depth: 최대 탐색 깊이 (Stockfish의 depth와 같은 뜻, 보통 시간 예산이 먼저 끝난다)
+    - move_time: 수 하나에 쓸 시간(초). None이면 depth까지 끝까지
+    - parameters: {"Hash": MB} (Threads 등 나머지는 무시)
+    """
+
+    TT_ENTRIES_PER_MB = 4000  # 엔트리 하나가 대략 250바이트 (튜플 + 키)
+
+    def __init__(self, depth=10, move_time=1.0, parameters=None):
+        self.depth = depth
+        self.move_time = move_time
+        self.board = chess.Board()
+        self.tt = {}
+        self.tt_limit = 16 * self.TT_ENTRIES_PER_MB
+        self.update_engine_parameters(parameters or {})
+
+        self.nodes = 0
+        self.info = {}  # 마지막 탐색: depth / nodes / time / nps / score / pv
+        self._init_stop()
+        self._stop = False
+        self._deadline = None
+        self._score = 0       # 증분 평가 (white 기준)
+        self._scores = []
+        self._keys = []       # 탐색 경로의 포지션 키 (반복 판정)
+        self._killers = []
+        self._history = {}
+
+    # ---------------------------
+    # Stockfish 호환 인터페이스
+    # ---------------------------
+    def set_fen_position(self, fen_position, send_ucinewgame_token=True):
+        # 치환표는 포지션 키 기준이라 새 게임이어도 그대로 둔다 (다음 라운드 워밍에도 쓰임)
+        self.board = chess.Board(fen_position)
+
+    def get_fen_position(self):
+        return self.board.fen()
+
+    def make_moves_from_current_position(self, moves):
+        for uci in moves:
+            self.board.push_uci(uci)
+
+    def is_move_correct(self, move_value):
+        try:
+            return chess.Move.from_uci(move_value) in self.board.legal_moves
+        except ValueError:
+            return False
+
+    def set_depth(self, depth=2):
+        self.depth = depth
+
+    def get_depth(self):
+        return self.depth
+
+    def update_engine_parameters(self, parameters):
+        if parameters and "Hash" in parameters:
+            self.tt_limit = max(1, int(parameters["Hash"])) * self.TT_ENTRIES_PER_MB
+
+    def get_best_move(self, wtime=None, btime=None):
+        budget = self.move_time
+        remaining = wtime if self.board.turn == chess.WHITE else btime
+        if remaining is not None:
+            budget = min(budget or INF, remaining / 1000 / 20)  # 남은 시간의 1/20
+        move, _ = self.think(self.depth, budget)
+        return move.uci() if move else None
+
+    def get_best_move_time(self, time=1000):
+        move, _ = self.think(64, time / 1000)
+        return move.uci() if move else None
+
+    def get_evaluation(self):
+        move, score = self.think(self.depth, self.move_time)
+        if self.board.turn == chess.BLACK:
+            score = -score
+        if abs(score) > MATE_BOUND:
+            plies = MATE - abs(score)
+            return {"type": "mate", "value": (plies + 1) // 2 * (1 if score > 0 else -1)}
+        return {"type": "cp", "value": score}
+
+    def get_top_moves(self, num_top_moves=5):
+        """MultiPV 대용: 치환표를 채운 뒤 루트 수마다 점수를 매겨 상위 n개"""
+        board = self.board
+        if not any(board.generate_legal_moves()):
+            return []
+        # 시간 예산 절반은 치환표 채우기, 절반은 루트 수 점수 매기기
+        budget = self.move_time / 2 if self.move_time else None
+        self.think(max(1, self.depth - 1), budget)
+        depth = max(1, self.info["depth"])  # 예산 안에 끝난 깊이로 루트 수마다 (치환표 덕에 빠름)
+        start = time.perf_counter()
+        self.board = board.copy(stack=False)
+        self._begin(budget)
+        scored = []
+        try:
+            for move in self._ordered(list(self.board.generate_legal_moves()), None, 0):
+                self._make(move)
+                score = -self._search(depth - 1, -INF, INF, 1)
+                self._unmake()
+                scored.append((score, move))
+        except _Timeout:
+            self._unwind()
+        finally:
+            self.board = board
+            self.info = self._end(start)
+        scored.sort(key=lambda s: -s[0])
+        sign = 1 if board.turn == chess.WHITE else -1
+        top = []
+        for score, move in scored[:num_top_moves]:
+            mate = None
+            if abs(score) > MATE_BOUND:
+                mate = (MATE - abs(score) + 1) // 2 * (1 if score * sign > 0 else -1)
+            top.append({"Move": move.uci(), "Centipawn": None if mate else score * sign, "Mate": mate})
+        return top
+
+    def _interrupt(self):
+        self._stop = True
+
+    def send_quit_command(self):
+        self._stop = True
+        self.tt.clear()
+
+    # ---------------------------
+    # 탐색
+    # ---------------------------
+    def think(self, depth, move_time):
+        """반복 심화. (최선수, 두는 쪽 기준 점수) — 수가 없으면 (None, 0)"""
+        root = self.board
+        moves = list(root.generate_legal_moves())
+        if not moves:
+            return None, 0
+        start = time.perf_counter()
+        self.board = root.copy(stack=False)
+        self._begin(move_time)
+        best_move, best_score = moves[0], 0
+        completed = 0
+        try:
+            if len(moves) == 1:
+                return moves[0], 0  # 둘 수가 하나면 탐색할 필요 없음
+            for d in range(1, depth + 1):
+                iteration = time.perf_counter()
+                try:
+                    score, move = self._root(d, moves)
+                except _Timeout as stopped:
+                    # 이번 깊이에서 이미 더 좋은 수를 찾았으면 그걸 쓴다 (이전 최선수를 먼저 탐색하므로 안전)
+                    if stopped.args and stopped.args[0] is not None:
+                        best_score, best_move = stopped.args
+                    break
+                best_score, best_move, completed = score, move, d
+                if abs(score) > MATE_BOUND:
+                    break
+                if self._deadline is not None:
+                    now = time.perf_counter()
+                    # 다음 깊이는 보통 이번 깊이보다 몇 배 걸린다 → 예산 안에 못 끝날 것 같으면 여기서
+                    if now + (now - iteration) * 3 > self._deadline:
+                        break
+        finally:
+            self.board = root
+            self.info = self._end(start, completed, best_score, best_move)
+        return best_move, best_score
+
+    def _begin(self, move_time):
+        self.nodes = 0
+        self._start_search(self._go)
+        self._deadline = time.perf_counter() + move_time if move_time else None
+        self._score = evaluate(self.board)
+        self._scores = []
+        self._keys = [self.board._transposition_key()]
+        self._killers = [[None, None] for _ in range(128)]
+        # 히스토리 점수는 탐색마다 절반으로 (오래된 정보 비중 낮추기)
+        self._history = {k: v >> 1 for k, v in self._history.items() if v > 1}
+        if len(self.tt) > self.tt_limit:
+            self.tt.clear()
+
+    def _go(self):
+        self._stop = False
+
+    def _end(self, start, depth=0, score=0, move=None):
+        self._finish_search()
+        elapsed = time.perf_counter() - start
+        return {
+            "depth": depth,
+            "nodes": self.nodes,
+            "time": elapsed,
+            "nps": self.nodes / elapsed if elapsed > 0 else 0.0,
+            "score": score,
+            "move": move.uci() if move else None,
+        }
+
+    def _check(self):
+        if self._stop or (self._deadline is not None and time.perf_counter() > self._deadline):
+            raise _Timeout()
+
+    def _unwind(self):
+        """탐색 도중 끊겼을 때 보드/평가 스택을 루트까지 되돌린다"""
+        while self.board.move_stack:
+            self._unmake()
+
+    def _root(self, depth, moves):
+        alpha = -INF
+        best_move = None
+        tt_move = self.tt.get(self._keys[0], (0, 0, 0, None))[3]
+        try:
+            for move in self._ordered(moves, tt_move, 0):
+                self._make(move)
+                if best_move is None:
+                    score = -self._search(depth - 1, -INF, -alpha, 1)
+                else:
+                    # 첫 수 뒤로는 좁은 창으로 먼저 확인하고, 더 좋아 보일 때만 다시 탐색 (PVS)
+                    score = -self._search(depth - 1, -alpha - 1, -alpha, 1)
+                    if score > alpha:
+                        score = -self._search(depth - 1, -INF, -alpha, 1)
+                self._unmake()
+                if score > alpha:
+                    alpha, best_move = score, move
+        except _Timeout:
+            self._unwind()
+            # 이 깊이의 첫 수(이전 깊이 최선수)를 끝까지 본 경우에만 부분 결과를 넘긴다
+            raise _Timeout(alpha, best_move) if best_move is not None else _Timeout()
+        self.tt[self._keys[0]] = (depth, EXACT, alpha, best_move)
+        return alpha, best_move
+
+    def _search(self, depth, alpha, beta, ply):
+        self.nodes += 1
+        if not self.nodes & 1023:
+            self._check()
+        board = self.board
+        key = self._keys[-1]
+
+        # 50수 / 반복 → 무승부
+        if board.halfmove_clock >= 100:
+            return 0
+        window = min(board.halfmove_clock, len(self._keys) - 1)
+        if window >= 4 and key in self._keys[-window - 1:-1]:
+            return 0
+
+        entry = self.tt.get(key)
+        tt_move = None
+        if entry is not None:
+            e_depth, flag, e_score, tt_move = entry
+            if e_depth >= depth:
+                # 메이트 점수는 "루트까지의 거리"가 아니라 "이 노드에서의 거리"로 저장돼 있음
+                if e_score > MATE_BOUND:
+                    e_score -= ply
+                elif e_score < -MATE_BOUND:
+                    e_score += ply
+                if flag == EXACT:
+                    return e_score
+                if flag == LOWER and e_score >= beta:
+                    return e_score
+                if flag == UPPER and e_score <= alpha:
+                    return e_score
+
+        in_check = board.is_check()
+        if in_check:
+            depth += 1  # 체크 연장
+        if depth <= 0:
+            return self._quiesce(alpha, beta, ply)
+
+        moves = list(board.generate_legal_moves())
+        if not moves:
+            return -MATE + ply if in_check else 0
+
+        alpha0 = alpha
+        best, best_move = -INF, None
+        for move in self._ordered(moves, tt_move, ply):
+            self._make(move)
+            score = -self._search(depth - 1, -beta, -alpha, ply + 1)
+            self._unmake()
+            if score > best:
+                best, best_move = score, move
+                if score > alpha:
+                    alpha = score
+                    if alpha >= beta:
+                        if ply < len(self._killers) and not self._is_capture(move) and not move.promotion:
+                            killers = self._killers[ply]
+                            if killers[0] != move:
+                                killers[1], killers[0] = killers[0], move
+                            hkey = (board.turn, move.from_square, move.to_square)
+                            self._history[hkey] = self._history.get(hkey, 0) + depth * depth
+                        break
+
+        flag = UPPER if best <= alpha0 else LOWER if best >= beta else EXACT
+        stored = best + ply if best > MATE_BOUND else best - ply if best < -MATE_BOUND else best
+        self.tt[key] = (depth, flag, stored, best_move)
+        return best
+
+    def _quiesce(self, alpha, beta, ply):
+        self.nodes += 1
+        if not self.nodes & 1023:
+            self._check()
+        board = self.board
+        stand = self._score if board.turn == chess.WHITE else -self._score
+        if stand >= beta:
+            return stand
+        if stand > alpha:
+            alpha = stand
+        for move in self._ordered(list(board.generate_legal_captures()), None, ply, captures_only=True):
+            self._make(move)
+            score = -self._quiesce(-beta, -alpha, ply + 1)
+            self._unmake()
+            if score >= beta:
+                return score
+            if score > alpha:
+                alpha = score
+        return alpha
+
+    # ---------------------------
+    # 수 순서 / 수 두기 (증분 평가)
+    # ---------------------------
+    def _is_capture(self, move):
+        return self.board.piece_type_at(move.to_square) is not None or self.board.is_en_passant(move)
+
+    def _ordered(self, moves, tt_move, ply, captures_only=False):
+        board = self.board
+        piece_type_at = board.piece_type_at
+        killers = self._killers[ply] if ply < len(self._killers) else (None, None)
+        history = self._history
+        turn = board.turn
+
+        def priority(move):
+            if move == tt_move:
+                return 10 ** 8
+            victim = piece_type_at(move.to_square)
+            if victim is None and board.is_en_passant(move):
+                victim = chess.PAWN
+            if victim is not None:
+                # MVV-LVA: 비싼 기물을, 싼 기물로 잡는 수부터
+                return 10 ** 7 + PIECE_VALUES[victim] * 10 - PIECE_VALUES[piece_type_at(move.from_square)] // 10
+            if move.promotion:
+                return 9 * 10 ** 6 + PIECE_VALUES[move.promotion]
+            if captures_only:
+                return 0
+            if move == killers[0]:
+                return 8 * 10 ** 6
+            if move == killers[1]:
+                return 8 * 10 ** 6 - 1
+            return history.get((turn, move.from_square, move.to_square), 0)
+
+        moves.sort(key=priority, reverse=True)
+        return moves
+
+    def _make(self, move):
+        board = self.board
+        turn = board.turn
+        them = not turn
+        fr, to = move.from_square, move.to_square
+        piece_type = board.piece_type_at(fr)
+        values = SQUARE_VALUE[turn]
+
+        # 바뀌는 칸만 반영 (white 기준)
+        delta = values[move.promotion or piece_type][to] - values[piece_type][fr]
+        victim = board.piece_type_at(to)
+        if victim is not None:
+            delta -= SQUARE_VALUE[them][victim][to]
+        elif piece_type == chess.PAWN and to == board.ep_square:
+            captured = to - 8 if turn == chess.WHITE else to + 8
+            delta -= SQUARE_VALUE[them][chess.PAWN][captured]
+        elif piece_type == chess.KING and abs(to - fr) == 2:
+            # 캐슬링: 룩도 이동
+            if to > fr:
+                rook_from, rook_to = to + 1, to - 1
+            else:
+                rook_from, rook_to = to - 2, to + 1
+            rook = values[chess.ROOK]
+            delta += rook[rook_to] - rook[rook_from]
+
+        self._scores.append(self._score)
+        self._score += delta
+        board.push(move)
+        self._keys.append(board._transposition_key())
+
+    def _unmake(self):
+        self.board.pop()
+        self._keys.pop()
+        self._score = self._scores.pop()
+
+
+# ---------------------------
+# 벤치마크
+# ---------------------------
+def bench(move_time=1.0, depth=64, fens=None, hash_mb=64, log=print):
+    """포지션마다 move_time초 탐색 → [(fen, info)]"""
+    if fens is None:
+        from engine_profile import BENCH_FENS
+        fens = BENCH_FENS
+    engine = PyEngine(depth=depth, move_time=move_time, parameters={"Hash": hash_mb})
+    results = []
+    for fen in fens:
+        engine.set_fen_position(fen)
+        engine.get_best_move()
+        info = engine.info
+        results.append((fen, info))
+        log(f"  depth {info['depth']:2d}  {info['nodes']:8d} nodes  {info['time']:5.2f}s  "
+            f"{info['nps']:8.0f} nps  best {info['move']}  ({fen})")
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="순수 파이썬 체스 엔진 (Stockfish 대체) / NPS 벤치마크")
+    parser.add_argument("--bench", action="store_true", help="벤치마크 포지션 탐색")
+    parser.add_argument("--fen", default=None, help="이 포지션의 최선수")
+    parser.add_argument("--move-time", type=float, default=1.0, help="수당 탐색 시간(초)")
+    parser.add_argument("--depth", type=int, default=64, help="최대 깊이")
+    parser.add_argument("--hash", type=int, default=64, help="치환표 크기(MB)")
+    args = parser.parse_args()
+
+    if args.fen:
+        engine = PyEngine(depth=args.depth, move_time=args.move_time, parameters={"Hash": args.hash})
+        engine.set_fen_position(args.fen)
+        print(engine.get_best_move(), engine.info)
+    else:
+        results = bench(args.move_time, args.depth, hash_mb=args.hash)
+        nodes = sum(info["nodes"] for _, info in results)
+        elapsed = sum(info["time"] for _, info in results)
+        print(f"전체 {nodes} nodes / {elapsed:.2f}s → {nodes / elapsed:.0f} nps, "
+              f"평균 depth {sum(info['depth'] for _, info in results) / len(results):.1f}")
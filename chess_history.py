@@ -0,0 +1,289 @@
+# chess_history.py
+"""
+긴 매치용 체스 보드.
+
+ChessBoxingManager.current_board는 매치 내내 같은 보드가 라운드를 넘어 이어지므로
+chess.Board의 move_stack이 계속 자란다. chess.Board.is_game_over()는 반복 판정 때
+그 기록 전체를 훑고 (+ 합법 수 생성) GUI는 이걸 프레임마다 여러 번 부른다.
+
+TrackedBoard:
+- Zobrist 키를 push/pop마다 바뀐 칸만 갱신 (polyglot 난수표, en passant는 실제로 가능할 때만)
+- 마지막 비가역 수(폰 이동, 잡기, 캐슬링 권리 손실 ...) 이후 포지션별 등장 횟수만 dict로 유지
+  → 반복 판정 O(1)
+- outcome()은 수를 두거나 물릴 때까지 결과를 캐시 → is_game_over()를 몇 번 부르든 계산은 한 번
+- 매치 전체 수순은 보드 밖 MoveHistory(수당 2바이트)에, 보드 자체의 move_stack은
+  최근 history_window 수만 남긴다 (root()는 잘린 지점 기준이 됨 → 원래 시작은 history.root_fen)
+"""
+from array import array
+
+import chess
+import chess.polyglot
+
+_RANDOM = chess.polyglot.POLYGLOT_RANDOM_ARRAY
+_CASTLING = ((chess.BB_H1, 768), (chess.BB_A1, 769), (chess.BB_H8, 770), (chess.BB_A8, 771))
+_EP = 772
+_TURN = _RANDOM[780]
+
+
+def _piece_bbs(board):
+    return (board.pawns, board.knights, board.bishops, board.rooks, board.queens, board.kings)
+
+
+def _ep_key(board):
+    if board.ep_square is not None and board.has_legal_en_passant():
+        return _RANDOM[_EP + chess.square_file(board.ep_square)]
+    return 0
+
+
+def _castling_key(rights):
+    h = 0
+    for bb, idx in _CASTLING:
+        if rights & bb:
+            h ^= _RANDOM[idx]
+    return h
+
+
+def zobrist_key(board):
+    """처음부터 계산한 Zobrist 키 (TrackedBoard의 증분 키와 같은 값)"""
+    h = 0
+    white = board.occupied_co[chess.WHITE]
+    for i, bb in enumerate(_piece_bbs(board)):
+        for sq in chess.scan_forward(bb & ~white):
+            h ^= _RANDOM[128 * i + sq]
+        for sq in chess.scan_forward(bb & white):
+            h ^= _RANDOM[128 * i + 64 + sq]
+    h ^= _castling_key(board.clean_castling_rights())
+    h ^= _ep_key(board)
+    if board.turn == chess.WHITE:
+        h ^= _TURN
+    return h
+
+
+# ---------------------------
+# 수순 저장 (보드 밖)
+# ---------------------------
+def encode_move(move):
+    return move.from_square | move.to_square << 6 | (move.promotion or 0) << 12
+
+
+def decode_move(code):
+    return chess.Move(code & 63, code >> 6 & 63, code >> 12 or None)
+
+
+class MoveHistory:
+    """시작 FEN + 수당 2바이트짜리 수순"""
+
+    __slots__ = ("root_fen", "moves")
+
+    def __init__(self, root_fen, moves=()):
+        self.root_fen = root_fen
+        self.moves = array("H", moves)
+
+    def __len__(self):
+        return len(self.moves)
+
+    def __iter__(self):
+        return map(decode_move, self.moves)
+
+    def append(self, move):
+        self.moves.append(encode_move(move))
+
+    def pop(self):
+        return decode_move(self.moves.pop())
+
+    def copy(self):
+        return MoveHistory(self.root_fen, self.moves)
+
+    def uci(self):
+        return " ".join(move.uci() for move in self)
+
+
+# ---------------------------
+# 보드
+# ---------------------------
+class TrackedBoard(chess.Board):
+    """chess.Board + 증분 Zobrist 반복 판정 + outcome 캐시 + 보드 밖 전체 수순"""
+
+    HISTORY_WINDOW = 256
+
+    def __init__(self, fen=chess.STARTING_FEN, *, chess960=False, history_window=None):
+        self.history_window = self.HISTORY_WINDOW if history_window is None else history_window
+        self._tracking = False
+        super().__init__(fen, chess960=chess960)
+        self._tracking = True
+        self._reset_tracking()
+
+    # ---- 추적 상태 ----
+    def _reset_tracking(self):
+        """지금 포지션을 새 시작점으로 (수순 없음)"""
+        h = zobrist_key(self)
+        self.zobrist = h
+        self._keys = array("Q", [h])  # 포지션 키 (매치 전체, 수당 8바이트)
+        self._segments = [0]          # 비가역 수 직후 포지션의 _keys 인덱스
+        self._counts = {h: 1}         # 마지막 비가역 수 이후 포지션별 등장 횟수
+        self.history = MoveHistory(self.fen())
+        self._outcome = None
+        self._outcome_valid = False
+
+    def clear_stack(self):
+        # set_fen / reset / set_piece_at 등 포지션을 직접 바꾸는 메서드는 모두 여기를 거친다
+        super().clear_stack()
+        if self._tracking:
+            self._reset_tracking()
+
+    def apply_transform(self, f):
+        super().apply_transform(f)
+        self._reset_tracking()
+
+    def apply_mirror(self):
+        super().apply_mirror()
+        self._reset_tracking()
+
+    def push(self, move):
+        irreversible = self.is_irreversible(move)
+        before = _piece_bbs(self)
+        white_before = self.occupied_co[chess.WHITE]
+        castling_before = self.clean_castling_rights()
+        h = self.zobrist ^ _ep_key(self)
+
+        super().push(move)
+
+        # 바뀐 칸만 XOR (보통 2칸, 캐슬링/앙파상/프로모션도 같은 방식)
+        white = self.occupied_co[chess.WHITE]
+        for i, bb in enumerate(_piece_bbs(self)):
+            old = before[i]
+            if old == bb and (old & white_before) == (bb & white):
+                continue
+            diff = (old & ~white_before) ^ (bb & ~white)
+            while diff:
+                sq = chess.lsb(diff)
+                h ^= _RANDOM[128 * i + sq]
+                diff &= diff - 1
+            diff = (old & white_before) ^ (bb & white)
+            while diff:
+                sq = chess.lsb(diff)
+                h ^= _RANDOM[128 * i + 64 + sq]
+                diff &= diff - 1
+        h ^= _castling_key(castling_before ^ self.clean_castling_rights())
+        h ^= _ep_key(self) ^ _TURN
+        self.zobrist = h
+
+        self._keys.append(h)
+        if irreversible:
+            # 비가역 수 이전 포지션은 다시 나올 수 없으므로 횟수를 새로 센다
+            self._segments.append(len(self._keys) - 1)
+            self._counts = {h: 1}
+        else:
+            self._counts[h] = self._counts.get(h, 0) + 1
+        self.history.append(move)
+        self._outcome_valid = False
+
+        # 보드 자체 기록은 최근 history_window 수만 (2배가 되면 한 번에 잘라서 상각 O(1))
+        window = self.history_window
+        if window and len(self.move_stack) > 2 * window:
+            del self.move_stack[:-window]
+            del self._stack[:-window]
+
+    def pop(self):
+        move = super().pop()
+        h = self._keys.pop()
+        if self._segments[-1] == len(self._keys):
+            # 비가역 수를 물림 → 그 이전 구간 횟수를 다시 센다 (구간은 최대 150수 남짓)
+            self._segments.pop()
+            counts = {}
+            for key in self._keys[self._segments[-1]:]:
+                counts[key] = counts.get(key, 0) + 1
+            self._counts = counts
+        else:
+            n = self._counts[h] - 1
+            if n:
+                self._counts[h] = n
+            else:
+                del self._counts[h]
+        self.zobrist = self._keys[-1]
+        self.history.pop()
+        self._outcome_valid = False
+        return move
+
+    # ---- 복사 ----
+    def copy(self, *, stack=True):
+        board = super().copy(stack=stack)
+        board.history_window = self.history_window
+        if stack is True:
+            board.zobrist = self.zobrist
+            board._keys = array("Q", self._keys)
+            board._segments = list(self._segments)
+            board._counts = dict(self._counts)
+            board.history = self.history.copy()
+        elif stack:
+            board._replay_stack()
+        else:
+            board._reset_tracking()
+        return board
+
+    def root(self):
+        board = super().root()
+        board._reset_tracking()
+        return board
+
+    def _replay_stack(self):
+        """move_stack 시작점부터 다시 두면서 추적 상태를 재계산"""
+        base = chess.Board(None, chess960=self.chess960)
+        if self._stack:
+            self._stack[0].restore(base)
+        else:
+            base = chess.Board(self.fen(), chess960=self.chess960)
+        replay = TrackedBoard(base.fen(), chess960=self.chess960, history_window=0)
+        for move in self.move_stack:
+            replay.push(move)
+        self.zobrist = replay.zobrist
+        self._keys = replay._keys
+        self._segments = replay._segments
+        self._counts = replay._counts
+        self.history = replay.history
+        self._outcome_valid = False
+
+    # ---- 종료 판정 ----
+    def is_repetition(self, count=3):
+        return self._counts.get(self.zobrist, 0) >= count
+
+    def can_claim_threefold_repetition(self):
+        """chess.Board와 같은 판정을 포지션별 횟수로 (잘린 move_stack을 거슬러 올라가지 않음)"""
+        if self.is_repetition(3):
+            return True
+        cached = self._outcome, self._outcome_valid
+        try:
+            for move in self.generate_legal_moves():
+                self.push(move)
+                try:
+                    if self.is_repetition(3):
+                        return True
+                finally:
+                    self.pop()
+            return False
+        finally:
+            self._outcome, self._outcome_valid = cached  # 두고 물렸을 뿐 포지션은 그대로
+
+    def outcome(self, *, claim_draw=False):
+        """chess.Board.outcome과 같은 순서/결과. claim_draw가 아니면 캐시"""
+        if claim_draw:
+            return super().outcome(claim_draw=True)
+        if self._outcome_valid:
+            return self._outcome
+
+        has_moves = any(self.generate_legal_moves())
+        outcome = None
+        if not has_moves and self.is_check():
+            outcome = chess.Outcome(chess.Termination.CHECKMATE, not self.turn)
+        elif self.is_insufficient_material():
+            outcome = chess.Outcome(chess.Termination.INSUFFICIENT_MATERIAL, None)
+        elif not has_moves:
+            outcome = chess.Outcome(chess.Termination.STALEMATE, None)
+        elif self.halfmove_clock >= 150:
+            outcome = chess.Outcome(chess.Termination.SEVENTYFIVE_MOVES, None)
+        elif self.is_repetition(5):
+            outcome = chess.Outcome(chess.Termination.FIVEFOLD_REPETITION, None)
+
+        self._outcome = outcome
+        self._outcome_valid = True
+        return outcome
@@ -0,0 +1,217 @@
+# chess_runner.py
+import random
+import time
+
+import chess
+
+from chess_history import TrackedBoard
+
+
+class RandomMover:
+    """Stockfish와 같은 인터페이스(set_fen_position / get_best_move)로 랜덤 수를 두는 봇"""
+
+    def __init__(self, rng=None):
+        self.rng = rng or random
+        self.board = chess.Board()
+
+    def set_fen_position(self, fen):
+        self.board.set_fen(fen)
+
+    def get_best_move(self):
+        moves = list(self.board.legal_moves)
+        if not moves:
+            return None
+        return self.rng.choice(moves).uci()
+
+    # 탐색이 순간이라 끊을 게 없다 (chess_engine.SearchStop과 같은 인터페이스)
+    def stop(self):
+        pass
+
+    def reset_stop(self):
+        pass
+
+
+class MaterialMover:
+    """
+    Stockfish가 없을 때 쓰는 단순 엔진: 기물 점수만 보는 depth수 알파베타 (같은 점수면 랜덤).
+    set_depth / get_depth가 Stockfish와 같은 이름이라 탐색 깊이로 핸디캡을 줄 수 있다.
+    - nodes: 수마다 탐색할 노드 수 상한 (None이면 depth까지 끝까지).
+      상한이 있으면 depth 1부터 반복 심화하고, 노드가 떨어지면 그 깊이에서 지금까지 본 수 중 최선을 둔다
+      → 깊이와 달리 연속적으로 줄일 수 있는 핸디캡 (debuff_sweep.py)
+    """
+    VALUES = {chess.PAWN: 1, chess.KNIGHT: 3, chess.BISHOP: 3, chess.ROOK: 5, chess.QUEEN: 9, chess.KING: 0}
+    MATE = 1000
+
+    def __init__(self, depth=2, rng=None, nodes=None):
+        self.depth = depth
+        self.nodes = nodes
+        self.rng = rng or random
+        self.board = chess.Board()
+        self._budget = None  # 이번 수에 남은 노드 (None이면 무제한)
+
+    def set_fen_position(self, fen):
+        self.board.set_fen(fen)
+
+    def get_depth(self):
+        return self.depth
+
+    def set_depth(self, depth):
+        self.depth = depth
+
+    def set_nodes(self, nodes):
+        self.nodes = nodes
+
+    # 얕은 탐색이라 끊지 않고 끝까지 (chess_engine.SearchStop과 같은 인터페이스)
+    def stop(self):
+        pass
+
+    def reset_stop(self):
+        pass
+
+    def material(self, board):
+        """두는 쪽 기준 기물 점수"""
+        score = 0
+        for piece in board.piece_map().values():
+            value = self.VALUES[piece.piece_type]
+            score += value if piece.color == board.turn else -value
+        return score
+
+    def ordered(self, board):
+        moves = list(board.legal_moves)
+        moves.sort(key=lambda m: not board.is_capture(m))  # 잡는 수 먼저 (컷이 빨리 남)
+        return moves
+
+    def search(self, board, depth, alpha, beta):
+        if self._budget is not None:
+            if self._budget <= 0:
+                raise _OutOfNodes
+            self._budget -= 1
+        moves = self.ordered(board)
+        if not moves:
+            return -self.MATE if board.is_check() else 0
+        if depth == 0:
+            return self.material(board)
+        for move in moves:
+            board.push(move)
+            score = -self.search(board, depth - 1, -beta, -alpha)
+            board.pop()
+            if score >= beta:
+                return score
+            alpha = max(alpha, score)
+        return alpha
+
+    def get_best_move(self):
+        board = self.board.copy(stack=False)
+        moves = list(board.legal_moves)
+        if not moves:
+            return None
+        self.rng.shuffle(moves)
+        moves.sort(key=lambda m: not board.is_capture(m))
+        if self.nodes is None:
+            return self.search_root(board, moves, self.depth)[0].uci()
+
+        # 노드 상한: 반복 심화, 직전 깊이의 최선 수를 먼저 본다
+        best = moves[0]
+        self._budget = self.nodes
+        try:
+            for depth in range(1, self.depth + 1):
+                moves.remove(best)
+                moves.insert(0, best)
+                best, _ = self.search_root(board, moves, depth)
+        except _OutOfNodes as e:
+            if e.best is not None:
+                best = e.best  # 끊긴 깊이에서 직전 최선 수보다 나은 수를 찾았거나 같은 수
+        finally:
+            self._budget = None
+        return best.uci()
+
+    def search_root(self, board, moves, depth):
+        """(최선 수, 점수). 노드가 떨어지면 지금까지의 최선 수를 담은 _OutOfNodes"""
+        best, best_score = None, -self.MATE - 1
+        for move in moves:
+            board.push(move)
+            try:
+                score = -self.search(board, depth - 1, -self.MATE - 1, -best_score)
+            except _OutOfNodes as e:
+                e.best = best
+                raise
+            finally:
+                board.pop()
+            if score > best_score:
+                best, best_score = move, score
+        return best, best_score
+
+
+class _OutOfNodes(Exception):
+    """MaterialMover 노드 상한에 닿음 (best: 끊긴 깊이에서 끝까지 본 수 중 최선)"""
+    best = None
+
+
+class HeadlessChessRound:
+    """
+    화면 없이 엔진/봇끼리 체스 라운드 하나를 진행 (ChessGUI.run과 같은 결과 dict).
+    - white: 사람 자리(디버프 적용 대상), black: AI 자리
+    - 엔진 호출에 실제로 걸린 시간 + move_cost(가상 고민 시간)를 타이머에서 뺀다
+      → move_cost로 한 라운드에 두는 수를 조절 (기본 1초 → 40초 라운드면 약 40수)
+    """
+
+    def __init__(self, round_time, move_time, debuff=None, board=None,
+                 white=None, black=None, move_cost=1.0):
+        debuff = debuff or {}
+        self.board = board if board is not None else TrackedBoard()
+        self.engines = {chess.WHITE: white, chess.BLACK: black}
+        self.move_cost = move_cost
+
+        # ChessGUI와 같은 규칙: 수당 시간 디버프는 사람(white)에게만
+        human_limit = move_time * debuff.get("move_time_factor", 1.0)
+        self.move_time_limits = {
+            chess.WHITE: human_limit if human_limit > 0 else 0.1,
+            chess.BLACK: move_time,
+        }
+        self.round_time_limit = round_time * debuff.get("round_time_factor", 1.0)
+        self.ply_clock = []  # 수마다 둔 직후 라운드 남은 시간 (ChessGUI와 같음)
+
+    def finish(self, game_over, result, winner):
+        return {
+            "game_over": game_over,
+            "result": result,
+            "winner": winner,
+            "board": self.board,
+            "clock": self.ply_clock,
+        }
+
+    def run(self):
+        board = self.board
+        round_timer = self.round_time_limit
+
+        while True:
+            if board.is_game_over():
+                outcome = board.outcome()
+                winner = None
+                if outcome.winner is True:
+                    winner = "white"
+                elif outcome.winner is False:
+                    winner = "black"
+                return self.finish(True, "checkmate_or_draw", winner)
+
+            side = board.turn
+            engine = self.engines[side]
+            start = time.perf_counter()
+            engine.set_fen_position(board.fen())
+            best_move_uci = engine.get_best_move()
+            spent = time.perf_counter() - start + self.move_cost
+
+            move = chess.Move.from_uci(best_move_uci) if best_move_uci else None
+            if spent >= self.move_time_limits[side] or move not in board.legal_moves:
+                # 수당 시간 초과 (또는 수를 못 냄) → 그 쪽 패배
+                if side == chess.WHITE:
+                    return self.finish(True, "timeout_white", "black")
+                return self.finish(True, "timeout_black", "white")
+
+            round_timer -= spent
+            if round_timer <= 0:
+                # 라운드 전체 시간 초과 → 라운드만 종료 (체스 승패 X)
+                return self.finish(False, "round_timeout", None)
+
+            board.push(move)
+            self.ply_clock.append(round(round_timer, 2))
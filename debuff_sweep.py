@@ -0,0 +1,363 @@
+# debuff_sweep.py
+"""
+복싱 → 체스 디버프 정책(DEBUFF_POLICY) 파라미터 스윕.
+
+정책 상수(크게/작게 졌을 때 수당 시간 배율, HP 차이 기준, 후보 3개 중 적용 개수) 조합마다
+엔진끼리 매치를 헤드리스로 돌려서 사람 자리(white) 점수를 잰다.
+
+매치 하나 = 체스 라운드(--round-plies 수) → 봇끼리 복싱 → 그 결과로 정책이 디버프 결정 → 체스 라운드 ...
+체스가 끝나거나 --max-rounds가 되면 종료 (끝나지 않으면 기물 점수 3점 차 이상이면 승, 아니면 무승부).
+디버프는 white 엔진의 핸디캡으로 모델링
+- move_time_factor f : 수당 탐색 예산 = 기준 예산 x f — 시간 대신 탐색량을 줄임
+  (material: 노드 수 --nodes, stockfish: 수당 ms --move-ms. 깊이는 정수라 0.3/0.5/0.7이 같은 값으로 뭉개짐)
+- blind_side         : 수마다 --blind-blunder 확률로 아무 수나 둔다 (안 보이는 말을 놓침)
+- hide_enemy_pieces  : 수마다 --hide-blunder 확률로 아무 수나 둔다
+엔진은 Stockfish (--engine stockfish) 또는 chess_runner.MaterialMover (--engine material, 기본).
+
+- 작업 = (정책 조합, chunk). 매치마다 seed와 매치 번호로 RNG를 따로 만든다 (복싱 / 디버프 선택 / 실수 / 엔진)
+  → 조합이 달라도 같은 매치는 같은 복싱 결과로 시작한다. 다만 디버프가 달라지면 수가 갈리므로
+    그 뒤의 복싱/실수 난수까지 같지는 않다 (스트림을 나눠서 서로 밀리지 않게 할 뿐)
+- 격자의 배율이 같은 예산으로 반올림되면 (예: --nodes가 너무 작음) 시작 전에 에러
+- 작업 결과는 --cache (JSONL)에 끝나는 대로 한 줄씩 추가. 다시 실행하면 캐시에 있는 작업은 건너뜀
+  → 끊긴 스윕 이어 돌리기, 격자를 넓혀도 겹치는 조합은 재사용
+- 결과: 파라미터마다 값별 승률(다른 파라미터는 평균) + 조합별 전체 표 (.json 또는 .csv)
+
+예) python debuff_sweep.py --heavy 0.3,0.5,0.7 --light 0.5,0.7,0.9 --threshold 1,2,3 --matches 200
+"""
+import argparse
+import csv
+import itertools
+import json
+import multiprocessing
+import os
+import random
+import time
+
+import chess
+
+from box_runner import BOTS, HeadlessBoxingRunner
+from chess_runner import MaterialMover
+from main import DEBUFF_POLICY, debuff_from_boxing
+
+PARAMS = ("heavy_factor", "light_factor", "hp_threshold", "min_debuffs", "max_debuffs")
+
+
+# ---------------------------
+# 조합 / 캐시 키
+# ---------------------------
+def policy_grid(values):
+    """파라미터 -> 값 리스트 → 가능한 정책 dict 전부 (min > max 같은 조합은 뺌)"""
+    names = list(PARAMS)
+    grid = []
+    for combo in itertools.product(*(values[name] for name in names)):
+        policy = dict(zip(names, combo))
+        if policy["min_debuffs"] <= policy["max_debuffs"]:
+            grid.append(policy)
+    return grid
+
+
+def task_key(policy, model, chunk):
+    return json.dumps({"policy": policy, "model": model, "chunk": chunk}, sort_keys=True)
+
+
+def load_cache(path):
+    cache = {}
+    if not path or not os.path.exists(path):
+        return cache
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                continue  # 쓰다 끊긴 마지막 줄
+            cache[entry["key"]] = entry["stats"]
+    return cache
+
+
+# ---------------------------
+# 워커
+# ---------------------------
+_MODEL = None
+_ENGINES = None
+
+
+def make_engine(model):
+    if model["engine"] == "stockfish":
+        from stockfish import Stockfish
+        return Stockfish(path=model["stockfish"], depth=model["depth"], parameters={"Threads": 1, "Hash": 16})
+    return MaterialMover(model["depth"], nodes=model["nodes"])
+
+
+def move_budget(model, factor):
+    """move_time_factor → 수당 탐색 예산 (material: 노드 수, stockfish: ms)"""
+    base = model["nodes"] if model["engine"] == "material" else model["move_ms"]
+    return max(1, round(base * factor))
+
+
+def check_budgets(model, factors):
+    """서로 다른 배율이 같은 예산이 되면 ValueError (그 값들은 비교가 안 됨)"""
+    seen = {}
+    for factor in sorted(set(factors)):
+        budget = move_budget(model, factor)
+        if budget in seen:
+            raise ValueError(f"배율 {seen[budget]}와 {factor}가 같은 탐색 예산 {budget}이 됩니다 — 기준 예산을 늘리세요")
+        seen[budget] = factor
+
+
+def init_worker(model):
+    global _MODEL, _ENGINES
+    _MODEL = model
+    _ENGINES = (make_engine(model), make_engine(model))
+
+
+def material_score(board):
+    values = MaterialMover.VALUES
+    return sum(values[p.piece_type] * (1 if p.color == chess.WHITE else -1) for p in board.piece_map().values())
+
+
+def best_move(engine, model, budget):
+    if model["engine"] == "stockfish":
+        return engine.get_best_move_time(budget)
+    engine.set_nodes(budget)
+    return engine.get_best_move()
+
+
+def play_round(board, white, black, debuff, model, rng):
+    """debuff를 white 핸디캡으로 바꿔서 체스 round_plies수 진행 (rng: 실수 전용)"""
+    budgets = {
+        chess.WHITE: move_budget(model, debuff.get("move_time_factor", 1.0)),
+        chess.BLACK: move_budget(model, 1.0),
+    }
+    blunder = 0.0
+    if "blind_side" in debuff:
+        blunder += model["blind_blunder"]
+    if debuff.get("hide_enemy_pieces"):
+        blunder += model["hide_blunder"]
+
+    for _ in range(model["round_plies"]):
+        if board.is_game_over(claim_draw=False):
+            return
+        if board.turn == chess.WHITE and blunder and rng.random() < blunder:
+            board.push(rng.choice(list(board.legal_moves)))
+            continue
+        engine = white if board.turn == chess.WHITE else black
+        engine.set_fen_position(board.fen())
+        board.push_uci(best_move(engine, model, budgets[board.turn]))
+
+
+def play_match(policy, model, match, boxing):
+    """매치 하나 → (white 점수 1/0.5/0, 디버프 받은 라운드 수, 라운드 수)"""
+    white, black = _ENGINES
+    # 용도마다 따로 시드 → 한 쪽에서 난수를 더 뽑아도 다른 쪽 순서는 그대로
+    seed = f"{model['seed']}:{match}"
+    boxing.rng.seed(f"{seed}:boxing")  # 봇들도 같은 rng를 쓴다
+    debuff_rng = random.Random(f"{seed}:debuff")
+    blunder_rng = random.Random(f"{seed}:blunder")
+    if hasattr(white, "rng"):
+        for i, engine in enumerate(_ENGINES):
+            engine.rng = random.Random(f"{seed}:engine{i}")
+    board = chess.Board()
+    debuff = {}
+    debuffed = 0
+    rounds = 0
+    while rounds < model["max_rounds"]:
+        rounds += 1
+        debuffed += bool(debuff)
+        play_round(board, white, black, debuff, model, blunder_rng)
+        if board.is_game_over(claim_draw=False):
+            break
+        debuff = debuff_from_boxing(boxing.play_one(), debuff_rng, policy)
+
+    outcome = board.outcome(claim_draw=False)
+    if outcome is not None:
+        score = 1.0 if outcome.winner is chess.WHITE else 0.0 if outcome.winner is chess.BLACK else 0.5
+    else:
+        diff = material_score(board)
+        score = 1.0 if diff >= 3 else 0.0 if diff <= -3 else 0.5
+    return score, debuffed, rounds
+
+
+def run_task(task):
+    """(정책, chunk) → (캐시 키, 집계)"""
+    policy, chunk = task
+    model = _MODEL
+    boxing = HeadlessBoxingRunner(max_turns=200)
+    boxing.bot1 = BOTS[model["p1"]](boxing.rng)
+    boxing.bot2 = BOTS[model["p2"]](boxing.rng)
+
+    stats = {"matches": 0, "score": 0.0, "wins": 0, "draws": 0, "losses": 0, "debuffed": 0, "rounds": 0}
+    start = chunk * model["chunk_size"]
+    for match in range(start, min(start + model["chunk_size"], model["matches"])):
+        score, debuffed, rounds = play_match(policy, model, match, boxing)
+        stats["matches"] += 1
+        stats["score"] += score
+        stats["wins" if score == 1.0 else "losses" if score == 0.0 else "draws"] += 1
+        stats["debuffed"] += debuffed
+        stats["rounds"] += rounds
+    return task_key(policy, model, chunk), stats
+
+
+# ---------------------------
+# 집계
+# ---------------------------
+def merge(into, stats):
+    for key, value in stats.items():
+        into[key] = into.get(key, 0) + value
+    return into
+
+
+def rate_row(stats):
+    n = stats.get("matches", 0)
+    return {
+        "matches": n,
+        "white_score": stats["score"] / n if n else 0.0,
+        "wins": stats.get("wins", 0),
+        "draws": stats.get("draws", 0),
+        "losses": stats.get("losses", 0),
+        "debuffed_rounds": stats["debuffed"] / stats["rounds"] if stats.get("rounds") else 0.0,
+    }
+
+
+def surface(grid, per_policy):
+    """파라미터 -> 값 -> 승률 (그 값을 쓴 조합 전부 합산)"""
+    out = {}
+    for name in PARAMS:
+        values = {}
+        for policy, stats in zip(grid, per_policy):
+            merge(values.setdefault(policy[name], {}), stats)
+        if len(values) > 1:
+            out[name] = {str(v): rate_row(s) for v, s in sorted(values.items())}
+    return out
+
+
+def write_results(path, summary):
+    if path.endswith(".csv"):
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            w = csv.writer(f)
+            w.writerow(list(PARAMS) + ["matches", "white_score", "wins", "draws", "losses", "debuffed_rounds"])
+            for row in summary["policies"]:
+                w.writerow([row["policy"][name] for name in PARAMS] + [
+                    row["matches"], f"{row['white_score']:.4f}", row["wins"], row["draws"],
+                    row["losses"], f"{row['debuffed_rounds']:.4f}",
+                ])
+    else:
+        tmp = path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(summary, f, ensure_ascii=False, indent=1)
+        os.replace(tmp, path)
+
+
+def run_sweep(grid, model, workers=None, cache_path=None, progress=True):
+    """정책 조합 전부를 스윕하고 요약 dict 반환"""
+    n_chunks = (model["matches"] + model["chunk_size"] - 1) // model["chunk_size"]
+    cache = load_cache(cache_path)
+    tasks = [(policy, c) for policy in grid for c in range(n_chunks)]
+    pending = [t for t in tasks if task_key(t[0], model, t[1]) not in cache]
+    if progress:
+        print(f"조합 {len(grid)}개 x chunk {n_chunks}개 = 작업 {len(tasks)}개 (캐시 {len(tasks) - len(pending)}개)")
+
+    start = time.perf_counter()
+    if pending:
+        out = open(cache_path, "a", encoding="utf-8") if cache_path else None
+        try:
+            with multiprocessing.Pool(workers, initializer=init_worker, initargs=(model,)) as pool:
+                for done, (key, stats) in enumerate(pool.imap_unordered(run_task, pending), 1):
+                    cache[key] = stats
+                    if out is not None:
+                        out.write(json.dumps({"key": key, "stats": stats}) + "\n")
+                        out.flush()
+                    if progress and (done % max(1, len(pending) // 20) == 0 or done == len(pending)):
+                        rate = done / (time.perf_counter() - start)
+                        print(f"  {done}/{len(pending)} 작업 ({rate:.2f} 작업/s)")
+        finally:
+            if out is not None:
+                out.close()
+
+    per_policy = []
+    for policy in grid:
+        stats = {}
+        for c in range(n_chunks):
+            merge(stats, cache[task_key(policy, model, c)])
+        per_policy.append(stats)
+    rows = [{"policy": p, **rate_row(s)} for p, s in zip(grid, per_policy)]
+    rows.sort(key=lambda r: r["white_score"])
+    return {
+        "model": model,
+        "surface": surface(grid, per_policy),
+        "policies": rows,
+        "elapsed": time.perf_counter() - start,
+    }
+
+
+def parse_values(text, cast):
+    return [cast(v) for v in text.split(",") if v.strip()]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="디버프 정책 파라미터 스윕 (엔진끼리 체스, 멀티코어)")
+    parser.add_argument("--heavy", default=str(DEBUFF_POLICY["heavy_factor"]), help="heavy_factor 값들 (쉼표)")
+    parser.add_argument("--light", default=str(DEBUFF_POLICY["light_factor"]), help="light_factor 값들")
+    parser.add_argument("--threshold", default=str(DEBUFF_POLICY["hp_threshold"]), help="hp_threshold 값들")
+    parser.add_argument("--min-debuffs", default=str(DEBUFF_POLICY["min_debuffs"]))
+    parser.add_argument("--max-debuffs", default=str(DEBUFF_POLICY["max_debuffs"]))
+    parser.add_argument("--matches", type=int, default=100, help="조합마다 매치 수")
+    parser.add_argument("--chunk-size", type=int, default=10)
+    parser.add_argument("--engine", choices=("material", "stockfish"), default="material")
+    parser.add_argument("--stockfish", default=None, help="엔진 경로 (기본: ChessGUI.STOCKFISH_PATH)")
+    parser.add_argument("--depth", type=int, default=None, help="최대 탐색 깊이 (기본: material 3, stockfish 8)")
+    parser.add_argument("--nodes", type=int, default=300, help="material 엔진의 기준 수당 노드 수 (배율이 곱해짐)")
+    parser.add_argument("--move-ms", type=int, default=100, help="stockfish 엔진의 기준 수당 ms (배율이 곱해짐)")
+    parser.add_argument("--round-plies", type=int, default=40, help="체스 라운드 하나의 수 (양쪽 합)")
+    parser.add_argument("--max-rounds", type=int, default=6)
+    parser.add_argument("--blind-blunder", type=float, default=0.10)
+    parser.add_argument("--hide-blunder", type=float, default=0.15)
+    parser.add_argument("--p1", choices=sorted(BOTS), default="chase")
+    parser.add_argument("--p2", choices=sorted(BOTS), default="chase")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=None, help="기본: 모든 코어")
+    parser.add_argument("--cache", default="debuff_sweep.cache.jsonl", help="작업 결과 캐시 (이어 돌리기)")
+    parser.add_argument("--out", default="debuff_sweep.json", help=".json 또는 .csv")
+    args = parser.parse_args()
+
+    stockfish = None
+    if args.engine == "stockfish":
+        stockfish = args.stockfish
+        if stockfish is None:
+            from ChessGame import ChessGUI
+            stockfish = ChessGUI.STOCKFISH_PATH
+    model = {
+        "engine": args.engine,
+        "stockfish": stockfish,
+        "depth": args.depth or (8 if args.engine == "stockfish" else 3),
+        "nodes": args.nodes,
+        "move_ms": args.move_ms,
+        "round_plies": args.round_plies,
+        "max_rounds": args.max_rounds,
+        "blind_blunder": args.blind_blunder,
+        "hide_blunder": args.hide_blunder,
+        "p1": args.p1,
+        "p2": args.p2,
+        "seed": args.seed,
+        "matches": args.matches,
+        "chunk_size": args.chunk_size,
+    }
+    grid = policy_grid({
+        "heavy_factor": parse_values(args.heavy, float),
+        "light_factor": parse_values(args.light, float),
+        "hp_threshold": parse_values(args.threshold, int),
+        "min_debuffs": parse_values(args.min_debuffs, int),
+        "max_debuffs": parse_values(args.max_debuffs, int),
+    })
+    try:
+        check_budgets(model, [1.0] + [p[name] for p in grid for name in ("heavy_factor", "light_factor")])
+    except ValueError as e:
+        parser.error(str(e))
+    summary = run_sweep(grid, model, workers=args.workers, cache_path=args.cache)
+    write_results(args.out, summary)
+
+    for name, values in summary["surface"].items():
+        print(f"\n{name}")
+        for value, row in values.items():
+            print(f"  {value:>6}  white 점수 {row['white_score']:.3f}  "
+                  f"({row['wins']}승 {row['draws']}무 {row['losses']}패, 디버프 라운드 {row['debuffed_rounds']:.0%})")
+    print(f"\n{len(grid)}개 조합 → {args.out} ({summary['elapsed']:.1f}s)")
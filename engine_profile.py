@@ -0,0 +1,256 @@
+# engine_profile.py
+"""
+이 컴퓨터에 맞춘 Stockfish 설정 (Threads / Hash / depth / 동시 엔진 수).
+
+python engine_profile.py --autotune
+  → 스레드 수, 해시 크기, 동시 실행 엔진 수를 바꿔가며 벤치마크해서 engine_profile.json에 저장
+python engine_profile.py
+  → 저장된 프로필 출력
+
+프로필은 두 가지
+- interactive: 사람 vs AI (ChessGUI). 엔진 하나의 응답 시간이 기준
+    → 가장 빠른 Threads/Hash, 그리고 응답 시간(p95)이 --move-budget 안에 드는 가장 깊은 depth
+- batch: tournament / match_server처럼 엔진 여러 개를 동시에 돌리는 경우. 전체 처리량이 기준
+    → 초당 탐색 수가 가장 높은 (동시 엔진 수, 엔진당 Threads), depth는 --batch-depth 고정
+- speculate: 추측 탐색(speculation.py)의 여분 엔진. 따로 튜닝하지 않고 interactive에서 유도
+    → depth는 같게 (같은 응수를 내야 하므로), Threads 1 / Hash 1/4 (여분 엔진 여러 개가 메인 엔진과 코어를 나눠 씀)
+
+ChessGUI.create_engine(profile)이 시작할 때 한 번 읽는다. 파일이 없거나 다른 컴퓨터(CPU 수가 다름)에서
+만든 것이면 예전 기본값(Threads 2, Hash 256, depth 10)을 쓰고 동시 엔진 수는 쓰는 쪽 기본값을 따른다.
+파일 위치는 CHESSBOXING_ENGINE_PROFILE로 바꿀 수 있다.
+"""
+import argparse
+import json
+import os
+import statistics
+import threading
+import time
+
+PROFILE_PATH = os.environ.get("CHESSBOXING_ENGINE_PROFILE", "engine_profile.json")
+PROFILES = ("interactive", "batch")
+DEFAULT_PROFILE = {"threads": 2, "hash": 256, "depth": 10, "concurrency": None}  # None: 쓰는 쪽 기본값
+SPECULATE_HASH_DIVISOR = 4
+SPECULATE_MIN_HASH = 16
+
+# 벤치마크 포지션: 시작, 오픈 게임, 복잡한 중반, 엔드게임
+BENCH_FENS = (
+    "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1",
+    "r1bqkbnr/pppp1ppp/2n5/4p3/2B1P3/5N2/PPPP1PPP/RNBQK2R b KQkq - 3 3",
+    "r1bq1rk1/pp2bppp/2n1pn2/2pp4/3P4/2PBPN2/PP1N1PPP/R2QK2R w KQ - 0 8",
+    "8/5pk1/6p1/3P4/2K5/6P1/5P2/8 w - - 0 40",
+)
+
+_cache = None
+_lock = threading.Lock()
+
+
+# ---------------------------
+# 읽기 / 쓰기
+# ---------------------------
+def load_all(path=None):
+    """프로필 파일 전체 (없거나 이 컴퓨터 것이 아니면 {})"""
+    path = path or PROFILE_PATH
+    try:
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError) as e:
+        print(f"엔진 프로필을 읽지 못했습니다 ({path}): {e} → 기본 설정 사용")
+        return {}
+    if data.get("host", {}).get("cpus") != os.cpu_count():
+        print(f"엔진 프로필 {path}은 다른 컴퓨터에서 만든 것 → 기본 설정 사용 (engine_profile.py --autotune)")
+        return {}
+    return data
+
+
+def load(kind="interactive"):
+    """kind 프로필 (threads / hash / depth / concurrency). 파일은 처음 한 번만 읽는다"""
+    global _cache
+    if kind == "speculate":
+        base = load("interactive")
+        return {**base, "threads": 1, "hash": max(SPECULATE_MIN_HASH, base["hash"] // SPECULATE_HASH_DIVISOR)}
+    if kind not in PROFILES:
+        raise ValueError(f"알 수 없는 엔진 프로필: {kind}")
+    with _lock:
+        if _cache is None:
+            _cache = load_all()
+    return {**DEFAULT_PROFILE, **_cache.get(kind, {})}
+
+
+def save(data, path=None):
+    global _cache
+    path = path or PROFILE_PATH
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
+    os.replace(tmp, path)
+    with _lock:
+        _cache = data
+
+
+def engine_parameters(profile):
+    return {"Threads": profile["threads"], "Hash": profile["hash"]}
+
+
+# ---------------------------
+# 벤치마크
+# ---------------------------
+def memory_mb():
+    """물리 메모리(MiB), 모르면 None"""
+    try:
+        return os.sysconf("SC_PAGE_SIZE") * os.sysconf("SC_PHYS_PAGES") // (1 << 20)
+    except (AttributeError, ValueError, OSError):
+        return None
+
+
+def powers_of_two(limit):
+    values = []
+    n = 1
+    while n < limit:
+        values.append(n)
+        n *= 2
+    values.append(limit)
+    return values
+
+
+def time_searches(engine, depth, fens=BENCH_FENS):
+    """포지션마다 depth 탐색 시간(초) 리스트"""
+    engine.set_depth(depth)
+    times = []
+    for fen in fens:
+        engine.set_fen_position(fen)
+        start = time.perf_counter()
+        engine.get_best_move()
+        times.append(time.perf_counter() - start)
+    return times
+
+
+def p95(values):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(0.95 * len(values)))]
+
+
+def tune_interactive(factory, cpus, hash_sizes, base_depth, move_budget, log=print):
+    """엔진 하나의 응답 시간 기준"""
+    results = []
+    for threads in powers_of_two(cpus):
+        for hash_mb in hash_sizes:
+            engine = factory(threads, hash_mb, base_depth)
+            try:
+                time_searches(engine, base_depth, BENCH_FENS[:1])  # 워밍업
+                mean = statistics.mean(time_searches(engine, base_depth))
+            finally:
+                engine.send_quit_command()
+            log(f"  interactive Threads {threads:3d} Hash {hash_mb:5d}MB → 평균 {mean * 1000:7.1f}ms")
+            results.append((mean, threads, hash_mb))
+
+    # 5% 안쪽 차이면 스레드/메모리를 덜 쓰는 쪽 (pygame, 추측 탐색용 여분 엔진 몫)
+    best = min(r[0] for r in results)
+    _, threads, hash_mb = min((r for r in results if r[0] <= best * 1.05), key=lambda r: (r[1], r[2]))
+
+    # 응답 시간 예산 안에 드는 가장 깊은 depth
+    engine = factory(threads, hash_mb, base_depth)
+    try:
+        depth = base_depth
+        latency = p95(time_searches(engine, depth))
+        while latency > move_budget and depth > 1:
+            depth -= 1
+            latency = p95(time_searches(engine, depth))
+        while depth < 30:
+            deeper = p95(time_searches(engine, depth + 1))
+            if deeper > move_budget:
+                break
+            depth, latency = depth + 1, deeper
+    finally:
+        engine.send_quit_command()
+    log(f"  interactive depth {depth} → p95 {latency * 1000:.1f}ms (예산 {move_budget * 1000:.0f}ms)")
+    return {"threads": threads, "hash": hash_mb, "depth": depth, "concurrency": 1, "latency": latency}
+
+
+def tune_batch(factory, cpus, hash_budget, depth, rounds=2, log=print):
+    """동시 엔진 여러 개의 전체 처리량(초당 탐색 수) 기준"""
+    best = None
+    for concurrency in powers_of_two(cpus):
+        threads = max(1, cpus // concurrency)
+        hash_mb = max(16, min(256, hash_budget // concurrency))
+        engines = [factory(threads, hash_mb, depth) for _ in range(concurrency)]
+        try:
+            for engine in engines:
+                time_searches(engine, depth, BENCH_FENS[:1])  # 워밍업
+
+            def work(engine):
+                for _ in range(rounds):
+                    time_searches(engine, depth)
+
+            workers = [threading.Thread(target=work, args=(e,)) for e in engines]
+            start = time.perf_counter()
+            for w in workers:
+                w.start()
+            for w in workers:
+                w.join()
+            elapsed = time.perf_counter() - start
+        finally:
+            for engine in engines:
+                engine.send_quit_command()
+        throughput = concurrency * rounds * len(BENCH_FENS) / elapsed
+        log(f"  batch 엔진 {concurrency:3d}개 x Threads {threads:3d} Hash {hash_mb:4d}MB → {throughput:7.1f} 탐색/s")
+        if best is None or throughput > best["throughput"]:
+            best = {"threads": threads, "hash": hash_mb, "depth": depth,
+                    "concurrency": concurrency, "throughput": throughput}
+    return best
+
+
+def autotune(stockfish_path, move_budget=1.0, base_depth=10, batch_depth=10, quick=False, log=print):
+    """이 컴퓨터에서 벤치마크해서 {host, interactive, batch} 반환 (저장은 save)"""
+    from stockfish import Stockfish
+
+    def factory(threads, hash_mb, depth):
+        return Stockfish(path=stockfish_path, depth=depth, parameters={"Threads": threads, "Hash": hash_mb})
+
+    cpus = os.cpu_count() or 1
+    mem = memory_mb()
+    hash_budget = mem // 4 if mem else 1024  # 엔진 해시 전체 합은 물리 메모리의 1/4까지
+    hash_sizes = [h for h in ((64, 256) if quick else (64, 256, 1024)) if h <= hash_budget] or [16]
+    log(f"CPU {cpus}개, 메모리 {mem or '?'}MiB, 엔진 {stockfish_path}")
+
+    interactive = tune_interactive(factory, cpus, hash_sizes, base_depth, move_budget, log=log)
+    batch = tune_batch(factory, cpus, hash_budget, batch_depth, rounds=1 if quick else 2, log=log)
+    return {
+        "host": {
+            "cpus": cpus,
+            "memory_mb": mem,
+            "stockfish": stockfish_path,
+            "tuned_at": time.strftime("%Y-%m-%d %H:%M:%S"),
+        },
+        "interactive": interactive,
+        "batch": batch,
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Stockfish 설정 자동 튜닝 (이 컴퓨터 기준 프로필)")
+    parser.add_argument("--autotune", action="store_true", help="벤치마크 후 프로필 저장")
+    parser.add_argument("--stockfish", default=None, help="엔진 경로 (기본: ChessGUI.STOCKFISH_PATH)")
+    parser.add_argument("--out", default=PROFILE_PATH)
+    parser.add_argument("--move-budget", type=float, default=1.0, help="interactive 응답 시간 목표 p95(초)")
+    parser.add_argument("--depth", type=int, default=10, help="interactive 비교용 기준 depth")
+    parser.add_argument("--batch-depth", type=int, default=10)
+    parser.add_argument("--quick", action="store_true", help="후보를 줄여서 빨리")
+    args = parser.parse_args()
+
+    if args.autotune:
+        path = args.stockfish
+        if path is None:
+            from ChessGame import ChessGUI
+            path = ChessGUI.STOCKFISH_PATH
+        data = autotune(path, args.move_budget, args.depth, args.batch_depth, args.quick)
+        save(data, args.out)
+        print(f"저장: {args.out}")
+
+    data = load_all(args.out)
+    for kind in PROFILES:
+        profile = {**DEFAULT_PROFILE, **data.get(kind, {})}
+        source = "튜닝" if kind in data else "기본값"
+        print(f"{kind:<12}({source}) Threads {profile['threads']} / Hash {profile['hash']}MB "
+              f"/ depth {profile['depth']} / 동시 엔진 {profile['concurrency'] or '기본'}")
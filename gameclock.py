@@ -0,0 +1,52 @@
+# gameclock.py
+import time
+
+
+class GameClock:
+    """
+    time.perf_counter 기반 게임 시간.
+    - steps(): 지난 호출 이후 흐른 시간을 고정 길이(step) 스텝 개수로 돌려준다
+      (남는 자투리는 다음 호출로 이월 → 렌더 프레임 속도와 상관없이 누적 오차 없음)
+    - pause()/resume(): 그 사이 시간은 steps()에 안 잡힌다. resume()이 멈춰 있던 시간을 반환
+      → 엔진 고민 시간처럼 따로 정확히 계산해서 반영할 구간에 사용
+    """
+
+    def __init__(self, step=1 / 120):
+        self.step = step
+        self.elapsed = 0.0  # 지금까지 steps()로 나간 게임 시간
+        self._last = time.perf_counter()
+        self._acc = 0.0
+        self._paused_at = None
+
+    @property
+    def paused(self):
+        return self._paused_at is not None
+
+    def _collect(self, now):
+        self._acc += now - self._last
+        self._last = now
+
+    def pause(self):
+        if self._paused_at is None:
+            now = time.perf_counter()
+            self._collect(now)
+            self._paused_at = now
+
+    def resume(self):
+        """다시 흐르게 하고, 멈춰 있던 시간(초)을 반환"""
+        if self._paused_at is None:
+            return 0.0
+        now = time.perf_counter()
+        paused_for = now - self._paused_at
+        self._paused_at = None
+        self._last = now
+        return paused_for
+
+    def steps(self):
+        """이번 프레임에 시뮬레이션할 스텝 개수"""
+        if self._paused_at is None:
+            self._collect(time.perf_counter())
+        n = int(self._acc / self.step)
+        self._acc -= n * self.step
+        self.elapsed += n * self.step
+        return n
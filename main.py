@@ -1,7 +1,81 @@
 # game_manager.py
+import startup  # 시작 시각 기준점 (다른 import보다 먼저)
+import argparse
+import os
 import random
-from ChessGame import ChessGUI
-from box_GAME import BoxingGUI  # 네가 구현해둔 복싱 GUI
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+with startup.phase("import pygame (scene)"):
+    from scene import Display
+from box2 import BoxingGame
+from box_runner import HeadlessBoxingRunner
+import checkpoint
+import tracing
+
+# 체스(python-chess, stockfish)와 GUI 모듈은 무거워서 필요할 때 import
+# (창 + 스플래시를 먼저 띄우고 나머지는 백그라운드에서 → ChessBoxingManager.boot)
+
+
+_GUI_MODULES = None
+
+
+def load_gui_modules():
+    """ChessGUI, BoxingGUI (처음 부를 때 import)"""
+    global _GUI_MODULES
+    if _GUI_MODULES is None:
+        with startup.phase("import ChessGame (chess)"):
+            from ChessGame import ChessGUI
+        with startup.phase("import box_GAME"):
+            from box_GAME import BoxingGUI  # 네가 구현해둔 복싱 GUI
+        _GUI_MODULES = ChessGUI, BoxingGUI
+    return _GUI_MODULES
+
+
+# 복싱 → 체스 디버프 정책 상수
+DEBUFF_POLICY = {
+    "heavy_factor": 0.5,  # 크게 졌을 때 수당 시간 배율
+    "light_factor": 0.7,  # 작게 졌을 때 수당 시간 배율
+    "hp_threshold": 2,    # HP 차이가 이 이상이면 크게 진 것
+    "min_debuffs": 1,     # 후보 디버프 3개 중 몇 개를 적용할지 (범위)
+    "max_debuffs": 2,
+}
+
+
+def debuff_from_boxing(boxing_result, rng, policy=DEBUFF_POLICY):
+    """복싱 결과 → 다음 체스 라운드 디버프 dict (ChessBoxingManager.compute_debuff_from_boxing 참고)"""
+    winner = boxing_result.get("winner", None)
+    p1_hp = boxing_result.get("p1_hp", 0)
+    p2_hp = boxing_result.get("p2_hp", 0)
+
+    # 사람(P1)이 지지 않으면 디버프 없음
+    if winner != "P2":
+        return {}
+
+    # HP 차이로 얼마나 크게 졌는지 판단
+    hp_diff = max(0, p2_hp - p1_hp)
+
+    debuffs = []
+
+    # 1) 수당 시간 감소 디버프
+    if hp_diff >= policy["hp_threshold"]:
+        debuffs.append({"move_time_factor": policy["heavy_factor"]})
+    else:
+        debuffs.append({"move_time_factor": policy["light_factor"]})
+
+    # 2) 시야 가리기 (왼쪽/오른쪽 말 안 보이게)
+    debuffs.append({"blind_side": rng.choice(["left", "right"])})
+
+    # 3) 상대 말 ? 처리
+    debuffs.append({"hide_enemy_pieces": True})
+
+    # 위 디버프 중 min~max개만 랜덤 적용
+    k = rng.randint(policy["min_debuffs"], min(policy["max_debuffs"], len(debuffs)))
+    chosen = rng.sample(debuffs, k=k)
+
+    merged = {}
+    for d in chosen:
+        merged.update(d)
+    return merged
 
 
 class ChessBoxingManager:
@@ -11,16 +85,56 @@ class ChessBoxingManager:
     - 체스: ChessGUI 사용
     - 복싱: BoxingGUI 사용 (라운드 타이머 없음, 죽으면 끝)
     - 복싱 결과에 따라 다음 체스 라운드에 디버프 부여
+    - boxing_bots=(bot1, bot2)를 주면 복싱은 HeadlessBoxingRunner로 AI끼리 진행
+    - 지금 라운드가 도는 동안 다음 라운드(엔진 워밍, 에셋 디코딩, 복싱 딜링)를 백그라운드에서 준비
+    - checkpoint_path를 주면 라운드 경계마다 (checkpoint_every > 0이면 N수/N턴마다도)
+      체크포인트 저장 → ChessBoxingManager.resume(path)로 이어하기
+    - chess_engines=(white, black)와 boxing_bots를 둘 다 주면 창 없이 AI끼리 매치 전체 진행
+      (라운드별 기록은 self.round_log)
+    - 창 모드 시작은 boot(): 창 + 스플래시 먼저, GUI import/에셋/엔진은 백그라운드
     """
+    # 창 크기: ChessGUI(640x640)와 BoxingGUI(900x600)가 둘 다 들어가는 크기.
+    # 스플래시를 GUI 모듈 import 전에 띄우려고 상수로 둔다 (boot에서 실제 크기와 대조)
+    DISPLAY_SIZE = (900, 640)
+    DEBUFF_POLICY = DEBUFF_POLICY
 
     def __init__(
         self,
         chess_round_time: float = 40.0,  # 체스 한 라운드 전체 시간
         chess_move_time: float = 5.0,    # 한 수당 제한 시간
+        boxing_bots=None,                # (P1 봇, P2 봇) or None(사람이 GUI로)
+        checkpoint_path=None,            # 체크포인트 파일 (None이면 저장 안 함)
+        checkpoint_every: int = 0,       # 라운드 중에도 N수/N턴마다 저장 (0이면 라운드 경계만)
+        chess_engines=None,              # (white 엔진, black 엔진) or None(사람 vs Stockfish GUI)
+        chess_move_cost: float = 1.0,    # 헤드리스 체스에서 한 수마다 차감할 가상 고민 시간
+        max_rounds=None,                 # 라운드 상한 (None이면 체스가 끝날 때까지)
+        rng=None,                        # 디버프/헤드리스 복싱 딜링용 (None이면 random 모듈)
+        log=print,                       # 진행 로그 출력 함수
+        speculate: int = 0,              # 사람 수 상위 N개에 대한 AI 응수를 미리 계산 (0이면 끔)
+        capture=None,                    # capture.FrameCapture (창 프레임을 공유 메모리 링으로)
+        record_replay: bool = False,     # 라운드별 수순/복싱 카드를 self.replay에 기록 (replay.py로 렌더링)
+        render_thread: bool = False,     # 창 scene의 로직/렌더를 스레드로 분리 (Display(threaded=True))
     ):
         # 체스 설정
         self.chess_round_time = chess_round_time
         self.chess_move_time = chess_move_time
+        self.chess_engines = chess_engines
+        self.chess_move_cost = chess_move_cost
+
+        # 복싱 설정
+        self.boxing_bots = boxing_bots
+
+        # 매치 전체에서 공유하는 창 (첫 GUI 라운드에서 생성)
+        self.display = None
+        self.capture = capture
+        self.render_thread = render_thread
+
+        # 다음 라운드 백그라운드 준비 (작업 순서가 보장되도록 워커 1개)
+        self.preloader = ThreadPoolExecutor(max_workers=1, thread_name_prefix="preload")
+        self._engine_future = None  # 체스 엔진 (생성 → 라운드마다 워밍, 매치 내내 재사용)
+        self._boxing_future = None  # 다음 BoxingGUI (손패 딜링까지 끝난 상태)
+        self.speculate = speculate
+        self.speculator = None      # 여분 엔진으로 응수 추측 (첫 GUI 체스 라운드에서 생성)
 
         # 현재 체스 포지션 (None이면 새 게임)
         self.current_board = None
@@ -28,10 +142,29 @@ class ChessBoxingManager:
         # 다음 체스 라운드에 적용할 디버프 (dict)
         self.next_chess_debuff = {}
 
+        # 진행 위치 (체크포인트/이어하기용)
+        self.round_index = 1
+        self.phase = "chess"  # "chess" or "boxing"
+
+        # 체크포인트
+        self.checkpoint_every = checkpoint_every
+        self.checkpoint_writer = checkpoint.CheckpointWriter(checkpoint_path) if checkpoint_path else None
+        self._resume_round_time = None  # 중간에 끊긴 체스 라운드의 남은 시간
+        self._resume_boxing = None      # 중간에 끊긴 복싱 라운드 상태
+
         # 전체 게임 종료 여부
         self.game_over = False
         self.final_winner = None  # "white" or "black" or None(무승부)
 
+        self.max_rounds = max_rounds
+        self.rng = rng or random
+        self.log = log
+        self.round_log = []  # [{"round", "chess", "boxing", "debuff"}]
+        self.replay = None
+        if record_replay:
+            from replay import ReplayRecorder
+            self.replay = ReplayRecorder(chess_round_time, chess_move_time)
+
     # ------------------------------
     # 디버프 생성 로직
     # ------------------------------
@@ -41,57 +174,210 @@ class ChessBoxingManager:
         - P1 = 사람(white), P2 = AI(black) 라고 가정
         - 복싱에서 P1이 패배하면: 사람에게 불리한 디버프 부여
         - P2가 패배하거나 무승부면: 디버프 없음 (필요하면 반대로도 줄 수 있음)
+        - 상수는 DEBUFF_POLICY (debuff_sweep.py로 승률 비교)
         """
-        winner = boxing_result.get("winner", None)
-        p1_hp = boxing_result.get("p1_hp", 0)
-        p2_hp = boxing_result.get("p2_hp", 0)
+        return debuff_from_boxing(boxing_result, self.rng, self.DEBUFF_POLICY)
 
-        # 사람(P1)이 지지 않으면 디버프 없음
-        if winner != "P2":
-            return {}
+    # ------------------------------
+    # 창 관리
+    # ------------------------------
+    def get_display(self) -> Display:
+        """체스/복싱 scene이 함께 쓰는 창. 두 scene이 다 들어가는 크기로 한 번만 만든다."""
+        if self.display is None:
+            with startup.phase("pygame.init + set_mode"):
+                self.display = Display(self.DISPLAY_SIZE, "ChessBoxing", threaded=self.render_thread)
+            self.display.capture = self.capture
+        return self.display
 
-        # HP 차이로 얼마나 크게 졌는지 판단
-        hp_diff = max(0, p2_hp - p1_hp)
+    def boot(self):
+        """
+        창 모드 시작 순서:
+        1) 창 + 스플래시 (pygame 기본 폰트만) → 첫 프레임
+        2) 백그라운드: GUI 모듈 import → 체스 에셋 → 엔진 → 복싱 에셋
+        3) 첫 체스 라운드에 필요한 것(import, 체스 에셋)만 기다린다.
+           엔진은 첫 AI 수 직전까지, 복싱 에셋은 복싱 라운드까지 계속 백그라운드에서.
+        """
+        display = self.get_display()
+        display.show_splash("ChessBoxing")
+        startup.mark("first_frame")
 
-        debuffs = []
+        modules = self.preloader.submit(load_gui_modules)
+        chess_assets = self.preload_chess_assets()
+        if not self.chess_engines:
+            self.preload_chess_round()
+        self.preload_boxing_assets()
+        display.wait_for([modules, chess_assets], "ChessBoxing")
 
-        # 1) 수당 시간 감소 디버프
-        if hp_diff >= 2:
-            debuffs.append({"move_time_factor": 0.5})  # 50%
-        else:
-            debuffs.append({"move_time_factor": 0.7})  # 70%
+        ChessGUI, BoxingGUI = modules.result()
+        for scene in (ChessGUI, BoxingGUI):
+            if scene.SIZE[0] > self.DISPLAY_SIZE[0] or scene.SIZE[1] > self.DISPLAY_SIZE[1]:
+                raise ValueError(f"{scene.__name__}.SIZE {scene.SIZE}가 창 크기 {self.DISPLAY_SIZE}보다 큽니다")
+        startup.mark("ready")
+
+    def close(self):
+        self.preloader.shutdown(wait=True)
+        # 매치 동안 재사용한 엔진 프로세스 종료 (안 하면 매니저마다 Stockfish가 하나씩 남는다)
+        engine_future, self._engine_future = self._engine_future, None
+        if (
+            engine_future is not None
+            and engine_future.done()
+            and not engine_future.cancelled()
+            and engine_future.exception() is None
+        ):
+            engine = engine_future.result()
+            if hasattr(engine, "send_quit_command"):
+                engine.send_quit_command()
+        if self.speculator is not None:
+            self.speculator.close()
+            self.speculator = None
+        if self.checkpoint_writer is not None:
+            self.checkpoint_writer.close()
+        if self.display is not None:
+            self.display.close()
+            self.display = None
+
+    # ------------------------------
+    # 체크포인트
+    # ------------------------------
+    def save_checkpoint(self, board=None, round_timer=None, boxing_game=None):
+        """
+        현재 매치 상태를 plain data로 만들어 저장 스레드에 넘긴다 (디스크는 안 기다림).
+        board/round_timer: 진행 중인 체스 라운드, boxing_game: 진행 중인 복싱 라운드
+        """
+        if self.checkpoint_writer is None:
+            return
+        self.checkpoint_writer.submit({
+            "version": checkpoint.VERSION,
+            "settings": {
+                "chess_round_time": self.chess_round_time,
+                "chess_move_time": self.chess_move_time,
+            },
+            "round_index": self.round_index,
+            "phase": self.phase,
+            "game_over": self.game_over,
+            "final_winner": self.final_winner,
+            "next_chess_debuff": self.next_chess_debuff,
+            "board": checkpoint.encode_board(board if board is not None else self.current_board),
+            "chess_round_timer": round_timer,
+            "boxing": boxing_game.snapshot() if boxing_game is not None else None,
+        })
 
-        # 2) 시야 가리기 (왼쪽/오른쪽 말 안 보이게)
-        debuffs.append({"blind_side": random.choice(["left", "right"])})
+    def _on_chess_ply(self, gui):
+        # TrackedBoard의 move_stack은 최근 수만 남기고 잘린다 → 전체 수순(history) 길이로 센다
+        board = gui.board
+        if len(getattr(board, "history", board.move_stack)) % self.checkpoint_every == 0:
+            self.save_checkpoint(board=gui.board, round_timer=gui.round_timer)
 
-        # 3) 상대 말 ? 처리
-        debuffs.append({"hide_enemy_pieces": True})
+    def _on_boxing_turn(self, gui):
+        if gui.game.turn % self.checkpoint_every == 0 and not gui.game.game_over:
+            self.save_checkpoint(boxing_game=gui.game)
+
+    @classmethod
+    def resume(cls, path, **kwargs):
+        """체크포인트 파일에서 매니저를 복구. 이후 main_loop(resume=True)로 이어서 진행"""
+        state = checkpoint.load(path)
+        kwargs.setdefault("checkpoint_path", path)
+        manager = cls(**state["settings"], **kwargs)
+        manager.round_index = state["round_index"]
+        manager.phase = state["phase"]
+        manager.game_over = state["game_over"]
+        manager.final_winner = state["final_winner"]
+        manager.next_chess_debuff = state["next_chess_debuff"]
+        manager.current_board = checkpoint.decode_board(state["board"])
+        manager._resume_round_time = state["chess_round_timer"]
+        manager._resume_boxing = state["boxing"]
+        return manager
+
+    # ------------------------------
+    # 다음 라운드 미리 준비
+    # ------------------------------
+    def preload_chess_assets(self):
+        assets = self.get_display().assets
 
-        # 위 디버프 중 1~2개만 랜덤 적용
-        k = random.randint(1, 2)
-        chosen = random.sample(debuffs, k=k)
+        def load():
+            ChessGUI, _ = load_gui_modules()
+            with startup.phase("preload chess assets"):
+                ChessGUI.preload(assets)
+        return self.preloader.submit(load)
 
-        merged = {}
-        for d in chosen:
-            merged.update(d)
-        return merged
+    def preload_boxing_assets(self):
+        assets = self.get_display().assets
+
+        def load():
+            _, BoxingGUI = load_gui_modules()
+            with startup.phase("preload boxing assets"):
+                BoxingGUI.preload(assets)
+        return self.preloader.submit(load)
+
+    def preload_chess_round(self):
+        """처음엔 엔진 생성, 이후엔 현재 포지션으로 엔진 해시 워밍"""
+        if self._engine_future is None:
+            def create():
+                ChessGUI, _ = load_gui_modules()
+                with startup.phase("create engine"):
+                    return ChessGUI.create_engine()
+            self._engine_future = self.preloader.submit(create)
+            return
+        prev = self._engine_future
+        board = self.current_board.copy() if self.current_board is not None else None
+        self._engine_future = self.preloader.submit(
+            lambda: load_gui_modules()[0].warm_engine(prev.result(), board)
+        )
+
+    def preload_boxing_round(self):
+        """다음 복싱 라운드 BoxingGUI를 만들어 손패까지 딜링해둔다"""
+        if not self.boxing_bots and self._boxing_future is None:
+            self._boxing_future = self.preloader.submit(lambda: load_gui_modules()[1]())
 
     # ------------------------------
     # 라운드 실행 함수들
     # ------------------------------
+    @tracing.traced("chess_round", "round")
     def run_chess_round(self):
         """
         체스 라운드를 한 번 실행하고 결과(dict)를 반환.
         - self.current_board / self.next_chess_debuff 를 사용/업데이트한다.
         """
+        if self._engine_future is None and not self.chess_engines:
+            self.preload_chess_round()
+        round_time = self.chess_round_time
+        if self._resume_round_time is not None:
+            round_time, self._resume_round_time = self._resume_round_time, None
+        if self.chess_engines:
+            from chess_runner import HeadlessChessRound
+            white, black = self.chess_engines
+            result = HeadlessChessRound(
+                round_time=round_time,
+                move_time=self.chess_move_time,
+                debuff=self.next_chess_debuff,
+                board=self.current_board,
+                white=white,
+                black=black,
+                move_cost=self.chess_move_cost,
+            ).run()
+            return self._finish_chess_round(result)
+
+        ChessGUI, _ = load_gui_modules()
+        if self.speculate and self.speculator is None:
+            from speculation import Speculator
+            # 여분 엔진은 가벼운 프로필 (Threads 1, 해시 작게) — 메인 엔진과 같은 depth
+            self.speculator = Speculator(partial(ChessGUI.create_engine, "speculate"), top_n=self.speculate)
         gui = ChessGUI(
-            round_time=self.chess_round_time,
+            round_time=round_time,
             move_time=self.chess_move_time,
             debuff=self.next_chess_debuff,
             board=self.current_board,
+            engine=self._engine_future,  # 아직 준비 중이면 첫 AI 수에서 기다림
+            speculator=self.speculator,
         )
-        result = gui.run()
+        if self.checkpoint_writer is not None and self.checkpoint_every > 0:
+            gui.on_ply = self._on_chess_ply
+        result = gui.run(self.get_display())
+        if self.speculator is not None:
+            self.log("응수 추측:", self.speculator.summary())
+        return self._finish_chess_round(result)
 
+    def _finish_chess_round(self, result):
         # 체스 포지션 저장 (항상 유지)
         self.current_board = result["board"]
 
@@ -102,13 +388,39 @@ class ChessBoxingManager:
 
         return result
 
+    @tracing.traced("boxing_round", "round")
     def run_boxing_round(self):
         """
         복싱 라운드를 한 번 실행하고 결과(dict)를 반환.
         -> BoxingGUI는 라운드 타이머 없이, 누군가 쓰러질 때까지 진행된다고 가정.
+        -> boxing_bots가 있으면 화면 없이 봇끼리 바로 진행.
         """
-        gui = BoxingGUI()
-        result = gui.run()
+        resume_state, self._resume_boxing = self._resume_boxing, None
+        if self.boxing_bots:
+            # 봇 라운드는 짧으니 중간 상태 복구 없이 새로 진행
+            bot1, bot2 = self.boxing_bots
+            runner = HeadlessBoxingRunner(bot1, bot2, seed=self.rng.getrandbits(64))
+            runner.record = self.replay is not None
+            result = runner.play_one()
+            if self.replay is not None:
+                rec = result.pop("replay")
+                self.replay.boxing_round(self.round_index, rec["start"], rec["turns"], result["winner"])
+            return result
+
+        _, BoxingGUI = load_gui_modules()
+        if resume_state is not None:
+            gui = BoxingGUI(BoxingGame.from_snapshot(resume_state))
+        elif self._boxing_future is not None:
+            gui = self._boxing_future.result()
+            self._boxing_future = None
+        else:
+            gui = BoxingGUI()
+        if self.checkpoint_writer is not None and self.checkpoint_every > 0:
+            gui.on_turn = self._on_boxing_turn
+        start = gui.game.snapshot() if self.replay is not None else None
+        result = gui.run(self.get_display())
+        if self.replay is not None:
+            self.replay.boxing_round(self.round_index, start, gui.game.actions, result.get("winner"))
         # result 예시:
         # {
         #   "winner": "P1" or "P2" or None,
@@ -117,43 +429,151 @@ class ChessBoxingManager:
         # }
         return result
 
+    def boxing_load_test(self, games: int = 10000, seed=None) -> dict:
+        """복싱 라운드를 봇끼리 games판 돌려서 처리량(games_per_sec) 등을 반환"""
+        bot1, bot2 = self.boxing_bots or (None, None)
+        return HeadlessBoxingRunner(bot1, bot2, seed=seed).run(games)
+
     # ------------------------------
     # 메인 루프
     # ------------------------------
-    def main_loop(self):
+    def main_loop(self, resume=False):
         """
         체스 -> 복싱 -> 체스 -> 복싱 ... 반복.
         체스 게임(체크메이트/무승부/타임아웃)이 끝나면 전체 종료.
+        resume=True면 resume()으로 복구한 라운드/단계부터 이어서 진행.
         """
-        round_index = 1
-        self.next_chess_debuff = {}  # 첫 체스 라운드는 디버프 없음
+        if not resume:
+            self.round_index = 1
+            self.phase = "chess"
+            self.next_chess_debuff = {}  # 첫 체스 라운드는 디버프 없음
 
-        while not self.game_over:
-            print(f"=== 체스 라운드 {round_index} 시작 ===")
-            chess_res = self.run_chess_round()
-            print("체스 라운드 결과:", chess_res["result"], "winner:", chess_res["winner"])
+        if not (self.chess_engines and self.boxing_bots):
+            self.boot()
+            if startup.ENABLED:
+                print(startup.report())
 
-            if self.game_over:
-                print("체스 게임 종료! 최종 승자:", self.final_winner)
+        while not self.game_over:
+            if self.max_rounds is not None and self.round_index > self.max_rounds:
+                self.log("라운드 상한 도달:", self.max_rounds)
                 break
 
-            print(f"=== 복싱 라운드 {round_index} 시작 ===")
+            if self.phase == "chess":
+                # 체스 라운드 동안 다음 복싱 준비
+                self.preload_boxing_round()
+                self.save_checkpoint(round_timer=self._resume_round_time)
+
+                self.log(f"=== 체스 라운드 {self.round_index} 시작 ===")
+                mark = self.replay.mark(self.current_board) if self.replay is not None else None
+                chess_res = self.run_chess_round()
+                if self.replay is not None:
+                    self.replay.chess_round(self.round_index, self.next_chess_debuff, mark, chess_res)
+                self.log("체스 라운드 결과:", chess_res["result"], "winner:", chess_res["winner"])
+                self.round_log.append({
+                    "round": self.round_index,
+                    "chess": chess_res["result"],
+                    "debuff": self.next_chess_debuff,
+                })
+
+                if self.game_over:
+                    self.log("체스 게임 종료! 최종 승자:", self.final_winner)
+                    break
+                self.phase = "boxing"
+
+            # 복싱 라운드 동안 다음 체스 엔진 워밍
+            if not self.chess_engines:
+                self.preload_chess_round()
+            if self._resume_boxing is None:
+                self.save_checkpoint()
+
+            self.log(f"=== 복싱 라운드 {self.round_index} 시작 ===")
             boxing_res = self.run_boxing_round()
-            print(
+            self.log(
                 "복싱 라운드 결과: winner:", boxing_res.get("winner"),
                 "HP => P1:", boxing_res.get("p1_hp"), "P2:", boxing_res.get("p2_hp")
             )
+            if self.round_log and self.round_log[-1]["round"] == self.round_index:
+                self.round_log[-1]["boxing"] = boxing_res.get("winner")
 
             # 복싱 결과 기반으로 다음 체스 라운드 디버프 계산
             self.next_chess_debuff = self.compute_debuff_from_boxing(boxing_res)
-            print("다음 체스 라운드 디버프:", self.next_chess_debuff)
+            self.log("다음 체스 라운드 디버프:", self.next_chess_debuff)
+
+            self.round_index += 1
+            self.phase = "chess"
 
-            round_index += 1
+        self.save_checkpoint()
+        self.close()
 
 
 if __name__ == "__main__":
-    manager = ChessBoxingManager(
-        chess_round_time=40.0,  # 한 체스 라운드 최대 40초
-        chess_move_time=5.0,    # 한 수당 5초
-    )
-    manager.main_loop()
+    parser = argparse.ArgumentParser(description="ChessBoxing")
+    parser.add_argument("--checkpoint", default=None, help="체크포인트 파일 (이미 있으면 이어서 진행)")
+    parser.add_argument("--checkpoint-every", type=int, default=0, help="라운드 중 N수/N턴마다 저장")
+    parser.add_argument("--profile-startup", action="store_true",
+                        help="첫 라운드 준비까지만 진행하고 단계별 시작 시간 출력 (예산 초과 시 종료 코드 1)")
+    parser.add_argument("--first-frame-budget", type=float, default=startup.FIRST_FRAME_BUDGET_MS,
+                        help="첫 프레임 예산(ms)")
+    parser.add_argument("--capture", default=None, metavar="NAME",
+                        help="화면 프레임을 이 이름의 공유 메모리 링으로 (python capture.py NAME으로 녹화)")
+    parser.add_argument("--record", default=None, metavar="DIR_OR_MP4",
+                        help="녹화 프로세스를 같이 띄움 (.mp4면 ffmpeg, 아니면 PNG 폴더)")
+    parser.add_argument("--save-replay", default=None, metavar="JSON",
+                        help="매치 리플레이 저장 (python replay.py JSON으로 렌더링)")
+    parser.add_argument("--speculate", type=int, default=0,
+                        help="사람이 고민하는 동안 유력한 수 N개에 대한 AI 응수를 여분 엔진으로 미리 계산")
+    parser.add_argument("--render-thread", action="store_true",
+                        help="scene 로직과 렌더링을 별도 스레드로 (로직이 막혀도 창은 계속 갱신)")
+    args = parser.parse_args()
+
+    if args.profile_startup:
+        startup.FIRST_FRAME_BUDGET_MS = args.first_frame_budget
+        startup.ENABLED = True
+        manager = ChessBoxingManager()
+        manager.boot()
+        if manager._engine_future is not None:
+            manager._engine_future.result()  # 엔진 준비 시간까지 표에 넣기
+            print(startup.report())
+        manager.close()
+        raise SystemExit(0 if startup.within_budget() else 1)
+
+    frame_capture = recorder = manager = None
+    if args.capture or args.record:
+        from capture import FrameCapture, spawn_recorder
+        frame_capture = FrameCapture(args.capture or f"chessboxing-{os.getpid()}")
+        if args.record:
+            video = args.record.lower().endswith((".mp4", ".mkv", ".webm"))
+            recorder = spawn_recorder(
+                frame_capture.name,
+                out=None if video else args.record,
+                ffmpeg=args.record if video else None,
+            )
+
+    try:
+        if args.checkpoint and os.path.exists(args.checkpoint):
+            manager = ChessBoxingManager.resume(
+                args.checkpoint, checkpoint_every=args.checkpoint_every,
+                speculate=args.speculate, capture=frame_capture,
+                record_replay=bool(args.save_replay), render_thread=args.render_thread,
+            )
+            manager.main_loop(resume=True)
+        else:
+            manager = ChessBoxingManager(
+                chess_round_time=40.0,  # 한 체스 라운드 최대 40초
+                chess_move_time=5.0,    # 한 수당 5초
+                checkpoint_path=args.checkpoint,
+                checkpoint_every=args.checkpoint_every,
+                speculate=args.speculate,
+                capture=frame_capture,
+                record_replay=bool(args.save_replay),
+                render_thread=args.render_thread,
+            )
+            manager.main_loop()
+    finally:
+        if manager is not None and manager.replay is not None:
+            manager.replay.save(args.save_replay)
+        if frame_capture is not None:
+            print(frame_capture.summary())
+            frame_capture.close()
+        if recorder is not None:
+            recorder.wait()
@@ -0,0 +1,165 @@
+# match_client.py
+"""
+match_server 부하 테스트 클라이언트.
+
+세션 수백 개를 동시에 열고, 각 세션은 사람 자리를 랜덤 봇으로 채워 매치 끝까지 진행한다.
+(체스: 받은 수순으로 보드를 재구성해서 합법 수 중 랜덤, 복싱: 손패 중 랜덤 카드 + 랜덤 방향)
+행동을 보낸 뒤 다음 state를 받기까지의 응답 시간, 초당 메시지, 완료/실패 세션을 집계.
+
+예) python match_client.py --sessions 300 --round-time 3 --move-time 1 --think 0.05
+"""
+import argparse
+import asyncio
+import json
+import random
+import time
+
+import chess
+
+from match_server import apply_delta, encode
+
+
+def percentile(values, q):
+    if not values:
+        return 0.0
+    values = sorted(values)
+    return values[min(len(values) - 1, int(q * len(values)))]
+
+
+class LoadStats:
+    def __init__(self):
+        self.finished = 0
+        self.failed = 0
+        self.errors = 0  # 서버가 보낸 error 메시지
+        self.messages = 0
+        self.bytes = 0
+        self.latencies = []
+        self.outcomes = {}
+
+
+async def play_session(index, args, stats):
+    rng = random.Random(f"{args.seed}:{index}")
+    if args.unix:
+        reader, writer = await asyncio.open_unix_connection(args.unix)
+    else:
+        reader, writer = await asyncio.open_connection(args.host, args.port)
+
+    writer.write(encode({
+        "op": "new",
+        "round_time": args.round_time,
+        "move_time": args.move_time,
+        "engine": args.engine,
+        "bot": args.bot,
+        "seed": rng.getrandbits(32),
+        "max_rounds": args.max_rounds,
+    }))
+
+    loop = asyncio.get_running_loop()
+    state = {}
+    board = chess.Board()
+    applied = 0  # board에 반영한 수 개수
+    seq = 0
+    sent_at = None
+
+    async def act():
+        nonlocal sent_at
+        if args.think:
+            await asyncio.sleep(rng.uniform(0, args.think))
+        if state.get("phase") == "chess":
+            moves = list(board.legal_moves)
+            msg = {"op": "move", "seq": seq, "uci": rng.choice(moves).uci()}
+        else:
+            hands = [h for h in ("basic", "special") if state.get(h)]
+            hand = rng.choice(hands)
+            msg = {"op": "card", "seq": seq, "hand": hand, "index": rng.randrange(len(state[hand])), "dir": rng.choice([-1, 1])}
+        sent_at = loop.time()
+        writer.write(encode(msg))
+        await writer.drain()
+
+    try:
+        while True:
+            line = await reader.readline()
+            if not line:
+                break
+            stats.messages += 1
+            stats.bytes += len(line)
+            if sent_at is not None:
+                stats.latencies.append(loop.time() - sent_at)
+                sent_at = None
+
+            msg = json.loads(line)
+            if msg["op"] == "error":
+                stats.errors += 1
+                if state.get("waiting"):
+                    await act()  # 거절됨 → 다시 시도
+                continue
+
+            seq = msg["seq"]
+            apply_delta(state, msg["d"])
+            if state.get("phase") == "over":
+                outcome = state.get("winner") or ("draw" if state.get("game_over") else "round_limit")
+                stats.outcomes[outcome] = stats.outcomes.get(outcome, 0) + 1
+                stats.finished += 1
+                return
+
+            moves = state.get("moves", [])
+            if "root" in msg["d"] or len(moves) < applied:
+                board = chess.Board(state["root"])
+                applied = 0
+            for uci in moves[applied:]:
+                board.push_uci(uci)
+            applied = len(moves)
+
+            waiting = state.get("waiting")
+            if waiting == "move" and state.get("turn") == "white" and not board.is_game_over():
+                await act()
+            elif waiting == "card":
+                await act()
+        stats.failed += 1
+    except (ConnectionError, ValueError):
+        stats.failed += 1
+    finally:
+        writer.close()
+
+
+async def run_load_test(args):
+    stats = LoadStats()
+    start = time.perf_counter()
+
+    async def launch(i):
+        await asyncio.sleep(i * args.ramp / max(1, args.sessions))  # 접속 분산
+        await play_session(i, args, stats)
+
+    results = await asyncio.gather(*(launch(i) for i in range(args.sessions)), return_exceptions=True)
+    stats.failed += sum(1 for r in results if isinstance(r, BaseException))
+    return stats, time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="match_server 부하 테스트 (세션 수백 개 시뮬레이션)")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--unix", default=None)
+    parser.add_argument("--sessions", type=int, default=200)
+    parser.add_argument("--ramp", type=float, default=1.0, help="전체 세션 접속에 걸리는 시간(초)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--engine", choices=("random", "stockfish"), default="random")
+    parser.add_argument("--bot", default="chase", help="서버 쪽 복싱 P2 봇")
+    parser.add_argument("--round-time", type=float, default=3.0)
+    parser.add_argument("--move-time", type=float, default=1.0)
+    parser.add_argument("--max-rounds", type=int, default=3)
+    parser.add_argument("--think", type=float, default=0.05, help="클라이언트 고민 시간 상한(초)")
+    args = parser.parse_args()
+
+    stats, elapsed = asyncio.run(run_load_test(args))
+    lat = stats.latencies
+    print(
+        f"{args.sessions}세션 / {elapsed:.1f}s: 완료 {stats.finished} / 실패 {stats.failed} "
+        f"/ 서버 error {stats.errors}"
+    )
+    print(f"결과: {stats.outcomes}")
+    print(
+        f"수신 {stats.messages}개 ({stats.bytes / 1024:.0f} KiB, {stats.messages / elapsed:.0f} msg/s) "
+        f"응답 p50 {percentile(lat, 0.5) * 1000:.1f}ms / p95 {percentile(lat, 0.95) * 1000:.1f}ms "
+        f"/ p99 {percentile(lat, 0.99) * 1000:.1f}ms"
+    )
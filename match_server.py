@@ -0,0 +1,503 @@
+# match_server.py
+"""
+asyncio 매치 서버: 프로세스 하나에서 여러 체스복싱 매치를 동시에 진행.
+
+클라이언트 = 사람 자리(체스 white / 복싱 P1), 서버가 AI 자리(체스 black / 복싱 P2)를 맡는다.
+매치 하나 = 코루틴 하나 (체스 라운드 → 복싱 라운드 → ... 상태 머신).
+규칙/디버프/라운드 진행은 ChessBoxingManager, 복싱은 BoxingGame을 그대로 쓴다.
+
+프로토콜: 줄 단위 JSON (UTF-8, '\\n' 구분)
+  클라이언트 → 서버
+    {"op": "new", "round_time": 40, "move_time": 5, "engine": "random"|"stockfish",
+     "bot": "chase", "seed": 1, "max_rounds": 50}          (연결 후 첫 메시지)
+    {"op": "move", "seq": n, "uci": "e2e4"}                  (체스, waiting == "move")
+    {"op": "card", "seq": n, "hand": "basic"|"special", "index": 0, "dir": -1|1}
+                                                             (복싱, waiting == "card")
+    {"op": "quit"}
+    seq = 보고 응답하는 state의 seq. 그 뒤로 서버가 새로 입력을 기다리기 시작했다면
+    (라운드 시간 초과 등) 지난 입력으로 보고 조용히 버린다.
+  서버 → 클라이언트
+    {"op": "state", "seq": n, "d": {...}}  직전 state 대비 바뀐 키만 (첫 메시지는 전체)
+       - "moves+": [uci, ...]  체스 수순은 늘어난 수만
+       - "-": [key, ...]       없어진 키
+    {"op": "error", "msg": "..."}
+  phase가 "over"인 state를 보낸 뒤 서버가 연결을 닫는다.
+
+예) python match_server.py --port 8765 --engines 4
+    python match_client.py --port 8765 --sessions 300
+"""
+import argparse
+import asyncio
+import json
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import chess
+
+from box2 import BoxingGame
+from box_runner import BOTS
+from chess_history import TrackedBoard
+from chess_runner import RandomMover
+import engine_profile
+from main import ChessBoxingManager
+
+_MISSING = object()
+
+
+def encode(msg):
+    return (json.dumps(msg, ensure_ascii=False, separators=(",", ":")) + "\n").encode()
+
+
+# ---------------------------
+# 델타 인코딩
+# ---------------------------
+def diff_state(old, new):
+    """old → new 변경분. moves는 앞부분이 같으면 늘어난 수만 보낸다"""
+    delta = {}
+    for key, value in new.items():
+        prev = old.get(key, _MISSING)
+        if prev == value:
+            continue
+        if key == "moves" and prev is not _MISSING and value[:len(prev)] == prev:
+            delta["moves+"] = value[len(prev):]
+        else:
+            delta[key] = value
+    removed = [key for key in old if key not in new]
+    if removed:
+        delta["-"] = removed
+    return delta
+
+
+def apply_delta(state, delta):
+    """클라이언트 쪽: diff_state 결과를 state에 반영"""
+    for key, value in delta.items():
+        if key == "moves+":
+            state["moves"] = state.get("moves", []) + value
+        elif key == "-":
+            for k in value:
+                state.pop(k, None)
+        else:
+            state[key] = value
+    return state
+
+
+# ---------------------------
+# 엔진
+# ---------------------------
+class RandomEngine:
+    """랜덤 수 (즉시 계산, 스레드 불필요)"""
+
+    async def best_move(self, fen):
+        mover = RandomMover()
+        mover.set_fen_position(fen)
+        return mover.get_best_move()
+
+    def close(self):
+        pass
+
+
+class EnginePool:
+    """
+    Stockfish size개를 세션들이 나눠 쓰는 풀.
+    - 엔진은 필요할 때 하나씩 생성, 탐색은 전용 스레드에서 → 이벤트 루프는 막히지 않음
+    - 세션이 시간 초과로 기다림을 포기해도 탐색이 실제로 끝난 뒤에야 엔진을 반납
+    """
+
+    def __init__(self, size):
+        self.size = size
+        self.executor = ThreadPoolExecutor(max_workers=size, thread_name_prefix="engine")
+        self.idle = []
+        self.waiters = []
+        self.engines = []
+        self.creating = 0
+
+    async def _acquire(self):
+        if self.idle:
+            return self.idle.pop()
+        loop = asyncio.get_running_loop()
+        waiter = loop.create_future()
+        self.waiters.append(waiter)
+        if len(self.engines) + self.creating < self.size:
+            from ChessGame import ChessGUI
+            self.creating += 1
+            future = loop.run_in_executor(self.executor, ChessGUI.create_engine, "batch")
+            future.add_done_callback(self._created)
+        return await waiter
+
+    def _created(self, future):
+        self.creating -= 1
+        if future.exception() is not None:
+            for waiter in self.waiters:
+                if not waiter.done():
+                    waiter.set_exception(future.exception())
+                    self.waiters.remove(waiter)
+                    break
+            return
+        engine = future.result()
+        self.engines.append(engine)
+        self._release(engine)
+
+    def _release(self, engine):
+        while self.waiters:
+            waiter = self.waiters.pop(0)
+            if not waiter.done():
+                waiter.set_result(engine)
+                return
+        self.idle.append(engine)
+
+    @staticmethod
+    def _think(engine, fen):
+        engine.set_fen_position(fen)
+        return engine.get_best_move()
+
+    async def best_move(self, fen):
+        engine = await self._acquire()
+        loop = asyncio.get_running_loop()
+        future = loop.run_in_executor(self.executor, self._think, engine, fen)
+        future.add_done_callback(lambda _: self._release(engine))
+        return await asyncio.shield(future)
+
+    def close(self):
+        self.executor.shutdown(wait=True)
+        for engine in self.engines:
+            engine.send_quit_command()
+
+
+# ---------------------------
+# 매치 세션
+# ---------------------------
+class MatchSession:
+    """클라이언트 하나와의 매치 전체 (코루틴 상태 머신)"""
+
+    def __init__(self, server, reader, writer, settings):
+        self.server = server
+        self.reader = reader
+        self.writer = writer
+        self.engine = server.engine(settings.get("engine", "random"))
+        self.bot_name = settings.get("bot", "chase")
+        if self.bot_name not in BOTS:
+            raise ValueError(f"알 수 없는 봇: {self.bot_name}")
+        self.max_turns = int(settings.get("max_turns", 200))
+        self.manager = ChessBoxingManager(
+            chess_round_time=float(settings.get("round_time", 40.0)),
+            chess_move_time=float(settings.get("move_time", 5.0)),
+            max_rounds=settings.get("max_rounds"),
+            rng=random.Random(settings.get("seed")),
+            log=server.log_match,
+        )
+        self.inbox = asyncio.Queue()
+        self.view = {}  # 지금 상태 (plain data)
+        self.sent = {}  # 클라이언트가 알고 있는 상태
+        self.seq = 0
+
+    # ---- 입출력 ----
+    async def read_loop(self):
+        try:
+            while True:
+                line = await self.reader.readline()
+                if not line:
+                    break
+                try:
+                    msg = json.loads(line)
+                except ValueError:
+                    await self.send({"op": "error", "msg": "JSON 형식 오류"})
+                    continue
+                if not isinstance(msg, dict) or not isinstance(msg.get("seq", 0), int):
+                    await self.send({"op": "error", "msg": "메시지는 op를 가진 JSON 객체여야 합니다 (seq는 정수)"})
+                    continue
+                if msg.get("op") == "quit":
+                    break
+                self.inbox.put_nowait(msg)
+        finally:
+            self.inbox.put_nowait(None)
+
+    async def send(self, msg):
+        data = encode(msg)
+        self.writer.write(data)
+        self.server.stats["messages"] += 1
+        self.server.stats["bytes"] += len(data)
+        await self.writer.drain()
+
+    async def push(self, **changes):
+        """view를 갱신하고 바뀐 부분만 전송"""
+        self.view.update(changes)
+        delta = diff_state(self.sent, self.view)
+        if not delta:
+            return
+        self.seq += 1
+        self.sent = dict(self.view)
+        await self.send({"op": "state", "seq": self.seq, "d": delta})
+
+    async def recv(self, op, timeout=None):
+        """op 메시지를 기다린다. 다른 op은 에러 응답 후 무시. 연결이 끊기면 ConnectionError"""
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+        wait_seq = self.seq
+        while True:
+            remaining = None if deadline is None else deadline - loop.time()
+            if remaining is not None and remaining <= 0:
+                raise asyncio.TimeoutError
+            msg = await asyncio.wait_for(self.inbox.get(), remaining)
+            if msg is None:
+                raise ConnectionError("클라이언트 연결 종료")
+            if msg.get("seq", wait_seq) < wait_seq:
+                continue  # 이전 state에 대한 응답
+            if msg.get("op") == op:
+                return msg
+            await self.send({"op": "error", "msg": f"지금은 {op} 차례입니다"})
+
+    # ---- 체스 라운드 ----
+    async def chess_round(self):
+        """ChessGUI와 같은 규칙의 체스 라운드. ChessGUI.run과 같은 결과 dict"""
+        m = self.manager
+        loop = asyncio.get_running_loop()
+        board = m.current_board if m.current_board is not None else TrackedBoard()
+        debuff = m.next_chess_debuff
+        human_limit = m.chess_move_time * debuff.get("move_time_factor", 1.0)
+        if human_limit <= 0:
+            human_limit = 0.1
+        ai_limit = m.chess_move_time
+        round_deadline = loop.time() + m.chess_round_time * debuff.get("round_time_factor", 1.0)
+
+        def finish(game_over, result, winner):
+            return {"game_over": game_over, "result": result, "winner": winner, "board": board}
+
+        await self.push(phase="chess", round=m.round_index, debuff=debuff,
+                        root=board.history.root_fen, moves=[mv.uci() for mv in board.history])
+        move_deadline = None  # 이번 수의 마감 (불법 수로 다시 받을 때도 그대로)
+        while True:
+            if board.is_game_over():
+                outcome = board.outcome()
+                winner = {True: "white", False: "black"}.get(outcome.winner)
+                return finish(True, "checkmate_or_draw", winner)
+
+            human = board.turn == chess.WHITE
+            now = loop.time()
+            if move_deadline is None:
+                move_deadline = now + (human_limit if human else ai_limit)
+            move_left = move_deadline - now
+            round_left = round_deadline - now
+            await self.push(turn="white" if human else "black", waiting="move" if human else None,
+                            move_left=round(move_left, 2), round_left=round(round_left, 2))
+            try:
+                if human:
+                    uci = (await self.recv("move", min(move_left, round_left))).get("uci", "")
+                else:
+                    uci = await asyncio.wait_for(self.engine.best_move(board.fen()), min(move_left, round_left))
+            except asyncio.TimeoutError:
+                # ChessGUI처럼 수당 시간 초과가 라운드 시간 초과보다 먼저
+                if move_deadline <= round_deadline:
+                    if human:
+                        return finish(True, "timeout_white", "black")
+                    return finish(True, "timeout_black", "white")
+                return finish(False, "round_timeout", None)
+
+            try:
+                move = chess.Move.from_uci(uci) if uci else None
+            except ValueError:
+                move = None
+            if move is None or move not in board.legal_moves:
+                if human:
+                    await self.send({"op": "error", "msg": f"불법 수: {uci}"})
+                    continue
+                # 엔진이 수를 못 냄 → ChessGUI에선 수당 시간이 다 흐른 뒤 패배
+                return finish(True, "timeout_black", "white")
+            board.push(move)
+            move_deadline = None
+            await self.push(moves=self.view["moves"] + [move.uci()], waiting=None)
+
+    # ---- 복싱 라운드 ----
+    def boxing_view(self, game, message):
+        p1, p2 = game.p1, game.p2
+        return {
+            "turn": game.turn,
+            "p1_hp": p1.hp,
+            "p2_hp": p2.hp,
+            "p1_x": p1.x,
+            "p2_x": p2.x,
+            "basic": [c.name for c in p1.basic_cards],
+            "special": [c.name for c in p1.special_cards],
+            "fixed": bool(p1.cc.fixed),
+            "message": message,
+        }
+
+    async def boxing_round(self):
+        """BoxingGUI.process_turn_if_ready와 같은 순서로 한 판. BoxingGUI.run과 같은 결과 dict"""
+        rng = self.manager.rng
+        game = BoxingGame(rng)
+        game.setup()
+        game.p2.ai = BOTS[self.bot_name](rng)
+        message = ""
+
+        while not game.game_over and game.turn < self.max_turns:
+            p1 = game.p1
+            fixed = p1.cc.fixed
+            playable = [c for c in p1.basic_cards + p1.special_cards
+                        if not (fixed and BoxingGame.CARDS.is_move[c.cid])]
+            if not playable:
+                # 낼 수 있는 카드가 없으면 (GUI에선 멈춰버리는 상황) AI처럼 임시 Jab
+                card = BoxingGame.Jab()
+                direction = 1 if game.p2.x >= p1.x else -1
+            else:
+                await self.push(phase="boxing", waiting="card", **self.boxing_view(game, message))
+                msg = await self.recv("card")
+
+                hand = p1.basic_cards if msg.get("hand") == "basic" else p1.special_cards
+                idx = msg.get("index")
+                direction = msg.get("dir")
+                if not isinstance(idx, int) or not 0 <= idx < len(hand) or direction not in (-1, 1):
+                    await self.send({"op": "error", "msg": "잘못된 카드/방향"})
+                    continue
+                card = hand[idx]
+                if fixed and BoxingGame.CARDS.is_move[card.cid]:
+                    await self.send({"op": "error", "msg": "이동 불가 상태입니다! (fixed)"})
+                    continue
+                hand.pop(idx)
+
+            act1 = BoxingGame.Action(game.p1, card, direction)
+            ai_card, ai_dir = game.p2.ai.choose(game, game.p2, game.p1)
+            act2 = BoxingGame.Action(game.p2, ai_card, ai_dir)
+            game.p2.use_card(ai_card)
+            game.resolve_turn(act1, act2)
+            message = f"턴 {game.turn} 진행! P1:{card.name} / P2:{ai_card.name}"
+
+        await self.push(phase="boxing", waiting=None, **self.boxing_view(game, message))
+        return {
+            "game_over": game.game_over,
+            "winner": game.winner,
+            "p1_hp": game.p1.hp,
+            "p2_hp": game.p2.hp,
+        }
+
+    # ---- 매치 ----
+    async def run(self):
+        """ChessBoxingManager.main_loop과 같은 순서 (체스 → 복싱 → 디버프 → 다음 라운드)"""
+        m = self.manager
+        while not m.game_over:
+            if m.max_rounds is not None and m.round_index > m.max_rounds:
+                break
+            chess_res = await self.chess_round()
+            m._finish_chess_round(chess_res)
+            m.round_log.append({"round": m.round_index, "chess": chess_res["result"], "debuff": m.next_chess_debuff})
+            await self.push(chess_result=chess_res["result"])
+            if m.game_over:
+                break
+
+            boxing_res = await self.boxing_round()
+            m.round_log[-1]["boxing"] = boxing_res["winner"]
+            m.next_chess_debuff = m.compute_debuff_from_boxing(boxing_res)
+            await self.push(boxing_winner=boxing_res["winner"])
+            m.round_index += 1
+
+        await self.push(phase="over", waiting=None, game_over=m.game_over, winner=m.final_winner)
+
+
+# ---------------------------
+# 서버
+# ---------------------------
+class MatchServer:
+    def __init__(self, engines=2, verbose=False):
+        self.engine_pool_size = engines
+        self.engines = {}
+        self.verbose = verbose
+        self.sessions = set()
+        self.stats = {"sessions": 0, "finished": 0, "dropped": 0, "messages": 0, "bytes": 0}
+
+    def engine(self, kind):
+        engine = self.engines.get(kind)
+        if engine is None:
+            if kind == "random":
+                engine = RandomEngine()
+            elif kind == "stockfish":
+                engine = EnginePool(self.engine_pool_size)
+            else:
+                raise ValueError(f"알 수 없는 엔진: {kind}")
+            self.engines[kind] = engine
+        return engine
+
+    def log_match(self, *args):
+        if self.verbose:
+            print(*args)
+
+    async def handle(self, reader, writer):
+        self.stats["sessions"] += 1
+        reader_task = None
+        try:
+            line = await reader.readline()
+            settings = json.loads(line) if line else {}
+            if not isinstance(settings, dict) or settings.get("op") != "new":
+                writer.write(encode({"op": "error", "msg": "첫 메시지는 new 여야 합니다"}))
+                return
+            try:
+                session = MatchSession(self, reader, writer, settings)
+            except ValueError as e:
+                writer.write(encode({"op": "error", "msg": str(e)}))
+                return
+            self.sessions.add(session)
+            reader_task = asyncio.create_task(session.read_loop())
+            try:
+                await session.run()
+                self.stats["finished"] += 1
+            except (ConnectionError, asyncio.IncompleteReadError):
+                self.stats["dropped"] += 1
+            finally:
+                self.sessions.discard(session)
+                session.manager.close()  # 매니저마다 만드는 preload 스레드 정리
+        except ValueError:
+            writer.write(encode({"op": "error", "msg": "JSON 형식 오류"}))
+        finally:
+            if reader_task is not None:
+                reader_task.cancel()
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+    async def report(self, interval):
+        start = time.perf_counter()
+        while True:
+            await asyncio.sleep(interval)
+            s = self.stats
+            elapsed = time.perf_counter() - start
+            print(
+                f"[{elapsed:6.0f}s] 진행 {len(self.sessions)} / 완료 {s['finished']} / 끊김 {s['dropped']} "
+                f"| 메시지 {s['messages']} ({s['bytes'] / 1024:.0f} KiB)"
+            )
+
+    async def serve(self, host="127.0.0.1", port=8765, unix=None, report_every=10.0):
+        if unix:
+            server = await asyncio.start_unix_server(self.handle, path=unix, backlog=1024)
+            print(f"매치 서버: unix:{unix}")
+        else:
+            server = await asyncio.start_server(self.handle, host, port, backlog=1024)
+            print(f"매치 서버: {host}:{port}")
+        reporter = asyncio.create_task(self.report(report_every)) if report_every else None
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            if reporter is not None:
+                reporter.cancel()
+            for engine in self.engines.values():
+                engine.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="ChessBoxing asyncio 매치 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--unix", default=None, help="TCP 대신 Unix 소켓 경로")
+    parser.add_argument("--engines", type=int, default=None,
+                        help="Stockfish 풀 크기 (기본: batch 엔진 프로필의 동시 엔진 수, 없으면 2)")
+    parser.add_argument("--report-every", type=float, default=10.0, help="상태 출력 주기(초), 0이면 끔")
+    parser.add_argument("--verbose", action="store_true", help="매치 진행 로그 출력")
+    args = parser.parse_args()
+
+    engines = args.engines or engine_profile.load("batch")["concurrency"] or 2
+    server = MatchServer(engines=engines, verbose=args.verbose)
+    try:
+        asyncio.run(server.serve(args.host, args.port, args.unix, args.report_every))
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,309 @@
+# replay.py
+"""
+매치 리플레이: 기록 + 오프라인 병렬 렌더링.
+
+기록 (ReplayRecorder, ChessBoxingManager(record_replay=True))
+  라운드마다 체스는 시작 FEN + 수순 + 수마다 남은 라운드 시간, 복싱은 시작 상태(snapshot) + 턴별 카드/방향.
+  python main.py --save-replay match.json / python tournament.py --replays replays/
+
+렌더링 (python replay.py replays/*.json --out frames/ [--video])
+  타임라인 = 이벤트(체스 수 하나, 복싱 턴 하나)마다 프레임 한 장. 실제 ChessGUI.draw_board/draw_hud,
+  BoxingGUI.draw_scene을 화면 없는 surface에 그대로 쓴다 (SDL dummy 드라이버).
+  타임라인을 chunk개씩 잘라서 프로세스 풀에 분산. 각 chunk는 자기 시작 이벤트까지 게임 상태만
+  빨리 감고 (체스는 라운드 시작 FEN부터 수를 두고, 복싱은 snapshot부터 턴을 해소) 그 뒤로 한 장씩 그린다.
+  → 60FPS로 게임을 다시 돌리지 않으므로 매치 수백 개 하이라이트도 몇 분.
+  --video면 매치마다 ffmpeg로 PNG → mp4 (이벤트당 1/--fps초).
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import shutil
+import subprocess
+import time
+
+VERSION = 1
+
+
+# ---------------------------
+# 기록
+# ---------------------------
+def board_moves(board):
+    """보드의 전체 수순 (uci 리스트). TrackedBoard면 잘리지 않은 전체 기록"""
+    history = getattr(board, "history", None)
+    moves = history if history is not None else board.move_stack
+    return [move.uci() for move in moves]
+
+
+class ReplayRecorder:
+    """매치 진행 중 라운드별 리플레이 데이터를 모은다 (plain data → JSON)"""
+
+    def __init__(self, round_time, move_time):
+        self.data = {
+            "version": VERSION,
+            "settings": {"round_time": round_time, "move_time": move_time},
+            "rounds": [],
+        }
+
+    def _round(self, index):
+        rounds = self.data["rounds"]
+        if not rounds or rounds[-1]["round"] != index:
+            rounds.append({"round": index})
+        return rounds[-1]
+
+    @staticmethod
+    def mark(board):
+        """체스 라운드 시작 직전 위치 (FEN, 지금까지 수 개수)"""
+        if board is None:
+            import chess
+            return chess.STARTING_FEN, 0
+        return board.fen(), len(board_moves(board))
+
+    def chess_round(self, index, debuff, mark, result):
+        fen, plies = mark
+        self._round(index)["chess"] = {
+            "fen": fen,
+            "debuff": debuff,
+            "moves": board_moves(result["board"])[plies:],
+            "clock": list(result.get("clock", ())),
+            "result": result["result"],
+        }
+
+    def boxing_round(self, index, start, turns, winner):
+        self._round(index)["boxing"] = {
+            "start": start,
+            "turns": [list(turn) for turn in turns],
+            "winner": winner,
+        }
+
+    def save(self, path):
+        tmp = path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(self.data, f, ensure_ascii=False)
+        os.replace(tmp, path)
+
+
+def load(path):
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+    if data.get("version") != VERSION:
+        raise ValueError(f"지원하지 않는 리플레이 버전: {data.get('version')}")
+    return data
+
+
+def timeline(data):
+    """[(라운드 위치, "chess"|"boxing", k)] — k번째 수/턴을 둔 직후 (0은 라운드 시작)"""
+    events = []
+    for pos, r in enumerate(data["rounds"]):
+        if "chess" in r:
+            events += [(pos, "chess", k) for k in range(len(r["chess"]["moves"]) + 1)]
+        if "boxing" in r:
+            events += [(pos, "boxing", k) for k in range(len(r["boxing"]["turns"]) + 1)]
+    return events
+
+
+# ---------------------------
+# 렌더링 (워커 프로세스)
+# ---------------------------
+class OffscreenDisplay:
+    """Scene.attach에 창 대신 넘기는 것 (에셋 캐시만 있으면 된다)"""
+
+    def __init__(self):
+        from scene import AssetCache
+        self.assets = AssetCache()
+
+
+class ReplayRenderer:
+    """리플레이 하나의 이벤트를 한 장씩 그린다. 연속된 이벤트는 한 수/한 턴만 진행"""
+
+    def __init__(self, data, display, canvas):
+        self.data = data
+        self.display = display
+        self.canvas = canvas
+        self.scene = None
+        self.at = None  # (라운드 위치, 종류, k) — 지금 scene 상태
+
+    def _surface(self, size):
+        w, h = size
+        cw, ch = self.canvas.get_size()
+        self.canvas.fill((0, 0, 0))
+        return self.canvas.subsurface(((cw - w) // 2, (ch - h) // 2, w, h))
+
+    def _open(self, pos, kind):
+        from ChessGame import ChessGUI
+        from box_GAME import BoxingGUI
+        from box2 import BoxingGame
+        from chess_history import TrackedBoard
+
+        r = self.data["rounds"][pos]
+        if kind == "chess":
+            rec = r["chess"]
+            settings = self.data["settings"]
+            scene = ChessGUI(
+                round_time=settings["round_time"],
+                move_time=settings["move_time"],
+                debuff=rec["debuff"],
+                board=TrackedBoard(rec["fen"]),
+                engine=False,
+            )
+        else:
+            scene = BoxingGUI(BoxingGame.from_snapshot(r["boxing"]["start"]))
+        scene.attach(self.display, self._surface(scene.SIZE))
+        self.scene = scene
+        self.at = (pos, kind, 0)
+
+    def _advance(self):
+        import chess
+        from box2 import BoxingGame
+
+        pos, kind, k = self.at
+        r = self.data["rounds"][pos]
+        scene = self.scene
+        if kind == "chess":
+            scene.board.push(chess.Move.from_uci(r["chess"]["moves"][k]))
+        else:
+            game = scene.game
+            card1, dir1, card2, dir2 = r["boxing"]["turns"][k]
+            scene.apply_turn(
+                BoxingGame.Action(game.p1, take_card(game.p1, card1), dir1),
+                BoxingGame.Action(game.p2, take_card(game.p2, card2), dir2),
+            )
+        self.at = (pos, kind, k + 1)
+
+    def render(self, event):
+        pos, kind, k = event
+        if self.at is None or self.at[:2] != (pos, kind) or self.at[2] > k:
+            self._open(pos, kind)
+        while self.at[2] < k:
+            self._advance()
+
+        scene = self.scene
+        if kind == "chess":
+            clock = self.data["rounds"][pos]["chess"]["clock"]
+            if k and k <= len(clock):
+                scene.round_timer = clock[k - 1]
+        scene.draw()
+        return self.canvas
+
+
+def take_card(player, name):
+    """손패에서 이름이 같은 카드를 꺼낸다 (손패에 없던 임시 카드면 새로 만든다)"""
+    from box2 import BoxingGame
+    for hand in (player.basic_cards, player.special_cards):
+        for card in hand:
+            if card.name == name:
+                hand.remove(card)
+                return card
+    return getattr(BoxingGame, name)()
+
+
+_DISPLAY = None
+_CANVAS = None
+_REPLAYS = {}
+
+
+def init_worker(canvas_size):
+    global _DISPLAY, _CANVAS
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    # SDL이 SIGTERM/SIGINT를 잡으면 Pool.terminate()가 워커를 못 끝낸다 (예외로 풀이 닫힐 때 멈춤)
+    os.environ["SDL_NO_SIGNAL_HANDLERS"] = "1"
+    import pygame
+    pygame.display.init()
+    pygame.font.init()
+    pygame.display.set_mode((1, 1))  # convert_alpha용 (화면에는 안 그림)
+    _DISPLAY = OffscreenDisplay()
+    _CANVAS = pygame.Surface(canvas_size)
+
+
+def render_chunk(task):
+    """(리플레이 경로, 시작, 끝, 출력 폴더) → 프레임 [시작, 끝)을 PNG로"""
+    import pygame
+
+    path, start, end, out_dir = task
+    data = _REPLAYS.get(path)
+    if data is None:
+        _REPLAYS.clear()  # 워커당 리플레이 하나만 캐시 (대부분 같은 매치의 chunk가 연달아 옴)
+        data = _REPLAYS[path] = load(path)
+    events = timeline(data)
+    renderer = ReplayRenderer(data, _DISPLAY, _CANVAS)
+    for i in range(start, end):
+        frame = renderer.render(events[i])
+        pygame.image.save(frame, os.path.join(out_dir, f"frame_{i:06d}.png"))
+    return path, end - start
+
+
+# ---------------------------
+# 조율 (메인 프로세스)
+# ---------------------------
+def encode_video(frames_dir, out_path, fps):
+    return subprocess.Popen(
+        ["ffmpeg", "-loglevel", "error", "-y", "-framerate", str(fps),
+         "-i", os.path.join(frames_dir, "frame_%06d.png"), "-pix_fmt", "yuv420p", out_path]
+    )
+
+
+def render_replays(paths, out_dir, workers=None, chunk=50, video=False, fps=2, progress=True):
+    """리플레이 여러 개를 프로세스 풀로 렌더링. (프레임 수, 경과 초) 반환"""
+    from main import ChessBoxingManager
+
+    if video and shutil.which("ffmpeg") is None:
+        print("ffmpeg를 찾을 수 없어 PNG만 저장합니다")
+        video = False
+
+    tasks = []
+    remaining = {}  # 경로 -> 남은 chunk 수
+    frames_dirs = {}
+    for path in paths:
+        events = timeline(load(path))
+        name = os.path.splitext(os.path.basename(path))[0]
+        frames_dir = frames_dirs[path] = os.path.join(out_dir, name)
+        os.makedirs(frames_dir, exist_ok=True)
+        starts = range(0, len(events), chunk)
+        tasks += [(path, s, min(s + chunk, len(events)), frames_dir) for s in starts]
+        remaining[path] = len(starts)
+
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    encoders = []
+    frames = 0
+    start = time.perf_counter()
+    with multiprocessing.Pool(
+        workers, initializer=init_worker, initargs=(ChessBoxingManager.DISPLAY_SIZE,)
+    ) as pool:
+        try:
+            for path, n in pool.imap_unordered(render_chunk, tasks):
+                frames += n
+                remaining[path] -= 1
+                if remaining[path]:
+                    continue
+                if video:
+                    encoders.append(encode_video(frames_dirs[path], frames_dirs[path] + ".mp4", fps))
+                if progress:
+                    elapsed = time.perf_counter() - start
+                    print(f"{path} 완료 | 누적 {frames}프레임, {frames / elapsed:.0f} frames/s")
+        except BaseException:
+            # 워커 예외/Ctrl+C → 남은 작업은 버리고 워커를 바로 끝낸다 (init_worker에서 SDL 시그널 처리를 껐으므로)
+            pool.terminate()
+            pool.join()
+            for proc in encoders:
+                proc.kill()
+            raise
+        pool.close()
+        pool.join()
+    for proc in encoders:
+        proc.wait()
+    return frames, time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="매치 리플레이(JSON) → 이미지 시퀀스 / 동영상 (멀티코어)")
+    parser.add_argument("replays", nargs="+", help="리플레이 파일들")
+    parser.add_argument("--out", default="replay_frames", help="출력 폴더 (리플레이마다 하위 폴더)")
+    parser.add_argument("--workers", type=int, default=None, help="기본: 모든 코어")
+    parser.add_argument("--chunk", type=int, default=50, help="워커 작업 하나당 프레임 수")
+    parser.add_argument("--video", action="store_true", help="리플레이마다 ffmpeg로 mp4도 만들기")
+    parser.add_argument("--fps", type=float, default=2.0, help="동영상에서 초당 이벤트(수/턴) 수")
+    args = parser.parse_args()
+
+    frames, elapsed = render_replays(args.replays, args.out, args.workers, args.chunk, args.video, args.fps)
+    print(f"\n리플레이 {len(args.replays)}개, {frames}프레임 / {elapsed:.1f}s "
+          f"({frames / elapsed if elapsed > 0 else 0:.0f} frames/s)")
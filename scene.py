@@ -0,0 +1,483 @@
+# scene.py
+import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import wait
+from contextlib import ExitStack, contextmanager
+
+import pygame
+
+import tracing
+from gameclock import GameClock
+
+
+class AssetCache:
+    """
+    디스플레이 하나가 공유하는 폰트/이미지 캐시.
+    크기별로 따로 들고 있어서 창 크기가 바뀌면 새 크기로 한 번만 다시 래스터화하고 매 프레임 스케일하지 않는다.
+    창을 끌어서 크기를 바꾸는 동안 크기마다 쌓이지 않도록 최근 LIMIT개만 남긴다.
+    """
+    LIMIT = 64
+
+    def __init__(self):
+        self._fonts = OrderedDict()
+        self._images = OrderedDict()
+        self._raw = {}  # prefetch_image로 디코딩만 끝난 이미지 (convert 전)
+
+    def _get(self, cache, key):
+        value = cache.get(key)
+        if value is not None:
+            cache.move_to_end(key)
+        return value
+
+    def _put(self, cache, key, value):
+        cache[key] = value
+        while len(cache) > self.LIMIT:
+            cache.popitem(last=False)
+        return value
+
+    def font(self, name, size, bold=False):
+        key = (name, size, bold)
+        font = self._get(self._fonts, key)
+        if font is None:
+            font = self._put(self._fonts, key, pygame.font.SysFont(name, size, bold=bold))
+        return font
+
+    @staticmethod
+    def _decode(path, size):
+        img = pygame.image.load(path)
+        if size is not None:
+            img = pygame.transform.smoothscale(img, size)
+        return img
+
+    def prefetch_image(self, path, size=None):
+        """
+        디코딩/스케일만 미리 해둔다 (백그라운드 스레드에서 호출 가능).
+        디스플레이 포맷 변환(convert_alpha)은 메인 스레드의 image()에서.
+        """
+        key = (path, size)
+        if key not in self._images and key not in self._raw:
+            self._raw[key] = self._decode(path, size)
+
+    def image(self, path, size=None):
+        """path 이미지를 (size로 스케일해서) 한 번만 로드"""
+        key = (path, size)
+        img = self._get(self._images, key)
+        if img is None:
+            raw = self._raw.pop(key, None)
+            if raw is None:
+                raw = self._decode(path, size)
+            img = self._put(self._images, key, raw.convert_alpha())
+        return img
+
+
+class Scene:
+    """
+    Display 위에서 돌아가는 화면 하나 (체스 라운드, 복싱 라운드 ...).
+    - SIZE   : 이 scene의 기준 영역 크기. 창에 맞게 비율을 유지한 채 확대/축소해서 창 가운데에 배치
+    - attach : 화면에 올라갈 때와 창 크기가 바뀔 때 호출. self.screen은 이 scene 전용 영역(subsurface),
+               self.scale은 기준 크기 대비 배율 → 레이아웃/폰트/이미지는 여기서 그 크기로 다시 만든다
+               (이벤트 좌표도 이 영역의 실제 픽셀 기준)
+    - step   : 고정 시간(STEP초)만큼 시뮬레이션 (타이머 등). 프레임 속도와 무관하게 실제 시간만큼 호출됨
+    - update : 한 프레임 로직 (입력 처리 등). 끝나면 self.result에 결과를 넣는다
+    - draw   : self.screen에 그리기
+    - view   : 화면에 필요한 상태만 담은 불변 스냅샷 (없으면 None → 렌더 스레드 안 씀)
+    - render : view 스냅샷만 보고 self.screen에 그리기 (렌더 스레드에서 호출됨 — scene 상태는 읽지 않는다)
+    - clock  : 이 scene의 GameClock (run 동안). 오래 걸리는 호출은 clock.pause()/resume()으로 따로 계산
+    """
+    SIZE = (0, 0)
+    FPS = 60        # 렌더 프레임 속도 상한
+    STEP = 1 / 120  # 시뮬레이션 스텝 길이(초)
+    CAPTION = ""
+
+    MIN_SCALE = 0.25
+
+    result = None
+    display = None
+    screen = None
+    clock = None
+    scale = 1.0
+
+    @classmethod
+    def preload(cls, assets):
+        """이 scene이 쓰는 폰트/이미지를 미리 캐시에 올린다 (백그라운드 스레드에서 호출됨)"""
+
+    def attach(self, display, surface):
+        self.display = display
+        self.screen = surface
+        self.scale = surface.get_width() / self.SIZE[0] if self.SIZE[0] else 1.0
+
+    def px(self, value):
+        """기준 크기 좌표/길이 → 지금 배율의 픽셀"""
+        return int(round(value * self.scale))
+
+    def step(self, dt):
+        pass
+
+    def update(self, dt, events):
+        pass
+
+    def draw(self):
+        pass
+
+    def view(self):
+        return None
+
+    def render(self, view):
+        pass
+
+
+class SnapshotBuffer:
+    """
+    로직 → 렌더 스냅샷 이중 버퍼.
+    publish는 뒤 슬롯에 쓰고 앞뒤를 바꾼다, 렌더 쪽은 항상 가장 최근에 완성된 스냅샷만 가져간다
+    (렌더가 밀리면 중간 스냅샷은 건너뜀 → 로직은 렌더를 기다리지 않는다).
+    """
+
+    def __init__(self):
+        self._slots = [None, None]
+        self._front = 0
+        self.version = 0
+        self._cond = threading.Condition()
+
+    def publish(self, view):
+        back = 1 - self._front
+        self._slots[back] = view
+        with self._cond:
+            self._front = back
+            self.version += 1
+            self._cond.notify_all()
+
+    def wait_newer(self, version, timeout):
+        """version보다 새 스냅샷 → (version, view). timeout 안에 없으면 (version, None)"""
+        with self._cond:
+            if self.version <= version:
+                self._cond.wait(timeout)
+            if self.version <= version:
+                return version, None
+            return self.version, self._slots[self._front]
+
+    def wake(self):
+        with self._cond:
+            self._cond.notify_all()
+
+
+class Display:
+    """
+    매치 전체에서 하나만 쓰는 pygame 창.
+    - pygame.init / set_mode는 여기서 한 번만 (라운드 전환 시 창을 다시 만들지 않음)
+    - 렌더용 clock(프레임 속도 제한), 폰트/이미지 캐시 공유
+    - 창 크기 조절 가능. 크기가 바뀌면 쌓여 있는 scene마다 영역을 다시 잡고 attach를 다시 불러서
+      새 해상도로 그리게 한다 (프레임마다 화면 전체를 스케일하지 않음)
+    - 게임 시간은 scene마다 GameClock (perf_counter + 고정 스텝) → 프레임이 밀려도 타이머는 정확
+    - run()이 scene을 스택에 올리고, scene 안에서 다시 run()을 부르면 그 위에 쌓인다
+    - capture에 capture.FrameCapture를 넣으면 flip한 프레임을 공유 메모리 링으로 (녹화/스트리밍용)
+      링은 프레임 크기가 고정 → 캡처하는 동안은 창 크기를 잠근다
+    - threaded=True면 scene.view()가 있는 scene은 스레드 셋으로 나눠 돈다 (_run_threaded)
+        로직 스레드: 이벤트 → step/update → view 스냅샷을 SnapshotBuffer에
+        렌더 스레드: 최신 스냅샷을 오프스크린 canvas에 render → 완성되면 앞 프레임에 복사
+        메인 스레드: 이벤트 펌프 + 앞 프레임을 창에 blit + flip (SDL 창은 메인 스레드에서만)
+      → 로직이나 엔진 I/O가 잠깐 막혀도 창은 마지막 프레임으로 계속 flip된다.
+    """
+
+    def __init__(self, size, caption="", threaded=False):
+        pygame.init()
+        self.size = tuple(size)
+        self._capture = None  # FrameCapture (없으면 캡처 안 함)
+        self.screen = pygame.display.set_mode(size, self.mode_flags())
+        pygame.display.set_caption(caption)
+        self.clock = pygame.time.Clock()
+        self.assets = AssetCache()
+        self.stack = []  # [(scene, offset)]
+        self._splash_fonts = None
+        self.threaded = threaded
+        self._locks = ()     # 스레드 모드에서 (로직 락, 렌더 락) — paused()가 둘 다 잡는다
+        self._inbox = ()     # 스레드 모드에서 로직 스레드가 아직 안 가져간 이벤트
+
+    @property
+    def capture(self):
+        return self._capture
+
+    @capture.setter
+    def capture(self, capture):
+        """
+        캡처를 켜면 창 크기 고정 (크기가 바뀐 프레임은 링에 못 넣는다), 끄면 다시 조절 가능.
+        이미 만든 창의 RESIZABLE을 못 끄는 백엔드도 있어서 resize()에서도 원래 크기로 되돌린다.
+        """
+        self._capture = capture
+        self.screen = pygame.display.set_mode(self.size, self.mode_flags())
+        self.resize(self.size)
+
+    def mode_flags(self):
+        return 0 if self._capture is not None else pygame.RESIZABLE
+
+    def flip(self):
+        pygame.display.flip()
+        if self.capture is not None:
+            self.capture.write(self.screen)
+
+    def show_splash(self, title, status=""):
+        """
+        로딩 화면 한 장. pygame 기본 폰트만 써서 시스템 폰트 검색(SysFont) 없이 바로 그린다.
+        (기본 폰트엔 한글이 없으니 영문만)
+        """
+        if self._splash_fonts is None:
+            self._splash_fonts = (pygame.font.Font(None, 64), pygame.font.Font(None, 28))
+        big, small = self._splash_fonts
+        w, h = self.size
+        self.screen.fill((0, 0, 0))
+        text = big.render(title, True, (255, 255, 255))
+        self.screen.blit(text, text.get_rect(center=(w // 2, h // 2 - 20)))
+        if status:
+            text = small.render(status, True, (160, 160, 160))
+            self.screen.blit(text, text.get_rect(center=(w // 2, h // 2 + 30)))
+        self.flip()
+
+    def wait_for(self, futures, title, poll=1 / 30):
+        """futures가 다 끝날 때까지 스플래시를 띄운 채 이벤트 처리 (창이 멈춘 것처럼 보이지 않게)"""
+        futures = [f for f in futures if f is not None]
+        frame = 0
+        while True:
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT:
+                    pygame.quit()
+                    raise SystemExit
+                if event.type == pygame.VIDEORESIZE:
+                    self.resize(event.size)
+            if all(f.done() for f in futures):
+                break
+            self.show_splash(title, "Loading" + "." * (frame % 4))
+            frame += 1
+            wait(futures, timeout=poll)
+        for f in futures:
+            f.result()  # 백그라운드 작업 예외는 여기서 전달
+
+    def place(self, scene):
+        """scene 기준 크기를 비율 유지한 채 창에 맞춘 영역 → (subsurface, offset)"""
+        w, h = scene.SIZE
+        ww, wh = self.size
+        scale = max(min(ww / w, wh / h), scene.MIN_SCALE)
+        sw, sh = min(ww, int(w * scale)), min(wh, int(h * scale))
+        offset = ((ww - sw) // 2, (wh - sh) // 2)
+        return self.screen.subsurface(pygame.Rect(offset, (sw, sh))), offset
+
+    def resize(self, size):
+        """창 크기가 바뀌었을 때: 쌓여 있는 scene 전부 새 영역으로 다시 attach"""
+        if self._capture is not None:
+            size = self.size  # 캡처 중에는 창 크기 고정 (창 관리자가 바꿨어도 되돌림)
+        self.screen = pygame.display.get_surface()
+        if self.screen.get_size() != tuple(size):
+            # 창 surface를 자동으로 안 바꿔주는 백엔드
+            self.screen = pygame.display.set_mode(size, self.mode_flags())
+        self.size = self.screen.get_size()
+        self.screen.fill((0, 0, 0))
+        for i, (scene, _) in enumerate(self.stack):
+            surface, offset = self.place(scene)
+            scene.attach(self, surface)
+            self.stack[i] = (scene, offset)
+
+    def push(self, scene):
+        surface, offset = self.place(scene)
+        self.screen.fill((0, 0, 0))
+        pygame.display.set_caption(scene.CAPTION)
+        # 이전 scene에서 남은 클릭이 새 scene으로 넘어가지 않도록
+        pygame.event.clear((pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP))
+        scene.attach(self, surface)
+        self.stack.append((scene, offset))
+
+    def pop(self):
+        scene, _ = self.stack.pop()
+        if self.stack:
+            pygame.display.set_caption(self.stack[-1][0].CAPTION)
+        return scene
+
+    def _localize(self, events, scene, offset):
+        """마우스 좌표를 scene 영역 기준으로 변환 (영역 밖 마우스 이벤트는 버림)"""
+        w, h = scene.screen.get_size()
+        if (w, h) == self.size:
+            return events
+        out = []
+        for event in events:
+            if hasattr(event, "pos"):
+                x = event.pos[0] - offset[0]
+                y = event.pos[1] - offset[1]
+                if not (0 <= x < w and 0 <= y < h):
+                    continue
+                attrs = dict(event.dict)
+                attrs["pos"] = (x, y)
+                event = pygame.event.Event(event.type, attrs)
+            out.append(event)
+        return out
+
+    @contextmanager
+    def paused(self):
+        """스레드 모드에서 로직/렌더 스레드를 지금 틱이 끝난 자리에 세워 둔다 (scene 상태를 메인 스레드에서 만질 때)"""
+        with ExitStack() as stack:
+            for lock in self._locks:
+                stack.enter_context(lock)
+            yield
+
+    def input_pending(self):
+        """스레드 모드에서 scene이 아직 처리하지 않은 입력이 남았는지 (paused() 안에서 불러야 정확)"""
+        return bool(self._inbox)
+
+    def run(self, scene):
+        """scene을 올리고 result가 나올 때까지 프레임 루프를 돌린 뒤 결과를 반환"""
+        if (
+            self.threaded
+            and not self._locks
+            and threading.current_thread() is threading.main_thread()
+            and scene.view() is not None
+        ):
+            return self._run_threaded(scene)
+        self.push(scene)
+        # 게임 시간은 여기서부터 (이전 scene/로딩 시간은 안 잡힘)
+        clock = scene.clock = GameClock(scene.STEP)
+        try:
+            while True:
+                self.clock.tick(scene.FPS)  # 렌더 속도 제한용 (게임 시간에는 안 씀)
+                with tracing.span("frame", "frame"):
+                    events = pygame.event.get()
+                    for event in events:
+                        if event.type == pygame.VIDEORESIZE:
+                            self.resize(event.size)
+                    events = self._localize(events, scene, self.stack[-1][1])
+                    n = clock.steps()
+                    with tracing.span("step", "frame"):
+                        for _ in range(n):
+                            scene.step(clock.step)
+                            if scene.result is not None:
+                                return scene.result
+                    with tracing.span("update", "frame"):
+                        scene.update(n * clock.step, events)
+                    if scene.result is not None:
+                        return scene.result
+                    with tracing.span("draw", "frame"):
+                        scene.draw()
+                    with tracing.span("flip", "frame"):
+                        self.flip()
+        finally:
+            self.pop()
+
+    def _run_threaded(self, scene):
+        """run()의 스레드 모드 (클래스 설명 참고). 창 크기 변경/창 닫기는 두 스레드를 세우고 메인 스레드에서 처리"""
+        self.push(scene)
+        state = {"error": None, "frame": 0}
+        stop = threading.Event()
+        inbox = deque()  # 메인 → 로직 이벤트
+        snapshots = SnapshotBuffer()
+        logic_lock, render_lock, frame_lock = threading.Lock(), threading.Lock(), threading.Lock()
+        buffers = {}
+
+        def setup_canvas():
+            """scene을 창 영역과 같은 크기의 오프스크린 canvas에 붙이고, 앞 프레임 Surface도 같은 크기로"""
+            area = self.screen.subsurface(pygame.Rect(self.stack[-1][1], scene.screen.get_size()))
+            canvas = pygame.Surface(area.get_size()).convert()
+            buffers["area"], buffers["front"] = area, pygame.Surface(area.get_size()).convert()
+            scene.attach(self, canvas)
+            snapshots.publish(scene.view())
+
+        def guarded(fn):
+            def body():
+                try:
+                    fn()
+                except BaseException as e:  # SystemExit 포함 → 메인 스레드에서 다시 던진다
+                    state["error"] = e
+                    stop.set()
+                    snapshots.wake()
+            return body
+
+        @guarded
+        def logic():
+            period = 1 / scene.FPS if scene.FPS else 0.0  # FPS 0 → 제한 없음 (tick(0)과 같게)
+            next_tick = time.perf_counter()
+            while not stop.is_set():
+                with logic_lock:
+                    if stop.is_set():
+                        return
+                    events = [inbox.popleft() for _ in range(len(inbox))]
+                    n = clock.steps()
+                    with tracing.span("step", "frame"):
+                        for _ in range(n):
+                            scene.step(clock.step)
+                            if scene.result is not None:
+                                break
+                    if scene.result is None:
+                        with tracing.span("update", "frame"):
+                            scene.update(n * clock.step, events)
+                    snapshots.publish(scene.view())
+                if scene.result is not None:
+                    stop.set()
+                    snapshots.wake()
+                    return
+                next_tick = max(next_tick + period, time.perf_counter() - period)
+                time.sleep(max(0.0, next_tick - time.perf_counter()))
+
+        @guarded
+        def render():
+            version = 0
+            while not stop.is_set():
+                version, view = snapshots.wait_newer(version, 0.1)
+                if view is None:
+                    continue
+                with render_lock:
+                    if stop.is_set():
+                        return
+                    with tracing.span("draw", "frame"):
+                        scene.render(view)
+                    with frame_lock:
+                        buffers["front"].blit(scene.screen, (0, 0))
+                        state["frame"] += 1
+
+        clock = scene.clock = GameClock(scene.STEP)
+        self._locks = (logic_lock, render_lock)
+        self._inbox = inbox
+        setup_canvas()
+        workers = [
+            threading.Thread(target=logic, name="scene-logic", daemon=True),
+            threading.Thread(target=render, name="scene-render", daemon=True),
+        ]
+        for worker in workers:
+            worker.start()
+        shown = 0
+        try:
+            while not stop.is_set():
+                self.clock.tick(scene.FPS)
+                with tracing.span("frame", "frame"):
+                    for event in pygame.event.get():
+                        if event.type == pygame.VIDEORESIZE:
+                            with self.paused():
+                                self.resize(event.size)
+                                setup_canvas()
+                        elif event.type == pygame.QUIT:
+                            # scene마다 처리가 다르다 (pygame.quit 후 종료 / 라운드 종료) → 메인 스레드에서 동기 처리
+                            with self.paused():
+                                try:
+                                    scene.update(0.0, [event])
+                                except BaseException:
+                                    stop.set()  # 락을 놓기 전에 → 두 스레드는 더 그리지 않고 끝난다
+                                    raise
+                                if scene.result is not None:
+                                    stop.set()
+                        else:
+                            inbox.extend(self._localize([event], scene, self.stack[-1][1]))
+                    with frame_lock:
+                        if state["frame"] != shown:
+                            shown = state["frame"]
+                            buffers["area"].blit(buffers["front"], (0, 0))
+                    with tracing.span("flip", "frame"):
+                        self.flip()
+            if state["error"] is not None:
+                raise state["error"]
+            return scene.result
+        finally:
+            stop.set()
+            snapshots.wake()
+            for worker in workers:
+                worker.join()
+            self._locks = ()
+            self._inbox = ()
+            self.pop()
+
+    def close(self):
+        pygame.quit()
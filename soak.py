@@ -0,0 +1,383 @@
+# soak.py
+"""
+장시간 소크 테스트: ChessBoxingManager로 라운드 수천 개를 돌리면서 자원이 새는지 본다.
+
+모드
+- headless: 체스는 엔진/봇끼리(HeadlessChessRound), 복싱은 봇끼리. 매치마다 매니저를 새로 만든다 (tournament와 같음)
+- gui     : 실제 ChessGUI / BoxingGUI를 SDL dummy 창에서 돌린다. 사람 자리는 오토파일럿이
+            마우스 클릭 이벤트를 넣는다. 매치마다 매니저 → 창, 엔진, 프리로더 스레드 수명까지 포함
+
+표본 (--sample-every 라운드마다)
+  RSS, 열린 파일 디스크립터, 자식 프로세스, 스레드, 살아 있는 pygame Surface / Font 개수,
+  라운드당 시간 (gui 모드는 프레임당 시간도)
+판정
+  워밍업(--warmup 비율) 이후 표본에서 처음 1/3과 마지막 1/3의 중앙값을 비교하고, 기울기가 양수이면서
+  허용치를 넘으면 "계속 자란다"로 보고 실패 (종료 코드 1). 시간은 처음 대비 배율로 판정.
+  --tracemalloc이면 실패 시 워밍업 이후 가장 많이 늘어난 할당 위치를 함께 출력.
+
+예) python soak.py --mode headless --rounds 5000
+    python soak.py --mode gui --rounds 300 --round-time 0.5
+"""
+import argparse
+import gc
+import json
+import os
+import random
+import statistics
+import sys
+import threading
+import time
+from concurrent.futures import Future
+
+from box_runner import BOTS
+from chess_runner import RandomMover
+
+
+# ---------------------------
+# 측정
+# ---------------------------
+def rss_mb():
+    try:
+        import psutil
+        return psutil.Process().memory_info().rss / (1 << 20)
+    except ImportError:
+        pass
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / (1 << 20)
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+def open_fds():
+    try:
+        return len(os.listdir("/proc/self/fd"))
+    except OSError:
+        pass
+    try:
+        import psutil
+        proc = psutil.Process()
+        return proc.num_handles() if os.name == "nt" else proc.num_fds()
+    except ImportError:
+        return None
+
+
+def child_processes():
+    """이 프로세스의 자식 수 (좀비 포함 — 회수 안 한 것도 새는 것)"""
+    pid = os.getpid()
+    try:
+        entries = os.listdir("/proc")
+    except OSError:
+        try:
+            import psutil
+            return len(psutil.Process().children())
+        except ImportError:
+            return None
+    count = 0
+    for entry in entries:
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/stat") as f:
+                stat = f.read()
+        except OSError:
+            continue
+        # "pid (comm) state ppid ..." — comm에 공백/괄호가 있을 수 있어서 마지막 ')' 기준
+        if int(stat.rsplit(")", 1)[1].split()[1]) == pid:
+            count += 1
+    return count
+
+
+def pygame_objects():
+    """살아 있는 (Surface, Font) 개수. 둘 다 gc 추적 대상이 아니라서 컨테이너들의 참조를 훑는다"""
+    pygame = sys.modules.get("pygame")
+    if pygame is None:
+        return 0, 0
+    surfaces, fonts = set(), set()
+    for obj in gc.get_objects():
+        for ref in gc.get_referents(obj):
+            if isinstance(ref, pygame.Surface):
+                surfaces.add(id(ref))
+            elif isinstance(ref, pygame.font.Font):
+                fonts.add(id(ref))
+    return len(surfaces), len(fonts)
+
+
+def sample(rounds, round_ms, frame_ms):
+    gc.collect()
+    surfaces, fonts = pygame_objects()
+    return {
+        "rounds": rounds,
+        "rss_mb": rss_mb(),
+        "fds": open_fds(),
+        "children": child_processes(),
+        "threads": threading.active_count(),
+        "surfaces": surfaces,
+        "fonts": fonts,
+        "round_ms": round_ms,
+        "frame_ms": frame_ms,
+    }
+
+
+# ---------------------------
+# 판정
+# ---------------------------
+# 지표 -> (절대 허용치, 상대 허용치)
+GROWTH_LIMITS = {
+    "rss_mb": (16.0, 0.10),
+    "fds": (2, 0.0),
+    "children": (0, 0.0),
+    "threads": (0, 0.0),
+    "surfaces": (8, 0.0),
+    "fonts": (2, 0.0),
+}
+# 지표 -> (허용 배율, 최소 차이 ms)
+DRIFT_LIMITS = {
+    "round_ms": (1.5, 2.0),
+    "frame_ms": (1.5, 1.0),
+}
+
+
+def slope(xs, ys):
+    mx, my = statistics.fmean(xs), statistics.fmean(ys)
+    den = sum((x - mx) ** 2 for x in xs)
+    return sum((x - mx) * (y - my) for x, y in zip(xs, ys)) / den if den else 0.0
+
+
+def analyze(samples, warmup=0.2):
+    """지표별 [(이름, 시작, 끝, 최대, 1000라운드당 기울기, 실패 여부, 설명)]"""
+    steady = samples[int(len(samples) * warmup):]
+    rows = []
+    if len(steady) < 3:
+        return rows
+    third = max(1, len(steady) // 3)
+    for name in list(GROWTH_LIMITS) + list(DRIFT_LIMITS):
+        points = [(s["rounds"], s[name]) for s in steady if s.get(name) is not None]
+        if len(points) < 3:
+            continue
+        xs, ys = zip(*points)
+        start = statistics.median(ys[:third])
+        end = statistics.median(ys[-third:])
+        rate = slope(xs, ys) * 1000
+        if name in GROWTH_LIMITS:
+            absolute, relative = GROWTH_LIMITS[name]
+            limit = max(absolute, start * relative)
+            failed = rate > 0 and end - start > limit
+            note = f"+{end - start:.1f} (허용 {limit:.1f})"
+        else:
+            factor, min_diff = DRIFT_LIMITS[name]
+            failed = rate > 0 and end > start * factor and end - start > min_diff
+            note = f"x{end / start if start else 0:.2f} (허용 x{factor})"
+        rows.append((name, start, end, max(ys), rate, failed, note))
+    return rows
+
+
+def format_report(rows, total_rounds, elapsed):
+    lines = [f"소크 {total_rounds}라운드 / {elapsed:.0f}s",
+             f"{'지표':<10}{'시작':>10}{'끝':>10}{'최대':>10}{'/1000R':>10}  판정"]
+    for name, start, end, peak, rate, failed, note in rows:
+        verdict = "FAIL " if failed else "ok   "
+        lines.append(f"{name:<10}{start:10.1f}{end:10.1f}{peak:10.1f}{rate:10.2f}  {verdict}{note}")
+    failed = [r[0] for r in rows if r[5]]
+    lines.append("결과: " + (f"실패 — 계속 자라는 지표: {', '.join(failed)}" if failed else "통과"))
+    return "\n".join(lines)
+
+
+# ---------------------------
+# gui 모드 오토파일럿
+# ---------------------------
+def autopilot_display(rng):
+    """flip할 때마다 맨 위 scene에 사람 대신 클릭 이벤트를 넣는 Display (프레임 시간도 잰다)"""
+    import chess
+    import pygame
+
+    from box2 import BoxingGame
+    from box_GAME import BoxingGUI
+    from ChessGame import ChessGUI
+    from scene import Display
+
+    class AutopilotDisplay(Display):
+        def __init__(self, size, caption="", threaded=False):
+            super().__init__(size, caption, threaded)
+            self.frame_times = []
+            self._last_flip = None
+
+        def click(self, offset, pos):
+            x, y = pos
+            pygame.event.post(pygame.event.Event(
+                pygame.MOUSEBUTTONDOWN, pos=(offset[0] + x, offset[1] + y), button=1
+            ))
+
+        def flip(self):
+            super().flip()
+            now = time.perf_counter()
+            if self._last_flip is not None:
+                self.frame_times.append(now - self._last_flip)
+            self._last_flip = now
+            if not self.stack:
+                return
+            scene, offset = self.stack[-1]
+            # 스레드 모드면 scene 상태를 읽는 동안 로직/렌더 스레드를 세워 둔다.
+            # flip은 메인 스레드라 로직 틱과 박자가 다름 → 지난번 클릭을 scene이 다 처리한 뒤에만 새로 클릭
+            with self.paused():
+                if self.input_pending() or pygame.event.peek(pygame.MOUSEBUTTONDOWN):
+                    return
+                if isinstance(scene, ChessGUI):
+                    self.play_chess(scene, offset)
+                elif isinstance(scene, BoxingGUI):
+                    self.play_boxing(scene, offset)
+
+        def play_chess(self, gui, offset):
+            board = gui.board
+            if not gui.is_human_turn() or board.is_game_over():
+                return
+            # GUI는 프로모션을 항상 퀸으로 → 언더프로모션은 제외
+            moves = [m for m in board.legal_moves if m.promotion in (None, chess.QUEEN)]
+            move = rng.choice(moves)
+            sq = gui.sq_size
+            for square in (move.from_square, move.to_square):
+                col, row = chess.square_file(square), 7 - chess.square_rank(square)
+                self.click(offset, (col * sq + sq // 2, row * sq + sq // 2))
+
+        def play_boxing(self, gui, offset):
+            if gui.game.game_over:
+                self.click(offset, (gui.width // 2, gui.height // 2))
+                return
+            gui.ensure_layout()
+            fixed = gui.game.p1.cc.fixed
+            cards = [rect for _, _, rect, card in gui.card_btns
+                     if not (fixed and card.type == BoxingGame.Type.Move)]
+            if not cards:
+                # 이동 불가 + 손패가 이동 카드뿐 → 사람도 낼 카드가 없음. 창 닫기처럼 라운드 종료
+                pygame.event.post(pygame.event.Event(pygame.QUIT))
+                return
+            self.click(offset, rng.choice(cards).center)
+            self.click(offset, rng.choice(gui.dir_btns)[1].center)
+
+    return AutopilotDisplay
+
+
+# ---------------------------
+# 실행
+# ---------------------------
+def make_manager(args, rng, match):
+    from main import ChessBoxingManager
+
+    if args.mode == "headless":
+        return ChessBoxingManager(
+            chess_round_time=args.round_time,
+            chess_move_time=args.move_time,
+            chess_engines=(RandomMover(rng), RandomMover(rng)),
+            chess_move_cost=args.move_cost,
+            boxing_bots=(BOTS[args.p1](rng), BOTS[args.p2](rng)),
+            max_rounds=args.match_rounds,
+            rng=rng,
+            log=lambda *a: None,
+        )
+
+    manager = ChessBoxingManager(
+        chess_round_time=args.round_time,
+        chess_move_time=args.move_time,
+        max_rounds=args.match_rounds,
+        rng=rng,
+        log=lambda *a: None,
+    )
+    if args.engine == "random":
+        # Stockfish 없이: 엔진 자리에 같은 인터페이스의 랜덤 봇 (매니저의 엔진 준비 경로는 그대로 탄다)
+        engine = Future()
+        engine.set_result(RandomMover(rng))
+        manager._engine_future = engine
+    return manager
+
+
+def run_soak(args):
+    rng = random.Random(args.seed)
+    if args.mode == "gui":
+        os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+        from ChessGame import ChessGUI
+        from box_GAME import BoxingGUI
+        display_cls = autopilot_display(rng)
+        if args.uncapped:
+            ChessGUI.FPS = BoxingGUI.FPS = 0  # tick(0) → 프레임 제한 없음
+
+    if args.tracemalloc:
+        import tracemalloc
+        tracemalloc.start(10)
+    baseline_snapshot = None
+
+    samples = []
+    rounds = 0
+    next_sample = 0
+    window_rounds = 0
+    window_time = 0.0
+    frame_times = []
+    start = time.perf_counter()
+    match = 0
+    while rounds < args.rounds:
+        manager = make_manager(args, rng, match)
+        if args.mode == "gui":
+            display = manager.display = display_cls(manager.DISPLAY_SIZE, "ChessBoxing soak", args.render_thread)
+        t0 = time.perf_counter()
+        manager.main_loop()
+        played = len(manager.round_log)
+        window_time += time.perf_counter() - t0
+        window_rounds += played
+        rounds += played
+        match += 1
+        if args.mode == "gui":
+            frame_times += display.frame_times
+        del manager
+
+        if rounds >= next_sample:
+            round_ms = window_time / window_rounds * 1000 if window_rounds else None
+            frame_ms = statistics.fmean(frame_times) * 1000 if frame_times else None
+            samples.append(sample(rounds, round_ms, frame_ms))
+            window_rounds, window_time, frame_times = 0, 0.0, []
+            next_sample = rounds + args.sample_every
+            if args.progress:
+                s = samples[-1]
+                print(f"[{rounds}/{args.rounds}] rss {s['rss_mb'] or 0:.1f}MB fds {s['fds']} "
+                      f"children {s['children']} threads {s['threads']} surfaces {s['surfaces']} "
+                      f"round {s['round_ms'] or 0:.1f}ms", flush=True)
+            if args.tracemalloc and baseline_snapshot is None and rounds >= args.rounds * args.warmup:
+                baseline_snapshot = tracemalloc.take_snapshot()
+
+    elapsed = time.perf_counter() - start
+    rows = analyze(samples, args.warmup)
+    report = format_report(rows, rounds, elapsed)
+    failed = any(r[5] for r in rows)
+    if failed and baseline_snapshot is not None:
+        stats = tracemalloc.take_snapshot().compare_to(baseline_snapshot, "lineno")
+        report += "\n워밍업 이후 가장 많이 늘어난 할당:\n" + "\n".join(f"  {stat}" for stat in stats[:10])
+    return samples, report, failed
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="ChessBoxingManager 장시간 소크 테스트 (자원 누수 검사)")
+    parser.add_argument("--mode", choices=("headless", "gui"), default="headless")
+    parser.add_argument("--rounds", type=int, default=2000, help="전체 라운드 수")
+    parser.add_argument("--match-rounds", type=int, default=5, help="매치(매니저) 하나당 라운드 상한")
+    parser.add_argument("--sample-every", type=int, default=50, help="N라운드마다 표본")
+    parser.add_argument("--warmup", type=float, default=0.2, help="판정에서 뺄 앞부분 비율")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--round-time", type=float, default=None, help="기본: headless 40초, gui 0.5초")
+    parser.add_argument("--move-time", type=float, default=5.0)
+    parser.add_argument("--move-cost", type=float, default=1.0, help="headless 체스 수마다 가상 고민 시간")
+    parser.add_argument("--p1", choices=sorted(BOTS), default="chase")
+    parser.add_argument("--p2", choices=sorted(BOTS), default="chase")
+    parser.add_argument("--engine", choices=("random", "stockfish"), default="random", help="gui 모드 AI")
+    parser.add_argument("--uncapped", action="store_true", help="gui 모드 프레임 제한 해제")
+    parser.add_argument("--render-thread", action="store_true", help="gui 모드 로직/렌더 스레드 분리 (Display threaded)")
+    parser.add_argument("--tracemalloc", action="store_true", help="실패 시 늘어난 할당 위치 출력")
+    parser.add_argument("--json", default=None, help="표본을 JSON으로 저장")
+    parser.add_argument("--quiet", dest="progress", action="store_false")
+    args = parser.parse_args()
+    if args.round_time is None:
+        args.round_time = 40.0 if args.mode == "headless" else 0.5
+
+    samples, report, failed = run_soak(args)
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({"args": vars(args), "samples": samples}, f, indent=1)
+    print(report)
+    raise SystemExit(1 if failed else 0)
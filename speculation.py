@@ -0,0 +1,178 @@
+# speculation.py
+"""
+사람이 고민하는 동안 AI 응수를 미리 계산해 두는 추측 탐색.
+
+사람 턴이 시작되면 (start)
+  1) 여분 엔진 하나로 얕은 탐색(MultiPV)을 해서 사람이 둘 법한 수 상위 top_n개를 고르고
+  2) 그 수를 둔 포지션마다 본 탐색(메인 엔진과 같은 깊이)을 여분 엔진들에서 병렬로 돌린다
+사람이 수를 두면 (take)
+  - 예측한 수였으면 캐시된 응수를 바로 돌려준다 (아직 계산 중이면 남은 시간만 기다림)
+  - 아니면 None → 메인 엔진으로 평소처럼 탐색
+  - 어느 쪽이든 나머지 추측은 취소 (대기 중 작업은 cancel, 돌고 있는 탐색엔 engine.stop())
+
+적중률과 아낀 응답 시간은 stats() / summary()로 본다.
+
+여분 엔진은 워커 스레드마다 하나씩 engine_factory로 처음 쓸 때 만들고 매치 내내 재사용
+(게임에서는 engine_profile의 speculate 프로필: Threads 1, 해시 작게).
+엔진은 Stockfish 인터페이스(set_fen_position / get_best_move) + stop / reset_stop(chess_engine.SearchStop)이면 되고,
+get_top_moves가 없으면 잡기/체크 수를 먼저 추측한다.
+"""
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import chess
+
+
+class Speculator:
+    def __init__(self, engine_factory, top_n=3, workers=None, rank_depth=4):
+        self.engine_factory = engine_factory
+        self.top_n = top_n
+        self.rank_depth = rank_depth
+        self.executor = ThreadPoolExecutor(max_workers=workers or top_n, thread_name_prefix="speculate")
+        self._local = threading.local()
+        self._engines = []
+
+        self._lock = threading.Lock()
+        self._gen = 0        # start/cancel마다 증가 → 이전 세대 작업은 결과를 버림
+        self._jobs = {}      # 사람 수를 둔 뒤의 FEN -> Future[(응수 uci, 탐색 초)]
+        self._running = {}   # 탐색 중인 엔진 -> FEN (취소 시 stop 보낼 대상)
+        self._active = False  # 이번 사람 턴에 추측을 시작했는지
+
+        # 통계
+        self.hits = 0
+        self.misses = 0
+        self.saved = 0.0      # 아낀 응답 시간(초) 합
+        self.cancelled = 0    # 취소한 추측 탐색 수
+
+    # ---- 워커 쪽 ----
+    def _engine(self):
+        engine = getattr(self._local, "engine", None)
+        if engine is None:
+            engine = self._local.engine = self.engine_factory()
+            with self._lock:
+                self._engines.append(engine)
+        return engine
+
+    def rank_moves(self, engine, board):
+        """사람이 둘 법한 수 상위 top_n개 (얕은 탐색)"""
+        if hasattr(engine, "get_top_moves"):
+            depth = engine.get_depth()
+            engine.set_depth(self.rank_depth)
+            try:
+                engine.set_fen_position(board.fen())
+                top = engine.get_top_moves(self.top_n)
+            finally:
+                engine.set_depth(depth)
+            return [chess.Move.from_uci(t["Move"]) for t in top]
+        moves = sorted(board.legal_moves, key=lambda m: (not board.is_capture(m), not board.gives_check(m)))
+        return moves[: self.top_n]
+
+    def _rank_and_spawn(self, board, gen):
+        if gen != self._gen:
+            return
+        for move in self.rank_moves(self._engine(), board):
+            board.push(move)
+            fen = board.fen()
+            board.pop()
+            with self._lock:
+                if gen != self._gen:
+                    return
+                self._jobs[fen] = self.executor.submit(self._reply, fen, gen)
+
+    def _reply(self, fen, gen):
+        engine = self._engine()
+        with self._lock:
+            if gen != self._gen:
+                return None
+            self._running[engine] = fen
+        start = time.perf_counter()
+        try:
+            engine.set_fen_position(fen)
+            move = engine.get_best_move()
+        finally:
+            with self._lock:
+                del self._running[engine]
+                engine.reset_stop()  # 탐색 없이 끝났으면 (둘 수 없는 포지션) 남은 stop을 버린다
+        return move, time.perf_counter() - start
+
+    # ---- 게임 쪽 ----
+    @property
+    def active(self):
+        return self._active
+
+    def start(self, board):
+        """사람 턴 시작: 추측 탐색 시작 (이전 추측은 취소)"""
+        self.cancel()
+        if board.is_game_over():
+            return
+        self._active = True
+        self.executor.submit(self._rank_and_spawn, board.copy(stack=False), self._gen)
+
+    def cancel(self, keep=None):
+        """남은 추측을 모두 취소 (keep FEN의 탐색만 계속)"""
+        with self._lock:
+            self._gen += 1
+            for fen, future in self._jobs.items():
+                if fen != keep and future.cancel():
+                    self.cancelled += 1
+            self._jobs = {}
+            for engine, fen in self._running.items():
+                if fen == keep:
+                    continue
+                # 진행 중인 탐색을 바로 끝내게 (결과는 버림). 탐색 직전이어도 시작하자마자 끊긴다
+                engine.stop()
+                self.cancelled += 1
+        self._active = False
+
+    def take(self, board):
+        """
+        사람이 수를 둔 직후의 board → 미리 계산한 응수 uci, 없으면 None.
+        어느 쪽이든 나머지 추측은 취소.
+        """
+        if not self._active:
+            return None
+        fen = board.fen()
+        with self._lock:
+            future = self._jobs.get(fen)
+        if future is None or not (future.running() or future.done()):
+            self.cancel()
+            self.misses += 1
+            return None
+
+        self.cancel(keep=fen)
+        start = time.perf_counter()
+        result = future.result()
+        if result is None or result[0] is None:
+            self.misses += 1
+            return None
+        move, think = result
+        self.hits += 1
+        self.saved += max(0.0, think - (time.perf_counter() - start))
+        return move
+
+    # ---- 통계 ----
+    def stats(self):
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+            "saved": self.saved,
+            "cancelled": self.cancelled,
+        }
+
+    def summary(self):
+        s = self.stats()
+        return (
+            f"적중 {s['hits']}/{s['hits'] + s['misses']} ({s['hit_rate']:.0%}), "
+            f"아낀 시간 {s['saved']:.2f}s, 취소 {s['cancelled']}"
+        )
+
+    def close(self):
+        self.cancel()
+        self.executor.shutdown(wait=True)
+        for engine in self._engines:
+            if hasattr(engine, "send_quit_command"):
+                engine.send_quit_command()
+        self._engines = []
@@ -0,0 +1,69 @@
+# startup.py
+"""
+시작 시간 측정.
+
+python main.py --profile-startup   (또는 CHESSBOXING_STARTUP_PROFILE=1)
+  → 첫 라운드 준비가 끝나면 import / 초기화 단계별 시간과 첫 프레임까지 걸린 시간을 출력
+--first-frame-budget MS             (또는 CHESSBOXING_FIRST_FRAME_BUDGET)
+  → 첫 프레임(스플래시)이 이 시간 안에 떴는지 함께 표시
+
+시각은 모두 이 모듈이 import된 시점(main.py 첫 줄) 기준. 인터프리터 자체 기동 시간은 빠져 있으므로
+더 자세한 import 내역은 python -X importtime main.py 로 본다.
+"""
+import os
+import threading
+import time
+
+T0 = time.perf_counter()
+ENABLED = bool(os.environ.get("CHESSBOXING_STARTUP_PROFILE"))
+FIRST_FRAME_BUDGET_MS = float(os.environ.get("CHESSBOXING_FIRST_FRAME_BUDGET", 500))
+
+_phases = []  # (이름, 스레드, 시작, 끝) — T0 기준 초
+_marks = {}   # 이름 -> T0 기준 초 (처음 한 번만)
+
+
+class phase:
+    """with phase("import chess"): ... → 구간 하나 기록"""
+
+    def __init__(self, name):
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter() - T0
+        return self
+
+    def __exit__(self, *exc):
+        _phases.append((self.name, threading.current_thread().name, self.start, time.perf_counter() - T0))
+        return False
+
+
+def mark(name):
+    """시점 하나 기록 (같은 이름은 처음 것만)"""
+    _marks.setdefault(name, time.perf_counter() - T0)
+
+
+def elapsed_ms(name):
+    t = _marks.get(name)
+    return None if t is None else t * 1000
+
+
+def report(budget_ms=None):
+    """단계별 표 + 첫 프레임 예산 판정을 문자열로"""
+    budget_ms = FIRST_FRAME_BUDGET_MS if budget_ms is None else budget_ms
+    lines = [f"{'단계':<34}{'스레드':<14}{'시작':>9}{'소요':>9}"]
+    for name, thread, start, end in sorted(_phases, key=lambda p: p[2]):
+        lines.append(f"{name:<34}{thread:<14}{start * 1000:8.1f}ms{(end - start) * 1000:8.1f}ms")
+    for name, t in sorted(_marks.items(), key=lambda m: m[1]):
+        lines.append(f"@ {name:<32}{'':<14}{t * 1000:8.1f}ms")
+
+    first = elapsed_ms("first_frame")
+    if first is not None:
+        verdict = "OK" if first <= budget_ms else "초과"
+        lines.append(f"첫 프레임 {first:.1f}ms / 예산 {budget_ms:.0f}ms → {verdict}")
+    return "\n".join(lines)
+
+
+def within_budget(budget_ms=None):
+    budget_ms = FIRST_FRAME_BUDGET_MS if budget_ms is None else budget_ms
+    first = elapsed_ms("first_frame")
+    return first is not None and first <= budget_ms
@@ -0,0 +1,70 @@
+# test_chess_history.py
+"""TrackedBoard가 일반 chess.Board와 같은 결과를 내는지 랜덤 게임으로 비교 (python -m pytest -q)"""
+import random
+
+import chess
+import pytest
+
+import checkpoint
+from chess_history import TrackedBoard, zobrist_key
+
+CHECKPOINT_EVERY = 7  # ChessBoxingManager.checkpoint_every 역할
+
+
+def random_move(board, rng):
+    """반복이 자주 나오도록: 대부분 비가역이 아닌 수, 가끔 직전 수를 되돌리는 수"""
+    moves = list(board.legal_moves)
+    quiet = [m for m in moves if not board.is_irreversible(m)]
+    move = rng.choice(quiet if quiet and rng.random() < 0.9 else moves)
+    if len(board.move_stack) >= 2 and rng.random() < 0.6:
+        back = board.move_stack[-2]
+        undo = chess.Move(back.to_square, back.from_square)
+        if undo in moves:
+            move = undo
+    return move
+
+
+def assert_same(tracked, plain):
+    assert tracked.fen() == plain.fen()
+    assert list(tracked.history) == plain.move_stack
+    assert tracked.zobrist == zobrist_key(tracked)
+    for count in (2, 3, 5):
+        assert tracked.is_repetition(count) == plain.is_repetition(count)
+    assert tracked.can_claim_draw() == plain.can_claim_draw()
+    assert tracked.is_game_over() == plain.is_game_over()
+    assert tracked.outcome() == plain.outcome()
+    assert tracked.outcome(claim_draw=True) == plain.outcome(claim_draw=True)
+
+
+@pytest.mark.parametrize("window", [0, 8, 64])
+@pytest.mark.parametrize("seed", range(4))
+def test_random_games_match_plain_board(seed, window):
+    rng = random.Random(f"{seed}:{window}")
+    tracked = TrackedBoard(history_window=window)
+    plain = chess.Board()
+    saved = []  # main._on_chess_ply처럼 전체 수순 길이로 체크포인트를 남긴 ply
+
+    for _ in range(300):
+        if plain.is_game_over():
+            break
+        move = random_move(plain, rng)
+        plain.push(move)
+        tracked.push(move)
+        if rng.random() < 0.15 and len(plain.move_stack) > 2:
+            for _ in range(rng.randint(1, 2)):
+                plain.pop()
+                tracked.pop()
+        assert_same(tracked, plain)
+
+        # move_stack이 잘려도 체크포인트 주기는 전체 수순 기준
+        if len(tracked.history) % CHECKPOINT_EVERY == 0:
+            saved.append((list(plain.move_stack), checkpoint.encode_board(tracked)))
+
+    for moves, data in saved:
+        assert len(moves) % CHECKPOINT_EVERY == 0
+        restored = checkpoint.decode_board(data)
+        assert list(restored.history) == moves
+
+    copy = tracked.copy()
+    assert copy.zobrist == tracked.zobrist
+    assert list(copy.history) == plain.move_stack
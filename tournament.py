@@ -0,0 +1,255 @@
+# tournament.py
+"""
+AI끼리 체스복싱 매치(체스 → 복싱 → 체스 ...)를 통째로 여러 판 돌리는 토너먼트.
+
+- ChessBoxingManager를 헤드리스 모드(chess_engines + boxing_bots)로 매치마다 하나씩 만든다
+- 매치는 프로세스 풀에 분산. 워커마다 체스 엔진은 한 번만 만들어 모든 매치에 재사용
+- 매치 i의 시드는 (seed, i) → 디버프 추첨, 복싱 딜링, 봇, 랜덤 체스 봇이 모두 여기서 나온다
+  (Stockfish는 멀티스레드 탐색이라 수 자체는 완전히 재현되지 않을 수 있음)
+- 결과는 끝나는 대로 --out(JSONL)에 한 줄씩 추가 → 같은 명령으로 다시 돌리면 남은 매치만 진행
+
+예) python tournament.py --matches 1000 --white stockfish --black random --out results.jsonl
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import random
+import time
+
+import engine_profile
+from box_runner import BOTS
+from chess_runner import RandomMover
+from main import ChessBoxingManager
+
+
+CHESS_PLAYERS = ("stockfish", "random")
+DEBUFF_KEYS = ("move_time_factor", "blind_side", "hide_enemy_pieces")
+
+
+# ---------------------------
+# 워커
+# ---------------------------
+_CONFIG = None
+_ENGINE = None
+
+
+def _quiet(*args):
+    pass
+
+
+def _create_engine():
+    from ChessGame import ChessGUI
+    return ChessGUI.create_engine("batch")
+
+
+def init_worker(config):
+    """워커 프로세스 시작 시 한 번: 설정 저장 + (필요하면) Stockfish 생성"""
+    global _CONFIG, _ENGINE
+    _CONFIG = config
+    if "stockfish" in (config["white"], config["black"]):
+        _ENGINE = _create_engine()
+
+
+def chess_player(kind, rng):
+    if kind == "stockfish":
+        return _ENGINE  # 양쪽 다 stockfish여도 같은 엔진 (매 수마다 FEN을 새로 넣으므로 무방)
+    return RandomMover(rng)
+
+
+def play_match(match):
+    """매치 하나를 끝까지 진행하고 결과 레코드(dict)를 반환"""
+    global _ENGINE
+    config = _CONFIG
+    seed = f"{config['seed']}:{match}"
+    rng = random.Random(seed)
+
+    manager = ChessBoxingManager(
+        chess_round_time=config["round_time"],
+        chess_move_time=config["move_time"],
+        chess_engines=(chess_player(config["white"], rng), chess_player(config["black"], rng)),
+        chess_move_cost=config["move_cost"],
+        boxing_bots=(BOTS[config["p1"]](rng), BOTS[config["p2"]](rng)),
+        max_rounds=config["max_rounds"],
+        rng=rng,
+        log=_quiet,
+        record_replay=bool(config.get("replays")),
+    )
+
+    start = time.perf_counter()
+    error = None
+    try:
+        manager.main_loop()
+    except Exception as e:  # 엔진 프로세스가 죽는 등 → 기록만 하고 다음 매치를 위해 엔진 재생성
+        error = f"{type(e).__name__}: {e}"
+        manager.close()
+        if _ENGINE is not None:
+            _ENGINE = _create_engine()
+    elapsed = time.perf_counter() - start
+    if manager.replay is not None:
+        manager.replay.save(os.path.join(config["replays"], f"match_{match:05d}.json"))
+
+    rounds = manager.round_log
+    debuffs = {key: 0 for key in DEBUFF_KEYS}
+    round_timeouts = 0
+    boxing = {"P1": 0, "P2": 0, "draw": 0}
+    for r in rounds:
+        for key in r["debuff"]:
+            debuffs[key] += 1
+        if r["chess"] == "round_timeout":
+            round_timeouts += 1
+        if "boxing" in r:
+            boxing[r["boxing"] or "draw"] += 1
+
+    if error is not None:
+        outcome = "error"
+    elif not manager.game_over:
+        outcome = "round_limit"
+    else:
+        outcome = manager.final_winner or "draw"
+
+    board = manager.current_board
+    return {
+        "match": match,
+        "seed": seed,
+        "outcome": outcome,  # "white" / "black" / "draw" / "round_limit" / "error"
+        "end": rounds[-1]["chess"] if rounds else None,  # 마지막 체스 라운드 결과
+        "rounds": len(rounds),
+        "plies": len(getattr(board, "history", board.move_stack)) if board is not None else 0,
+        "round_timeouts": round_timeouts,
+        "debuffed_rounds": sum(1 for r in rounds if r["debuff"]),
+        "debuffs": debuffs,
+        "boxing": boxing,
+        "elapsed": elapsed,
+        "error": error,
+    }
+
+
+# ---------------------------
+# 집계
+# ---------------------------
+def new_summary():
+    return {
+        "matches": 0,
+        "outcomes": {},
+        "end_reasons": {},
+        "rounds": 0,
+        "plies": 0,
+        "round_timeouts": 0,
+        "debuffed_rounds": 0,
+        "debuffs": {key: 0 for key in DEBUFF_KEYS},
+        "boxing": {"P1": 0, "P2": 0, "draw": 0},
+        "match_time": 0.0,
+    }
+
+
+def record_match(summary, rec):
+    summary["matches"] += 1
+    summary["outcomes"][rec["outcome"]] = summary["outcomes"].get(rec["outcome"], 0) + 1
+    end = str(rec["end"])
+    summary["end_reasons"][end] = summary["end_reasons"].get(end, 0) + 1
+    for key in ("rounds", "plies", "round_timeouts", "debuffed_rounds"):
+        summary[key] += rec[key]
+    for key, n in rec["debuffs"].items():
+        summary["debuffs"][key] += n
+    for key, n in rec["boxing"].items():
+        summary["boxing"][key] += n
+    summary["match_time"] += rec["elapsed"]
+
+
+def load_done(path, summary):
+    """이미 --out에 기록된 매치를 집계에 넣고 번호 집합을 반환"""
+    done = set()
+    if not path or not os.path.exists(path):
+        return done
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            rec = json.loads(line)
+            if rec["match"] not in done:
+                done.add(rec["match"])
+                record_match(summary, rec)
+    return done
+
+
+def run_tournament(config, workers=None, out_path=None, progress=True):
+    """config대로 matches판을 돌리고 (집계, 이번 실행 매치 수, 경과 시간)을 반환"""
+    summary = new_summary()
+    done = load_done(out_path, summary)
+    pending = [m for m in range(config["matches"]) if m not in done]
+
+    out = open(out_path, "a", encoding="utf-8") if out_path else None
+    start = time.perf_counter()
+    played = 0
+    try:
+        with multiprocessing.Pool(workers, initializer=init_worker, initargs=(config,)) as pool:
+            for rec in pool.imap_unordered(play_match, pending):
+                record_match(summary, rec)
+                played += 1
+                if out is not None:
+                    out.write(json.dumps(rec, ensure_ascii=False) + "\n")
+                    out.flush()
+                if progress:
+                    rate = played / (time.perf_counter() - start) * 3600
+                    print(
+                        f"[{summary['matches']}/{config['matches']}] #{rec['match']} "
+                        f"{rec['outcome']} ({rec['end']}) {rec['rounds']}라운드 "
+                        f"{rec['elapsed']:.1f}s | {rate:.0f} matches/h"
+                    )
+    finally:
+        if out is not None:
+            out.close()
+    return summary, played, time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="AI vs AI 체스복싱 토너먼트 (멀티코어)")
+    parser.add_argument("--matches", type=int, default=100)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=None,
+                        help="기본: Stockfish를 쓰면 batch 엔진 프로필의 동시 엔진 수, 아니면 모든 코어")
+    parser.add_argument("--white", choices=CHESS_PLAYERS, default="stockfish", help="사람 자리(P1)")
+    parser.add_argument("--black", choices=CHESS_PLAYERS, default="stockfish", help="AI 자리(P2)")
+    parser.add_argument("--p1", choices=sorted(BOTS), default="chase", help="복싱 P1 봇")
+    parser.add_argument("--p2", choices=sorted(BOTS), default="chase", help="복싱 P2 봇")
+    parser.add_argument("--round-time", type=float, default=40.0)
+    parser.add_argument("--move-time", type=float, default=5.0)
+    parser.add_argument("--move-cost", type=float, default=1.0, help="수마다 차감할 가상 고민 시간(초)")
+    parser.add_argument("--max-rounds", type=int, default=50)
+    parser.add_argument("--out", default=None, help="매치별 결과 JSONL (있으면 이어서 진행)")
+    parser.add_argument("--replays", default=None, help="매치별 리플레이 JSON 폴더 (replay.py로 렌더링)")
+    args = parser.parse_args()
+
+    config = {
+        "matches": args.matches,
+        "seed": args.seed,
+        "white": args.white,
+        "black": args.black,
+        "p1": args.p1,
+        "p2": args.p2,
+        "round_time": args.round_time,
+        "move_time": args.move_time,
+        "move_cost": args.move_cost,
+        "max_rounds": args.max_rounds,
+        "replays": args.replays,
+    }
+    if args.replays:
+        os.makedirs(args.replays, exist_ok=True)
+    workers = args.workers
+    if workers is None and "stockfish" in (args.white, args.black):
+        workers = engine_profile.load("batch")["concurrency"]
+    summary, played, elapsed = run_tournament(config, workers=workers, out_path=args.out)
+
+    n = summary["matches"] or 1
+    rounds = summary["rounds"] or 1
+    print(f"\n{summary['matches']}판 (이번 실행 {played}판, {elapsed:.1f}s, "
+          f"{played / elapsed * 3600 if elapsed > 0 else 0:.0f} matches/h)")
+    print("결과:", summary["outcomes"])
+    print("종료 사유:", summary["end_reasons"])
+    print(f"평균 {summary['rounds'] / n:.1f}라운드 / {summary['plies'] / n:.1f}수, "
+          f"라운드 시간 초과 {summary['round_timeouts']}회")
+    print(f"디버프 라운드 {summary['debuffed_rounds']}/{summary['rounds']} "
+          + ", ".join(f"{k} {v / rounds:.1%}" for k, v in summary["debuffs"].items()))
+    print("복싱:", summary["boxing"])
@@ -0,0 +1,154 @@
+# tracing.py
+"""
+가벼운 구간(span) 트레이싱 → Chrome / Perfetto trace JSON.
+
+CHESSBOXING_TRACE=trace.json python main.py
+  → 종료 시 trace.json 저장 (chrome://tracing 또는 ui.perfetto.dev 에서 열기)
+CHESSBOXING_TRACE_BUFFER=65536
+  → 미리 할당하는 이벤트 수. 넘치면 오래된 것부터 덮어쓴다.
+
+환경변수가 없으면 span()은 아무것도 안 하는 공용 객체를, traced()는 원래 함수를
+그대로 돌려주므로 비활성 상태 비용은 사실상 0.
+"""
+import atexit
+import functools
+import itertools
+import json
+import os
+import threading
+import time
+from array import array
+
+TRACE_PATH = os.environ.get("CHESSBOXING_TRACE")
+ENABLED = bool(TRACE_PATH)
+BUFFER_SIZE = int(os.environ.get("CHESSBOXING_TRACE_BUFFER", 1 << 16))
+
+
+class TraceBuffer:
+    """고정 크기 링 버퍼. 이벤트 하나 = (이름, 카테고리, 스레드, 시작, 길이)"""
+
+    def __init__(self, capacity):
+        self.capacity = capacity
+        self.names = [None] * capacity
+        self.cats = [None] * capacity
+        self.tids = array("Q", bytes(8 * capacity))
+        self.starts = array("d", bytes(8 * capacity))
+        self.durs = array("d", bytes(8 * capacity))
+        self.thread_names = {}
+        self.t0 = time.perf_counter()
+        self._count = itertools.count()  # next()는 GIL 하에서 원자적
+        self.recorded = 0
+
+    def record(self, name, cat, start, end):
+        tid = threading.get_ident()
+        if tid not in self.thread_names:
+            self.thread_names[tid] = threading.current_thread().name
+        n = next(self._count)
+        i = n % self.capacity
+        self.names[i] = name
+        self.cats[i] = cat
+        self.tids[i] = tid
+        self.starts[i] = start
+        self.durs[i] = end - start
+        self.recorded = n + 1
+
+    def events(self):
+        """Chrome trace 이벤트 목록 (오래된 것부터)"""
+        total = self.recorded
+        pid = os.getpid()
+        if total > self.capacity:
+            order = itertools.chain(range(total % self.capacity, self.capacity), range(total % self.capacity))
+        else:
+            order = range(total)
+
+        tid_ids = {tid: k for k, tid in enumerate(self.thread_names, 1)}
+        out = [{"name": "process_name", "ph": "M", "pid": pid, "args": {"name": "ChessBoxing"}}]
+        for tid, name in self.thread_names.items():
+            out.append({"name": "thread_name", "ph": "M", "pid": pid, "tid": tid_ids[tid], "args": {"name": name}})
+        for i in order:
+            out.append({
+                "name": self.names[i],
+                "cat": self.cats[i],
+                "ph": "X",
+                "ts": (self.starts[i] - self.t0) * 1e6,
+                "dur": self.durs[i] * 1e6,
+                "pid": pid,
+                "tid": tid_ids.get(self.tids[i], 0),
+            })
+        return out
+
+    def export(self, path):
+        data = {
+            "traceEvents": self.events(),
+            "displayTimeUnit": "ms",
+            "otherData": {"recorded": self.recorded, "dropped": max(0, self.recorded - self.capacity)},
+        }
+        tmp = path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        os.replace(tmp, path)
+
+
+class _NoSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NO_SPAN = _NoSpan()
+BUFFER = None
+
+if ENABLED:
+    BUFFER = TraceBuffer(BUFFER_SIZE)
+    atexit.register(lambda: BUFFER.export(TRACE_PATH))
+
+    class _Span:
+        __slots__ = ("name", "cat", "start")
+
+        def __init__(self, name, cat):
+            self.name = name
+            self.cat = cat
+
+        def __enter__(self):
+            self.start = time.perf_counter()
+            return self
+
+        def __exit__(self, *exc):
+            BUFFER.record(self.name, self.cat, self.start, time.perf_counter())
+            return False
+
+    def span(name, cat="game"):
+        """with span("frame"): ... → 구간 하나 기록 (중첩 가능)"""
+        return _Span(name, cat)
+
+    def traced(name, cat="game"):
+        """함수 전체를 span으로 감싸는 데코레이터"""
+        def deco(fn):
+            @functools.wraps(fn)
+            def wrapper(*args, **kwargs):
+                start = time.perf_counter()
+                try:
+                    return fn(*args, **kwargs)
+                finally:
+                    BUFFER.record(name, cat, start, time.perf_counter())
+            return wrapper
+        return deco
+
+else:
+    def span(name, cat="game"):
+        return _NO_SPAN
+
+    def traced(name, cat="game"):
+        def deco(fn):
+            return fn
+        return deco
+
+
+def export(path=None):
+    """지금까지의 기록을 저장 (비활성 상태면 아무것도 안 함)"""
+    if BUFFER is not None:
+        BUFFER.export(path or TRACE_PATH)